@@ -14,7 +14,7 @@ import pytest
 
 from tools.applications import change_application_status_tool, list_application_status_tool
 from tools.context import build_system_prompt_fn
-from tools.documents import draft_cover_letter_tool, draft_cv_tool
+from tools.documents import draft_application_pack_tool, draft_cover_letter_tool, draft_cv_tool
 from tools.profile import (
     add_profile_item_tool,
     record_clarification_tool,
@@ -289,6 +289,44 @@ class TestDraftCoverLetterTool:
         assert "temporarily unreachable" in result
 
 
+@pytest.mark.asyncio
+class TestDraftApplicationPackTool:
+    async def test_success_reports_both_versions(self):
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["url"] = str(request.url)
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={
+                "cv_document_id": "doc-1",
+                "cv_version": 3,
+                "cover_letter_document_id": "doc-2",
+                "cover_letter_version": 1,
+            })
+
+        client = _client_with_handler(handler)
+        tool = draft_application_pack_tool(client)
+        result = await tool.handler("user-1", {"job_id": "job-1", "instructions": "focus on Go"})
+
+        assert seen["url"] == "http://backend:8000/internal/documents/draft-application-pack"
+        assert seen["body"] == {"user_id": "user-1", "job_id": "job-1", "instructions": "focus on Go"}
+        assert "Draft CV v3 and cover letter v1 created" in result
+
+    async def test_missing_job_id_returns_error_without_http_call(self):
+        client = _client_with_handler(lambda r: httpx.Response(500))
+        tool = draft_application_pack_tool(client)
+        result = await tool.handler("user-1", {})
+        assert result == "error: 'job_id' is required"
+
+    async def test_no_profile_returns_friendly_message(self):
+        client = _client_with_handler(
+            lambda r: httpx.Response(404, json={"detail": "No profile found yet — the user hasn't uploaded a resume."})
+        )
+        tool = draft_application_pack_tool(client)
+        result = await tool.handler("user-1", {"job_id": "job-1"})
+        assert "hasn't uploaded a resume" in result
+
+
 @pytest.mark.asyncio
 class TestListApplicationStatusTool:
     async def test_success_returns_summary(self):
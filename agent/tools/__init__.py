@@ -11,7 +11,7 @@ import httpx
 from harness_kit.tools.base import Tool
 
 from .applications import change_application_status_tool, list_application_status_tool
-from .documents import draft_cover_letter_tool, draft_cv_tool
+from .documents import draft_application_pack_tool, draft_cover_letter_tool, draft_cv_tool
 from .profile import (
     add_profile_item_tool,
     record_clarification_tool,
@@ -24,6 +24,7 @@ TOOL_NAMES = [
     "record_clarification",
     "draft_cv",
     "draft_cover_letter",
+    "draft_application_pack",
     "list_application_status",
     "change_application_status",
 ]
@@ -36,6 +37,7 @@ def build_tools(client: httpx.AsyncClient) -> list[Tool]:
         record_clarification_tool(client),
         draft_cv_tool(client),
         draft_cover_letter_tool(client),
+        draft_application_pack_tool(client),
         list_application_status_tool(client),
         change_application_status_tool(client),
     ]
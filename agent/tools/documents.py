@@ -131,3 +131,59 @@ def draft_cover_letter_tool(client: httpx.AsyncClient) -> Tool:
         ),
         handler=handler,
     )
+
+
+def draft_application_pack_tool(client: httpx.AsyncClient) -> Tool:
+    async def handler(user_id: str, args: dict[str, Any]) -> str:
+        job_id = args.get("job_id")
+        if not job_id:
+            return "error: 'job_id' is required"
+        instructions = args.get("instructions")
+
+        resp = await post_json(
+            client,
+            "/internal/documents/draft-application-pack",
+            {"user_id": user_id, "job_id": job_id, "instructions": instructions},
+        )
+        if isinstance(resp, str):
+            return resp
+        if resp.status_code == 404:
+            detail = error_detail(resp)
+            return _NO_PROFILE_MESSAGE if "resume" in detail.lower() else _NO_JOB_MESSAGE
+        if resp.status_code == 422:
+            return f"error: {error_detail(resp)}"
+        resp.raise_for_status()
+        body = resp.json()
+        return (
+            f"Draft CV v{body['cv_version']} and cover letter v{body['cover_letter_version']} "
+            "created — they're now in the CV and Cover letter panels on the job page for the "
+            "user to review, edit, and compile."
+        )
+
+    return Tool(
+        definition=ToolDefinition(
+            name="draft_application_pack",
+            description=(
+                "Generate both a tailored CV and a tailored cover letter for a specific job "
+                "in one step (faster than calling draft_cv and draft_cover_letter one after "
+                "the other). Use this when the user wants both documents; use the single "
+                "tools when they only want one. Creates a new version of each document every "
+                "time it's called."
+            ),
+            parameters={
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "The job's id, as shown in the context above (Job posting (id=...)).",
+                    },
+                    "instructions": {
+                        "type": "string",
+                        "description": "Optional emphasis from the user, applied to both documents.",
+                    },
+                },
+                "required": ["job_id"],
+            },
+        ),
+        handler=handler,
+    )
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_db, require_admin
 from app.auth.password import hash_password
 from app.auth.sessions import delete_user_sessions
-from app.db.models import User
+from app.db.models import Document, JobParseCache, User
 from app.files import delete_user_uploads
+from app.llm.telemetry import llm_telemetry
+from app.llm.usage import prompt_cache_stats
+from app.parsing.jobs import parse_cache_counter
+from app.rendercv.cache import discard_sources, get_compile_cache
 from app.schemas import ResetPasswordRequest, UserOut
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -41,8 +46,10 @@ def delete_user(
             raise HTTPException(status_code=400, detail="Cannot delete the last admin")
 
     delete_user_uploads(user_id)
+    source_texts = [row.source_text for row in db.query(Document.source_text).filter_by(user_id=user_id)]
     db.delete(target)
     db.commit()
+    discard_sources(source_texts)
 
 
 @router.post("/users/{user_id}/reset-password")
@@ -94,3 +101,27 @@ def enable_user(
     target.is_active = True
     db.commit()
     return {"ok": True}
+
+
+@router.get("/metrics")
+def get_metrics(
+    request: Request,
+    db: Session = Depends(get_db),
+    _admin: User = Depends(require_admin),
+) -> dict:
+    """Process-local performance counters (reset on restart)."""
+    return {
+        "job_parse_cache": {
+            **parse_cache_counter.summary(),
+            "entries": db.scalar(select(func.count()).select_from(JobParseCache)),
+        },
+        "compile_cache": get_compile_cache().stats(),
+        "compile_pool": request.app.state.compile_pool.stats(),
+        "extraction_pool": request.app.state.extraction_pool.stats(),
+        "precompile": request.app.state.precompiler.stats(),
+        "speculative_tailoring": request.app.state.speculative.stats(),
+        "job_parse_upgrades": request.app.state.parse_upgrader.stats(),
+        "prompt_cache": prompt_cache_stats.summary(),
+        "llm_admission": request.app.state.llm.admission.stats(),
+        "llm": llm_telemetry.summary(),
+    }
@@ -1,20 +1,49 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Response
+import asyncio
+import re
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from llm_kit import LLMClient
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import current_user, get_db
+from app.config import (
+    draft_stream_keepalive_s,
+    draft_stream_precompile_wait_s,
+    rendercv_preview_ppi,
+    rendercv_thumbnail_ppi,
+)
 from app.db.models import Document, Job, Profile, User
 from app.llm.deps import get_llm
-from app.rendercv.compile import CompileError, compile_pdf
-from app.rendercv.service import draft_cover_letter_document, draft_cv_document
+from app.rendercv.batch import BatchItem, stream_compile_zip
+from app.rendercv.cache import artifact_kind, cache_key, discard_sources, pins_current_date
+from app.rendercv.compile import CompileError
+from app.rendercv.deps import get_compile_pool
+from app.rendercv.pool import CompilePool, CompilePoolBusy
+from app.rendercv.precompile import Precompiler, precompile
+from app.rendercv.service import (
+    Progress,
+    draft_application_pack,
+    draft_cover_letter_document,
+    draft_cv_document,
+)
+from app.rendercv.validate import ValidationResult, validate_source
+from app.sse import SSE_HEADERS, event_stream
 from app.schemas import (
+    DocumentCompileBatchRequest,
+    DocumentCompileStatusOut,
     DocumentCompileRequest,
     DocumentDraftRequest,
     DocumentListItemOut,
     DocumentOut,
+    DocumentPackOut,
     DocumentUpdateRequest,
+    DocumentValidateOut,
+    DocumentValidateRequest,
 )
 
 router = APIRouter(prefix="/api/documents", tags=["documents"])
@@ -27,6 +56,13 @@ def _get_job_or_404(db: Session, job_id: str, user_id: str) -> Job:
     return job
 
 
+def _get_profile_or_404(db: Session, user_id: str) -> Profile:
+    profile: Profile | None = db.query(Profile).filter_by(user_id=user_id).first()
+    if profile is None:
+        raise HTTPException(status_code=404, detail="No profile found. Upload a resume first.")
+    return profile
+
+
 def _get_document_or_404(db: Session, document_id: str, user_id: str) -> Document:
     document = db.query(Document).filter_by(id=document_id, user_id=user_id).first()
     if document is None:
@@ -34,6 +70,91 @@ def _get_document_or_404(db: Session, document_id: str, user_id: str) -> Documen
     return document
 
 
+def _archive_name(document: Document) -> str:
+    company = (document.job.parsed or {}).get("company") or "job"
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", company).strip("-").lower() or "job"
+    return f"{slug}-{document.type}-v{document.version}-{document.id[:8]}"
+
+
+# Saved versions never change, so anything derived from one whose render date
+# is pinned can be kept forever; the rest must be revalidated (cheaply — a 304
+# needs only the DB row).
+_IMMUTABLE = "private, max-age=31536000, immutable"
+_REVALIDATE = "private, no-cache"
+
+
+def _cache_headers(source_text: str, kind: str = "pdf") -> dict[str, str]:
+    """``ETag`` and ``Cache-Control`` for an artifact of a saved version. The
+    ETag is the compile-cache key. Only a source that pins
+    ``settings.current_date`` compiles to the same bytes every day, so any
+    other source gets a weak ETag (the key then changes daily, see
+    ``cache_key``) and no ``immutable``."""
+    etag = f'"{cache_key(source_text, kind)}"'
+    if pins_current_date(source_text):
+        return {"ETag": etag, "Cache-Control": _IMMUTABLE}
+    return {"ETag": f"W/{etag}", "Cache-Control": _REVALIDATE}
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """``If-None-Match`` uses weak comparison (RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return opaque in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def _parse_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """Inclusive (start, end) for a single ``bytes=`` range; None means serve
+    the whole body (no header, malformed, or multiple ranges — all allowed
+    by RFC 9110). Raises 416 for a range that starts past the end."""
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+    first, _, last = range_header[len("bytes="):].strip().partition("-")
+    try:
+        if first == "":  # suffix range: the last N bytes
+            length = int(last)
+            if length <= 0:
+                raise ValueError
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise HTTPException(
+            status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"}
+        )
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+async def _await_compile(
+    submit: Callable[[], Future[bytes]], then: Callable[[], object] | None = None
+) -> bytes:
+    """Admit a pool compile and await it, mapping failures to HTTP errors.
+    ``then`` is a best-effort follow-up submission (skipped if the pool is
+    full) queued once the main compile has been admitted."""
+    try:
+        future = submit()
+        if then is not None:
+            try:
+                then()
+            except CompilePoolBusy:
+                pass
+        return await asyncio.wrap_future(future)
+    except CompileError as exc:
+        raise HTTPException(
+            status_code=422, detail={"stage": exc.stage, "errors": exc.errors}
+        ) from exc
+    except CompilePoolBusy as exc:
+        raise HTTPException(
+            status_code=503, detail="Too many compiles in progress — try again in a moment."
+        ) from exc
+
+
 @router.post("/draft", response_model=DocumentOut, status_code=201)
 async def draft_cv(
     body: DocumentDraftRequest,
@@ -42,9 +163,7 @@ async def draft_cv(
     llm: LLMClient = Depends(get_llm),
 ) -> Document:
     job = _get_job_or_404(db, body.job_id, user.id)
-    profile: Profile | None = db.query(Profile).filter_by(user_id=user.id).first()
-    if profile is None:
-        raise HTTPException(status_code=404, detail="No profile found. Upload a resume first.")
+    profile = _get_profile_or_404(db, user.id)
     return await draft_cv_document(db, llm, job, profile, body.instructions)
 
 
@@ -56,12 +175,117 @@ async def draft_cover_letter(
     llm: LLMClient = Depends(get_llm),
 ) -> Document:
     job = _get_job_or_404(db, body.job_id, user.id)
-    profile: Profile | None = db.query(Profile).filter_by(user_id=user.id).first()
-    if profile is None:
-        raise HTTPException(status_code=404, detail="No profile found. Upload a resume first.")
+    profile = _get_profile_or_404(db, user.id)
     return await draft_cover_letter_document(db, llm, job, profile, body.instructions)
 
 
+@router.post("/draft-pack", response_model=DocumentPackOut, status_code=201)
+async def draft_pack(
+    body: DocumentDraftRequest,
+    db: Session = Depends(get_db),
+    user: User = Depends(current_user),
+    llm: LLMClient = Depends(get_llm),
+) -> DocumentPackOut:
+    """CV + cover letter for one job in a single request (see
+    ``draft_application_pack``)."""
+    job = _get_job_or_404(db, body.job_id, user.id)
+    profile = _get_profile_or_404(db, user.id)
+    cv, cover_letter = await draft_application_pack(db, llm, job, profile, body.instructions)
+    return DocumentPackOut(
+        cv=DocumentOut.model_validate(cv), cover_letter=DocumentOut.model_validate(cover_letter)
+    )
+
+
+async def _await_precompiled(
+    precompiler: Precompiler, documents: list[Document], emit: Progress
+) -> None:
+    """Report each new version's background pre-compile outcome, waiting at
+    most ``app.draft_stream.precompile_wait_s`` in total. Skipped when the
+    precompiler isn't running."""
+    wait_s = draft_stream_precompile_wait_s()
+    if not precompiler.running or wait_s <= 0:
+        return
+    deadline = asyncio.get_running_loop().time() + wait_s
+    for document in documents:
+        while True:
+            status = precompiler.status(document.source_text)
+            if status["state"] in ("ready", "failed") or asyncio.get_running_loop().time() >= deadline:
+                break
+            await asyncio.sleep(0.25)
+        emit("precompiled", {"document_type": document.type, "document_id": document.id, **status})
+
+
+def _draft_stream(
+    request: Request, draft: Callable[[Progress], Awaitable[Document | tuple[Document, ...]]]
+) -> StreamingResponse:
+    """SSE wrapper around one draft call: its stages, then ``precompiled``
+    per new version, then ``done`` with the documents (``DocumentOut``)."""
+
+    async def run(emit: Progress) -> dict:
+        result = await draft(emit)
+        documents = list(result) if isinstance(result, tuple) else [result]
+        await _await_precompiled(request.app.state.precompiler, documents, emit)
+        return {
+            d.type: DocumentOut.model_validate(d).model_dump(mode="json") for d in documents
+        }
+
+    return StreamingResponse(
+        event_stream(run, keepalive_s=draft_stream_keepalive_s()),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.post("/draft/stream")
+async def draft_cv_stream(
+    body: DocumentDraftRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    user: User = Depends(current_user),
+    llm: LLMClient = Depends(get_llm),
+) -> StreamingResponse:
+    """``POST /draft`` as Server-Sent Events (stages: tailoring_started,
+    tokens_received, yaml_assembled, persisted, precompiled, then done or
+    error). 404s are still plain HTTP errors, raised before the stream
+    opens."""
+    job = _get_job_or_404(db, body.job_id, user.id)
+    profile = _get_profile_or_404(db, user.id)
+    return _draft_stream(
+        request, lambda emit: draft_cv_document(db, llm, job, profile, body.instructions, emit)
+    )
+
+
+@router.post("/draft-cover-letter/stream")
+async def draft_cover_letter_stream(
+    body: DocumentDraftRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    user: User = Depends(current_user),
+    llm: LLMClient = Depends(get_llm),
+) -> StreamingResponse:
+    job = _get_job_or_404(db, body.job_id, user.id)
+    profile = _get_profile_or_404(db, user.id)
+    return _draft_stream(
+        request,
+        lambda emit: draft_cover_letter_document(db, llm, job, profile, body.instructions, emit),
+    )
+
+
+@router.post("/draft-pack/stream")
+async def draft_pack_stream(
+    body: DocumentDraftRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    user: User = Depends(current_user),
+    llm: LLMClient = Depends(get_llm),
+) -> StreamingResponse:
+    job = _get_job_or_404(db, body.job_id, user.id)
+    profile = _get_profile_or_404(db, user.id)
+    return _draft_stream(
+        request, lambda emit: draft_application_pack(db, llm, job, profile, body.instructions, emit)
+    )
+
+
 @router.get("", response_model=list[DocumentListItemOut])
 def list_documents(
     job_id: str,
@@ -94,7 +318,8 @@ def save_document(
 ) -> Document:
     """Creates a new version row rather than mutating in place — see Document's
     docstring: versions are append-only so a finalized application (M7) can
-    snapshot the exact document that was submitted even after later edits."""
+    snapshot the exact document that was submitted even after later edits.
+    The new version is queued for background pre-compile."""
     existing = _get_document_or_404(db, document_id, user.id)
     new_version = Document(
         user_id=existing.user_id,
@@ -106,6 +331,7 @@ def save_document(
     db.add(new_version)
     db.commit()
     db.refresh(new_version)
+    precompile(new_version.source_text)
     return new_version
 
 
@@ -114,22 +340,160 @@ def delete_document(
     document_id: str, db: Session = Depends(get_db), user: User = Depends(current_user)
 ) -> None:
     document = _get_document_or_404(db, document_id, user.id)
+    source_text = document.source_text
     db.delete(document)
     db.commit()
+    discard_sources([source_text])
 
 
 @router.post("/compile")
-def compile_document(
-    body: DocumentCompileRequest, _user: User = Depends(current_user)
+async def compile_document(
+    body: DocumentCompileRequest,
+    _user: User = Depends(current_user),
+    pool: CompilePool = Depends(get_compile_pool),
 ) -> Response:
     """Stateless compile-preview: takes source text directly (not a document id),
     so it covers both previewing unsaved editor changes and viewing a saved
-    version — the frontend always has the source text in hand either way. No
-    PDF is ever persisted (see Document's docstring)."""
-    try:
-        pdf_bytes = compile_pdf(body.source_text)
-    except CompileError as exc:
-        raise HTTPException(
-            status_code=422, detail={"stage": exc.stage, "errors": exc.errors}
-        ) from exc
+    version — the frontend always has the source text in hand either way.
+    Runs on the dedicated compile pool (never the shared threadpool) behind
+    the content-addressed compile cache, so re-opening a version that was
+    already previewed skips Typst entirely."""
+    pdf_bytes = await _await_compile(lambda: pool.submit(body.source_text))
     return Response(content=pdf_bytes, media_type="application/pdf")
+
+
+@router.post("/preview")
+async def preview_document(
+    body: DocumentCompileRequest,
+    _user: User = Depends(current_user),
+    pool: CompilePool = Depends(get_compile_pool),
+) -> Response:
+    """Progressive preview: returns a low-res PNG of the first page, and
+    queues the full PDF compile right behind it so the follow-up
+    ``/compile`` call is a cache hit (or joins the compile still running)."""
+    preview = await _await_compile(
+        lambda: pool.submit(body.source_text, "png", rendercv_preview_ppi()),
+        then=lambda: pool.submit(body.source_text),
+    )
+    return Response(content=preview, media_type="image/png")
+
+
+@router.get("/{document_id}/status", response_model=DocumentCompileStatusOut)
+def get_document_compile_status(
+    document_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    user: User = Depends(current_user),
+) -> dict:
+    """Whether this version's PDF is already compiled (so a preview will be
+    instant), still queued/compiling in the background, or failed — with the
+    compile stage/errors, so the UI can flag a broken draft up front."""
+    document = _get_document_or_404(db, document_id, user.id)
+    return {"document_id": document.id, **request.app.state.precompiler.status(document.source_text)}
+
+
+@router.get("/{document_id}/pdf")
+async def get_document_pdf(
+    document_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    user: User = Depends(current_user),
+    pool: CompilePool = Depends(get_compile_pool),
+) -> Response:
+    """The compiled PDF of one saved version, cacheable by the browser.
+    Versions are append-only, so for a source that pins its render date the
+    strong ETag (the compile-cache key: a hash of the source text + rendercv
+    version) never changes for a given id; other sources get a weak, daily
+    ETag (see ``_cache_headers``). Either way a revalidation is answered 304
+    from the DB row alone, without compiling. Supports single byte ranges
+    (PDF viewers fetch incrementally) and ``If-Range``, which needs the
+    strong ETag. ``private``: the PDF is per-user data."""
+    document = _get_document_or_404(db, document_id, user.id)
+    headers = {
+        **_cache_headers(document.source_text),
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'inline; filename="{_archive_name(document)}.pdf"',
+    }
+    etag = headers["ETag"]
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    pdf_bytes = await _await_compile(lambda: pool.submit(document.source_text))
+    if_range = request.headers.get("if-range")
+    byte_range = None
+    # If-Range uses strong comparison: a weak ETag never matches it.
+    if if_range is None or (if_range == etag and not etag.startswith("W/")):
+        byte_range = _parse_range(request.headers.get("range"), len(pdf_bytes))
+    if byte_range is None:
+        return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{len(pdf_bytes)}"
+    return Response(
+        content=pdf_bytes[start : end + 1],
+        status_code=206,
+        media_type="application/pdf",
+        headers=headers,
+    )
+
+
+@router.get("/{document_id}/thumbnail")
+async def get_document_thumbnail(
+    document_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    user: User = Depends(current_user),
+    pool: CompilePool = Depends(get_compile_pool),
+) -> Response:
+    """First-page thumbnail for version lists. Versions are append-only, so a
+    thumbnail of a source that pins its render date never changes: it is
+    cached by content hash, the browser may keep it indefinitely, and
+    revalidation is a 304 without rendering (see ``_cache_headers``)."""
+    document = _get_document_or_404(db, document_id, user.id)
+    headers = _cache_headers(document.source_text, artifact_kind("png", rendercv_thumbnail_ppi()))
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    thumbnail = await _await_compile(
+        lambda: pool.submit(document.source_text, "png", rendercv_thumbnail_ppi())
+    )
+    return Response(content=thumbnail, media_type="image/png", headers=headers)
+
+
+@router.post("/validate", response_model=DocumentValidateOut)
+def validate_document(
+    body: DocumentValidateRequest, _user: User = Depends(current_user)
+) -> ValidationResult:
+    """Lint-only check for the editor: YAML parse + RenderCV schema validation,
+    no Typst and no compile pool, memoized per source text. Always 200 — an
+    invalid source is a normal result here, not a request error. Errors carry
+    1-based line/column positions and the schema path when RenderCV has one."""
+    return validate_source(body.source_text)
+
+
+@router.post("/compile-batch")
+def compile_batch(
+    body: DocumentCompileBatchRequest,
+    db: Session = Depends(get_db),
+    user: User = Depends(current_user),
+    pool: CompilePool = Depends(get_compile_pool),
+) -> StreamingResponse:
+    """Compile many saved versions (a job's history, a set of finalized
+    application documents) into one ZIP, streamed as each PDF finishes.
+    Per-document compile failures don't fail the batch — see
+    ``app.rendercv.batch`` for the archive layout."""
+    documents = (
+        db.query(Document)
+        .filter(Document.user_id == user.id, Document.id.in_(body.document_ids))
+        .all()
+    )
+    by_id = {d.id: d for d in documents}
+    if len(by_id) != len(body.document_ids):
+        raise HTTPException(status_code=404, detail="Document not found")
+    items = [
+        BatchItem(document_id=d.id, name=_archive_name(d), source_text=d.source_text)
+        for d in (by_id[document_id] for document_id in body.document_ids)
+    ]
+    return StreamingResponse(
+        stream_compile_zip(pool, items),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="documents.zip"'},
+    )
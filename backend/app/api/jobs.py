@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+import json
 import logging
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from llm_kit import LLMClient
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.applications.service import get_or_create_application
 from app.auth.dependencies import current_user, get_db
-from app.db.models import Job, User
+from app.config import job_heuristics_fast_path, jobs_bulk_max_items
+from app.db.models import Document, Job, User
+from app.llm.context import llm_context
 from app.llm.deps import get_llm
 from app.llm.schemas import JobModel
-from app.parsing.jobs import fetch_job_text, parse_job
-from app.schemas import JobCreateRequest, JobOut
+from app.parsing.bulk import ingest_jobs
+from app.parsing.jobs import fetch_job_text, parse_job_or_heuristic
+from app.parsing.upgrade import schedule_parse_upgrade
+from app.rendercv.cache import discard_sources
+from app.rendercv.speculative import discard_pretailored, schedule_pretailoring
+from app.schemas import JobBulkCreateRequest, JobCreateRequest, JobOut
 
 logger = logging.getLogger("app.jobs")
 
@@ -38,30 +46,60 @@ async def add_job(
     if not raw_text:
         assert body.url  # guaranteed by JobCreateRequest's validator
         logger.info("job fetch started: user=%s url=%s", user.id, body.url)
-        fetched = fetch_job_text(body.url)
+        fetched = await fetch_job_text(body.url)
         if fetched is None:
             response.status_code = 200
             return JobCreateResult(needs_paste=True, job=None)
         raw_text = fetched
 
-    parsed: JobModel = await parse_job(llm, raw_text)
+    # With the fast path, or when the LLM fails, a provisional parse now and
+    # the LLM's in the background (app/parsing/upgrade.py).
+    with llm_context(user.id, "parsing"):
+        parsed, parsed_by = await parse_job_or_heuristic(llm, raw_text, db, fast_path=job_heuristics_fast_path())
     job_row = Job(
         user_id=user.id,
         source_url=body.url,
         raw_text=raw_text,
         parsed=parsed.model_dump(),
+        parsed_by=parsed_by,
     )
     db.add(job_row)
     db.commit()
     db.refresh(job_row)
     get_or_create_application(db, job_row)
+    if parsed_by == "heuristic":
+        schedule_parse_upgrade(db, llm, job_row)  # pre-tailors once upgraded
+    else:
+        schedule_pretailoring(db, llm, job_row)
     logger.info(
-        "job created: user=%s job=%s company=%r title=%r",
-        user.id, job_row.id, parsed.company, parsed.title,
+        "job created: user=%s job=%s company=%r title=%r parsed_by=%s",
+        user.id, job_row.id, parsed.company, parsed.title, parsed_by,
     )
     return JobCreateResult(needs_paste=False, job=JobOut.model_validate(job_row))
 
 
+@router.post("/bulk")
+async def add_jobs_bulk(
+    body: JobBulkCreateRequest,
+    db: Session = Depends(get_db),
+    user: User = Depends(current_user),
+    llm: LLMClient = Depends(get_llm),
+) -> StreamingResponse:
+    """Add many jobs at once; one NDJSON line per item as it settles (see
+    ``app.parsing.bulk.ingest_jobs``), then a ``"done"`` summary line."""
+    if len(body.items) > jobs_bulk_max_items():
+        raise HTTPException(
+            status_code=422, detail=f"At most {jobs_bulk_max_items()} jobs per request"
+        )
+    logger.info("bulk job ingest started: user=%s items=%d", user.id, len(body.items))
+
+    async def lines():
+        async for result in ingest_jobs(db, llm, user.id, body.items):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get("", response_model=list[JobOut])
 def list_jobs(db: Session = Depends(get_db), user: User = Depends(current_user)) -> list[Job]:
     return db.query(Job).filter_by(user_id=user.id).order_by(Job.created_at.desc()).all()
@@ -88,6 +126,7 @@ def update_job(
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     job.parsed = body.model_dump()
+    job.parsed_by = "user"
     job.updated_at = datetime.now(timezone.utc)
     db.commit()
     db.refresh(job)
@@ -101,5 +140,8 @@ def delete_job(
     job = db.query(Job).filter_by(id=job_id, user_id=user.id).first()
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
+    source_texts = [row.source_text for row in db.query(Document.source_text).filter_by(job_id=job.id)]
     db.delete(job)
     db.commit()
+    discard_sources(source_texts)
+    discard_pretailored(job_id)
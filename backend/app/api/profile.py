@@ -12,10 +12,13 @@ from app.auth.dependencies import current_user, get_db
 from app.db.models import Profile, ProfileVersion, Resume, User
 from app.db.profile_history import snapshot_profile
 from app.files import delete_user_uploads, save_upload
+from app.llm.context import llm_context
 from app.llm.deps import get_llm
 from app.llm.schemas import ProfileModel
+from app.parsing.deps import get_extraction_pool
 from app.parsing.extract import extract_text
-from app.parsing.profile import parse_resume
+from app.parsing.pool import ExtractionPool, ExtractionPoolBusy
+from app.parsing.profile import parse_resume, resume_parse_key
 from app.schemas import ProfileOut, ProfileVersionOut, ResumeOut
 
 logger = logging.getLogger("app.profile")
@@ -35,6 +38,7 @@ async def upload_resume(
     db: Session = Depends(get_db),
     user: User = Depends(current_user),
     llm: LLMClient = Depends(get_llm),
+    extraction_pool: ExtractionPool = Depends(get_extraction_pool),
 ) -> Profile:
     ext = _ext(file.filename or "")
     if ext not in _ALLOWED_EXTENSIONS:
@@ -58,8 +62,20 @@ async def upload_resume(
         user.id, file.filename, ext, len(data),
     )
 
-    # Stage 1 — extract raw text (docling for pdf/docx, strip for tex).
-    raw_text = extract_text(data, ext)
+    # Stage 1 — extract raw text. Stripping .tex is cheap and runs inline;
+    # docling (pdf/docx) runs on the extraction process pool, off the event loop.
+    if ext == "tex":
+        raw_text = extract_text(data, ext)
+    else:
+        try:
+            raw_text = await extraction_pool.extract(data, ext)
+        except ExtractionPoolBusy as exc:
+            logger.warning("resume upload rejected: user=%s extraction pool full", user.id)
+            raise HTTPException(
+                status_code=503,
+                detail="Too many resume uploads in progress — try again in a moment.",
+                headers={"Retry-After": "5"},
+            ) from exc
     logger.info(
         "resume text extracted: user=%s chars=%d [%dms]",
         user.id, len(raw_text), _elapsed_ms(),
@@ -70,21 +86,38 @@ async def upload_resume(
     logger.info("resume file saved to disk: user=%s [%dms]", user.id, _elapsed_ms())
 
     # Stage 3 — record the Resume row (audit trail).
+    parse_key = resume_parse_key(raw_text)
     resume_row = Resume(
         user_id=user.id,
         filename=file.filename or f"resume.{ext}",
         format=ext,
         raw_text=raw_text,
+        parse_key=parse_key,
     )
     db.add(resume_row)
 
-    # Stage 4 — parse the master profile via the LLM (slowest stage).
-    logger.info("resume LLM parse started: user=%s", user.id)
-    profile_model: ProfileModel = await parse_resume(llm, raw_text)
+    # Stage 4 — parse the master profile via the LLM (slowest stage), unless
+    # this user already uploaded the same text under the same model/prompt.
+    previous: Resume | None = (
+        db.query(Resume)
+        .filter(Resume.user_id == user.id, Resume.parse_key == parse_key, Resume.parsed.is_not(None))
+        .order_by(Resume.uploaded_at.desc())
+        .first()
+    )
+    if previous is not None:
+        profile_model = ProfileModel.model_validate(previous.parsed)
+        llm_stage = "skipped"
+    else:
+        logger.info("resume LLM parse started: user=%s", user.id)
+        with llm_context(user.id, "parsing"):
+            profile_model = await parse_resume(llm, raw_text)
+        llm_stage = "ran"
     profile_data = profile_model.model_dump()
+    resume_row.parsed = profile_data
     logger.info(
-        "resume LLM parse complete: user=%s experience=%d education=%d skills=%d [%dms]",
+        "resume LLM parse complete: user=%s llm=%s experience=%d education=%d skills=%d [%dms]",
         user.id,
+        llm_stage,
         len(profile_model.experience),
         len(profile_model.education),
         len(profile_model.skills),
@@ -60,6 +60,182 @@ def rendercv_theme() -> str:
     return app_config().get("rendercv", {}).get("theme", "engineeringresumes")
 
 
+def rendercv_compile_mode() -> str:
+    return app_config().get("rendercv", {}).get("compile_mode", "memory")
+
+
+def rendercv_scratch_dir() -> str | None:
+    return app_config().get("rendercv", {}).get("scratch_dir")
+
+
+def rendercv_cache_memory_entries() -> int:
+    return app_config().get("rendercv", {}).get("cache", {}).get("memory_entries", 64)
+
+
+def rendercv_cache_disk_max_mb() -> float:
+    return app_config().get("rendercv", {}).get("cache", {}).get("disk_max_mb", 256)
+
+
+def rendercv_preview_ppi() -> float:
+    return app_config().get("rendercv", {}).get("preview", {}).get("preview_ppi", 60)
+
+
+def rendercv_thumbnail_ppi() -> float:
+    return app_config().get("rendercv", {}).get("preview", {}).get("thumbnail_ppi", 20)
+
+
+def rendercv_precompile_enabled() -> bool:
+    return app_config().get("rendercv", {}).get("precompile", {}).get("enabled", True)
+
+
+def rendercv_precompile_max_queue() -> int:
+    return app_config().get("rendercv", {}).get("precompile", {}).get("max_queue", 256)
+
+
+def rendercv_pool_workers() -> int:
+    return app_config().get("rendercv", {}).get("pool", {}).get("workers", 2)
+
+
+def rendercv_pool_max_queue() -> int:
+    return app_config().get("rendercv", {}).get("pool", {}).get("max_queue", 8)
+
+
+def rendercv_pool_timeout_s() -> float:
+    return app_config().get("rendercv", {}).get("pool", {}).get("timeout_s", 30.0)
+
+
+def rendercv_pool_memory_limit_mb() -> int:
+    return app_config().get("rendercv", {}).get("pool", {}).get("memory_limit_mb", 1536)
+
+
+def draft_stream_keepalive_s() -> float:
+    return app_config().get("draft_stream", {}).get("keepalive_s", 15)
+
+
+def draft_stream_precompile_wait_s() -> float:
+    return app_config().get("draft_stream", {}).get("precompile_wait_s", 30)
+
+
+def llm_admission_max_concurrency() -> int:
+    return app_config().get("llm", {}).get("admission", {}).get("max_concurrency", 8)
+
+
+def llm_admission_tokens_per_minute() -> int:
+    return app_config().get("llm", {}).get("admission", {}).get("tokens_per_minute", 0)
+
+
+def llm_model() -> str:
+    return get_config()["llm_kit"]["llm"]["model"]
+
+
+def llm_message_format() -> str:
+    return get_config()["llm_kit"]["llm"].get("message_format", "openai")
+
+
+def llm_prompt_caching() -> bool:
+    return app_config().get("llm", {}).get("prompt_caching", True)
+
+
+def llm_delta_retailoring() -> bool:
+    return app_config().get("llm", {}).get("delta_retailoring", True)
+
+
+def llm_compact_profile() -> bool:
+    return app_config().get("llm", {}).get("compact_profile", True)
+
+
+def job_heuristics_fast_path() -> bool:
+    return app_config().get("job_heuristics", {}).get("fast_path", False)
+
+
+def job_parse_cache_ttl_days() -> float:
+    return app_config().get("job_parse_cache", {}).get("ttl_days", 30)
+
+
+def job_parse_cache_max_entries() -> int:
+    return app_config().get("job_parse_cache", {}).get("max_entries", 5000)
+
+
+def job_fetch_timeout_s() -> float:
+    return app_config().get("job_fetch", {}).get("timeout_s", 15)
+
+
+def job_fetch_connect_timeout_s() -> float:
+    return app_config().get("job_fetch", {}).get("connect_timeout_s", 5)
+
+
+def job_fetch_max_redirects() -> int:
+    return app_config().get("job_fetch", {}).get("max_redirects", 5)
+
+
+def job_fetch_max_bytes() -> int:
+    return app_config().get("job_fetch", {}).get("max_bytes", 5_000_000)
+
+
+def job_fetch_max_connections() -> int:
+    return app_config().get("job_fetch", {}).get("max_connections", 20)
+
+
+def job_fetch_extract_workers() -> int:
+    return app_config().get("job_fetch", {}).get("extract_workers", 2)
+
+
+def speculative_tailoring_enabled() -> bool:
+    return app_config().get("speculative_tailoring", {}).get("enabled", False)
+
+
+def speculative_tailoring_max_entries() -> int:
+    return app_config().get("speculative_tailoring", {}).get("max_entries", 256)
+
+
+def jobs_bulk_max_items() -> int:
+    return app_config().get("jobs_bulk", {}).get("max_items", 50)
+
+
+def jobs_bulk_fetch_concurrency() -> int:
+    return app_config().get("jobs_bulk", {}).get("fetch_concurrency", 8)
+
+
+def jobs_bulk_per_domain_concurrency() -> int:
+    return app_config().get("jobs_bulk", {}).get("per_domain_concurrency", 2)
+
+
+def jobs_bulk_llm_concurrency() -> int:
+    return app_config().get("jobs_bulk", {}).get("llm_concurrency", 4)
+
+
+def jobs_bulk_batch_size() -> int:
+    return app_config().get("jobs_bulk", {}).get("batch_size", 10)
+
+
+def extraction_workers() -> int:
+    return app_config().get("extraction", {}).get("workers", 2)
+
+
+def extraction_max_queue() -> int:
+    return app_config().get("extraction", {}).get("max_queue", 4)
+
+
+def docling_ocr() -> bool:
+    return app_config().get("docling", {}).get("ocr", True)
+
+
+def docling_table_structure() -> bool:
+    return app_config().get("docling", {}).get("table_structure", True)
+
+
+def docling_converters() -> int:
+    return app_config().get("docling", {}).get("converters", 1)
+
+
+def warmup_enabled() -> bool:
+    return app_config().get("warmup", {}).get("enabled", False)
+
+
+def warmup_components() -> list[str]:
+    return app_config().get("warmup", {}).get("components", ["rendercv", "compile_pool", "docling"])
+
+
 def profile_history_max_versions() -> int:
     return app_config().get("profile_history", {}).get("max_versions", 20)
 
@@ -8,6 +8,9 @@ import app.db.models  # noqa: F401 — registers all models on Base.metadata
 def run_migrations() -> None:
     Base.metadata.create_all(bind=engine)
     _add_application_event_actor_column()
+    _add_resume_parse_columns()
+    _add_document_tailoring_column()
+    _add_job_parsed_by_column()
 
 
 def _add_application_event_actor_column() -> None:
@@ -20,3 +23,37 @@ def _add_application_event_actor_column() -> None:
         if "actor" not in cols:
             conn.execute(text("ALTER TABLE application_events ADD COLUMN actor VARCHAR DEFAULT 'user'"))
             conn.commit()
+
+
+def _add_resume_parse_columns() -> None:
+    """``resumes.parse_key`` / ``resumes.parsed`` memoize the LLM parse of a
+    resume's text; added by hand on DBs created before them (see above). Old
+    rows keep NULLs and simply never match."""
+    with engine.connect() as conn:
+        cols = {row[1] for row in conn.execute(text("PRAGMA table_info(resumes)"))}
+        if "parse_key" not in cols:
+            conn.execute(text("ALTER TABLE resumes ADD COLUMN parse_key VARCHAR"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_resumes_parse_key ON resumes (parse_key)"))
+        if "parsed" not in cols:
+            conn.execute(text("ALTER TABLE resumes ADD COLUMN parsed JSON"))
+        conn.commit()
+
+
+def _add_document_tailoring_column() -> None:
+    """``documents.tailoring`` keeps a drafted CV's TailoredCV for delta
+    re-drafts; added by hand on older DBs (see above). Old rows keep NULL and
+    are simply re-tailored in full."""
+    with engine.connect() as conn:
+        cols = {row[1] for row in conn.execute(text("PRAGMA table_info(documents)"))}
+        if "tailoring" not in cols:
+            conn.execute(text("ALTER TABLE documents ADD COLUMN tailoring JSON"))
+            conn.commit()
+
+
+def _add_job_parsed_by_column() -> None:
+    """``jobs.parsed_by`` (see ``Job``); every job before it was LLM-parsed."""
+    with engine.connect() as conn:
+        cols = {row[1] for row in conn.execute(text("PRAGMA table_info(jobs)"))}
+        if "parsed_by" not in cols:
+            conn.execute(text("ALTER TABLE jobs ADD COLUMN parsed_by VARCHAR NOT NULL DEFAULT 'llm'"))
+            conn.commit()
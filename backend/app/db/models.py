@@ -78,6 +78,12 @@ class Resume(Base):
     filename: Mapped[str] = mapped_column(String, nullable=False)
     format: Mapped[str] = mapped_column(String, nullable=False)  # pdf | docx | tex
     raw_text: Mapped[str] = mapped_column(Text, nullable=False)
+    # parse_resume() output for raw_text, memoized so re-uploading the same
+    # resume skips the LLM; parse_key hashes the normalized text, model and
+    # prompt version (app/parsing/profile.py). Null on rows from before this
+    # was recorded.
+    parse_key: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    parsed: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=_utcnow
     )
@@ -111,6 +117,10 @@ class Job(Base):
     source_url: Mapped[str | None] = mapped_column(String, nullable=True)
     raw_text: Mapped[str] = mapped_column(Text, nullable=False)
     parsed: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # Where ``parsed`` came from: "llm" (parse_job), "heuristic" (the
+    # provisional fast-path parse, app/parsing/heuristic.py — replaced in the
+    # background unless the upgrade fails) or "user" (edited via PUT).
+    parsed_by: Mapped[str] = mapped_column(String, nullable=False, default="llm")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=_utcnow
     )
@@ -131,8 +141,10 @@ class Document(Base):
     """A generated CV/cover-letter draft. Versions are append-only rows — never
     mutated in place — so a finalized application (M7) can snapshot the exact
     document that was submitted even after later edits. Only the source text
-    (RenderCV YAML) is persisted; PDFs are compiled on demand and never stored
-    on disk (see backend/app/rendercv/compile.py)."""
+    (RenderCV YAML) is persisted; PDFs are compiled on demand (see
+    backend/app/rendercv/compile.py) and only ever kept in the content-addressed
+    compile cache, which is purged when the row is deleted (see
+    backend/app/rendercv/cache.py)."""
 
     __tablename__ = "documents"
 
@@ -148,6 +160,12 @@ class Document(Base):
     source_text: Mapped[str] = mapped_column(Text, nullable=False)
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     is_finalized: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # For LLM-drafted CVs: the TailoredCV this version was built from, with
+    # the (profile version, job updated_at) stamp it was computed against —
+    # lets a re-draft with instructions revise it instead of starting over
+    # (app/rendercv/service.py). Null on cover letters, editor saves and
+    # rows from before this was recorded.
+    tailoring: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=_utcnow
     )
@@ -270,3 +288,25 @@ class ApplicationDocument(Base):
 
     application: Mapped[Application] = relationship("Application", back_populates="documents")
     document: Mapped[Document] = relationship("Document")
+
+
+class JobParseCache(Base):
+    """Memoized ``parse_job`` results, shared across users: a posting's
+    parsed fields depend only on its text, the model and the prompt, which is
+    exactly what ``key`` hashes (see ``app/parsing/jobs.py``). Holds no user
+    data — only the structured extraction of posting text. Bounded by a TTL
+    and an entry cap, evicted least-recently-used."""
+
+    __tablename__ = "job_parse_cache"
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    model: Mapped[str] = mapped_column(String, nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String, nullable=False)
+    parsed: Mapped[dict] = mapped_column(JSON, nullable=False)
+    hits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow, index=True
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow, index=True
+    )
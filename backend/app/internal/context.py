@@ -7,9 +7,11 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_db
+from app.config import llm_compact_profile
 from app.db.models import Document, Job, Profile
 from app.internal.deps import verify_internal_secret
 from app.internal.schemas import ContextRequest, ContextResponse
+from app.llm.compact import profile_prompt_json
 
 logger = logging.getLogger("app.internal.context")
 
@@ -54,6 +56,13 @@ _JOB_MODE_INSTRUCTIONS = (
     "from what they said."
 )
 
+_COMPACT_PROFILE_TOOL_NOTE = (
+    "(The profile above is abbreviated for reading only. When calling profile tools, "
+    "use the full field names — company, position, institution, degree, location, "
+    "summary, highlights, authors, journal, start_date/end_date/date — and full "
+    "{label, details} / {key, value} objects for skills and enrichment.)"
+)
+
 _JOB_NOT_FOUND_BLOCK = (
     "The referenced job could not be found for this user. Let them know and offer "
     "to help with their profile instead."
@@ -72,6 +81,13 @@ def _strip_namespace(conversation_id: str, user_id: str) -> str:
     return conversation_id
 
 
+def _profile_block(profile: Profile) -> str:
+    block = profile_prompt_json(profile.data)
+    if llm_compact_profile():
+        block += f"\n{_COMPACT_PROFILE_TOOL_NOTE}"
+    return block
+
+
 def build_context(db: Session, user_id: str, conversation_id: str) -> str:
     mode = _strip_namespace(conversation_id, user_id)
 
@@ -80,7 +96,7 @@ def build_context(db: Session, user_id: str, conversation_id: str) -> str:
         if profile is None:
             return _NO_PROFILE_BLOCK
         return (
-            f"Current master profile:\n{json.dumps(profile.data)}\n\n"
+            f"Current master profile:\n{_profile_block(profile)}\n\n"
             f"{_PROFILE_MODE_INSTRUCTIONS}"
         )
 
@@ -90,7 +106,7 @@ def build_context(db: Session, user_id: str, conversation_id: str) -> str:
         if job is None:
             return _JOB_NOT_FOUND_BLOCK
         profile = db.query(Profile).filter_by(user_id=user_id).first()
-        profile_block = json.dumps(profile.data) if profile is not None else "(none)"
+        profile_block = _profile_block(profile) if profile is not None else "(none)"
 
         latest_cv: Document | None = (
             db.query(Document)
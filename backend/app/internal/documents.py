@@ -8,13 +8,19 @@ from app.auth.dependencies import get_db
 from app.db.models import Job, Profile
 from app.internal.deps import verify_internal_secret
 from app.internal.schemas import (
+    DraftApplicationPackRequest,
+    DraftApplicationPackResponse,
     DraftCoverLetterRequest,
     DraftCoverLetterResponse,
     DraftCvRequest,
     DraftCvResponse,
 )
 from app.llm.deps import get_llm
-from app.rendercv.service import draft_cover_letter_document, draft_cv_document
+from app.rendercv.service import (
+    draft_application_pack,
+    draft_cover_letter_document,
+    draft_cv_document,
+)
 
 router = APIRouter(
     prefix="/internal/documents",
@@ -55,3 +61,19 @@ async def draft_cover_letter(
     job, profile = _get_job_and_profile(db, body.user_id, body.job_id)
     document = await draft_cover_letter_document(db, llm, job, profile, body.instructions)
     return DraftCoverLetterResponse(document_id=document.id, version=document.version)
+
+
+@router.post("/draft-application-pack", response_model=DraftApplicationPackResponse)
+async def draft_pack(
+    body: DraftApplicationPackRequest,
+    db: Session = Depends(get_db),
+    llm: LLMClient = Depends(get_llm),
+) -> DraftApplicationPackResponse:
+    job, profile = _get_job_and_profile(db, body.user_id, body.job_id)
+    cv, cover_letter = await draft_application_pack(db, llm, job, profile, body.instructions)
+    return DraftApplicationPackResponse(
+        cv_document_id=cv.id,
+        cv_version=cv.version,
+        cover_letter_document_id=cover_letter.id,
+        cover_letter_version=cover_letter.version,
+    )
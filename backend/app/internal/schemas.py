@@ -48,6 +48,19 @@ class DraftCoverLetterResponse(BaseModel):
     version: int
 
 
+class DraftApplicationPackRequest(BaseModel):
+    user_id: str
+    job_id: str
+    instructions: str | None = None
+
+
+class DraftApplicationPackResponse(BaseModel):
+    cv_document_id: str
+    cv_version: int
+    cover_letter_document_id: str
+    cover_letter_version: int
+
+
 class ApplicationStatusRequest(BaseModel):
     user_id: str
     job_id: str
@@ -0,0 +1,207 @@
+"""Admission control for LLM calls.
+
+Every ``llm.invoke`` goes through one ``AdmissionController`` (the client
+from ``build_llm`` is wrapped in ``AdmittedLLM``), which bounds:
+
+- concurrency — at most ``app.llm.admission.max_concurrency`` calls in
+  flight, process-wide;
+- throughput — a token bucket of ``tokens_per_minute`` (0 disables it).
+  A call is charged an estimate of its prompt size up front, and the
+  estimate is corrected from the provider's reported usage afterwards.
+
+Waiting calls are admitted by priority class first (``interactive`` drafts >
+``parsing`` jobs/resumes > ``background`` work), then round-robin across
+users within a class, so one user bulk-adding jobs queues behind their own
+calls instead of everyone's. Call sites declare who and what a call is with
+``llm_context(user_id, priority)`` (app/llm/context.py). Background work that
+a request ends up waiting on (e.g. speculative tailoring) is raised to the
+request's priority with ``promote``.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+
+from app.llm.context import PRIORITIES, current_priority, current_user_id
+from app.llm.usage import token_usage
+from app.metrics import RollingSamples
+
+_CHARS_PER_TOKEN = 4  # rough, provider-agnostic; corrected from usage after the call
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    tokens: int
+    priority: str
+    task: asyncio.Task | None = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class AdmissionController:
+    def __init__(self, max_concurrency: int, tokens_per_minute: int = 0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self._in_flight = 0
+        # priority → user → that user's waiters, in arrival order. The user
+        # OrderedDict is rotated on every admission (round-robin).
+        self._queues: dict[str, OrderedDict[str, deque[_Waiter]]] = {p: OrderedDict() for p in PRIORITIES}
+        self._promoted: weakref.WeakKeyDictionary[asyncio.Task, str] = weakref.WeakKeyDictionary()
+        self._budget = float(self.tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._timer: asyncio.TimerHandle | None = None
+        self.wait_ms = {p: RollingSamples() for p in PRIORITIES}
+        self.admitted = 0
+
+    async def acquire(self, user_id: str, priority: str, tokens: int) -> int:
+        """Wait for a slot (and ``tokens`` of budget); returns the tokens
+        actually charged, to pass back to ``release``."""
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)  # never wait for more than a full bucket
+        task = asyncio.current_task()
+        promoted = self._promoted.get(task) if task is not None else None
+        if promoted is not None and _rank(promoted) < _rank(priority):
+            priority = promoted
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), tokens, priority, task)
+        self._queues[priority].setdefault(user_id, deque()).append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(waiter.tokens, None)  # admitted just as we were cancelled
+            else:
+                self._forget(waiter.priority, user_id, waiter)
+            raise
+        self.wait_ms[waiter.priority].observe((time.monotonic() - waiter.enqueued_at) * 1000)
+        return tokens
+
+    def promote(self, task: asyncio.Task, priority: str) -> None:
+        """Raise ``task``'s LLM calls to at least ``priority`` — those queued
+        now and any it makes later."""
+        self._promoted[task] = priority
+        for lower in PRIORITIES[_rank(priority) + 1 :]:
+            users = self._queues[lower]
+            for user_id, queue in list(users.items()):
+                for waiter in [w for w in queue if w.task is task]:
+                    queue.remove(waiter)
+                    waiter.priority = priority
+                    self._queues[priority].setdefault(user_id, deque()).append(waiter)
+                if not queue:
+                    del users[user_id]
+        self._dispatch()
+
+    def release(self, estimated_tokens: int, actual_tokens: int | None) -> None:
+        self._in_flight -= 1
+        if self.tokens_per_minute and actual_tokens is not None:
+            self._refill()
+            self._budget -= actual_tokens - estimated_tokens
+        self._dispatch()
+
+    def stats(self) -> dict:
+        available = None
+        if self.tokens_per_minute:  # read-only: this runs off the event loop
+            elapsed = time.monotonic() - self._refilled_at
+            available = round(min(self.tokens_per_minute, self._budget + elapsed * self.tokens_per_minute / 60))
+        return {
+            "max_concurrency": self.max_concurrency,
+            "tokens_per_minute": self.tokens_per_minute,
+            "tokens_available": available,
+            "in_flight": self._in_flight,
+            "admitted": self.admitted,
+            "queued": {p: sum(len(q) for q in users.values()) for p, users in self._queues.items()},
+            "queue_wait_ms": {p: samples.summary() for p, samples in self.wait_ms.items()},
+        }
+
+    def _refill(self) -> None:
+        if not self.tokens_per_minute:
+            return
+        now = time.monotonic()
+        self._budget = min(
+            float(self.tokens_per_minute),
+            self._budget + (now - self._refilled_at) * self.tokens_per_minute / 60,
+        )
+        self._refilled_at = now
+
+    def _forget(self, priority: str, user_id: str, waiter: _Waiter) -> None:
+        users = self._queues[priority]
+        queue = users.get(user_id)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                del users[user_id]
+
+    def _next_waiter(self) -> tuple[str, str, _Waiter] | None:
+        for priority in PRIORITIES:
+            users = self._queues[priority]
+            if users:
+                user_id, queue = next(iter(users.items()))
+                return priority, user_id, queue[0]
+        return None
+
+    def _dispatch(self) -> None:
+        self._refill()
+        while self._in_flight < self.max_concurrency:
+            head = self._next_waiter()
+            if head is None:
+                return
+            priority, user_id, waiter = head
+            if self.tokens_per_minute and waiter.tokens > self._budget:
+                self._wake_when_refilled(waiter.tokens - self._budget)
+                return
+            users = self._queues[priority]
+            users[user_id].popleft()
+            if users[user_id]:
+                users.move_to_end(user_id)
+            else:
+                del users[user_id]
+            if waiter.future.done():  # cancelled while queued
+                continue
+            self._in_flight += 1
+            self.admitted += 1
+            if self.tokens_per_minute:
+                self._budget -= waiter.tokens
+            waiter.future.set_result(None)
+
+    def _wake_when_refilled(self, deficit: float) -> None:
+        if self._timer is not None and not self._timer.cancelled():
+            self._timer.cancel()
+        delay = deficit * 60 / self.tokens_per_minute
+        self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+
+def _rank(priority: str) -> int:
+    return PRIORITIES.index(priority)
+
+
+def estimate_tokens(messages) -> int:
+    return sum(len(getattr(m, "text", "") or "") for m in messages) // _CHARS_PER_TOKEN + 1
+
+
+class AdmittedLLM:
+    """An ``LLMClient`` whose ``invoke`` waits for admission first; every
+    other attribute is the wrapped client's."""
+
+    def __init__(self, client, controller: AdmissionController):
+        self._client = client
+        self.admission = controller
+
+    async def invoke(self, messages, *args, **kwargs):
+        estimate = await self.admission.acquire(
+            current_user_id.get(), current_priority.get(), estimate_tokens(messages)
+        )
+        actual = None
+        try:
+            result = await self._client.invoke(messages, *args, **kwargs)
+            usage = token_usage(result)
+            if usage is not None:
+                actual = usage.total_input + usage.output
+            return result
+        finally:
+            self.admission.release(estimate, actual)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
@@ -3,9 +3,18 @@ from __future__ import annotations
 from llm_kit import LLMClient
 from llm_kit.config import AppConfig
 
-from app.config import get_config
+from app.config import get_config, llm_admission_max_concurrency, llm_admission_tokens_per_minute
+from app.llm.admission import AdmissionController, AdmittedLLM
+from app.llm.telemetry import InstrumentedLLM
 
 
-def build_llm() -> LLMClient:
-    """Build an LLMClient from the llm_kit block in config.yaml."""
-    return LLMClient(AppConfig.from_dict(get_config()["llm_kit"]))
+def build_llm() -> AdmittedLLM:
+    """Build an LLMClient from the llm_kit block in config.yaml, instrumented
+    for per-call telemetry (``app.llm.telemetry``) and behind the app-wide
+    admission controller (``app.llm.admission``)."""
+    controller = AdmissionController(
+        max_concurrency=llm_admission_max_concurrency(),
+        tokens_per_minute=llm_admission_tokens_per_minute(),
+    )
+    client = InstrumentedLLM(LLMClient(AppConfig.from_dict(get_config()["llm_kit"])))
+    return AdmittedLLM(client, controller)
@@ -0,0 +1,118 @@
+"""Token-lean serialization of ``ProfileModel`` data for prompts.
+
+``json.dumps(profile.data)`` carries every empty string and list the schema
+defaults to, the long field names repeated on every item, and whitespace
+after every separator — so a long career history costs far more input
+tokens than its content. ``compact_profile`` keeps the content and drops the
+rest:
+
+- empty strings/lists/objects are omitted;
+- repeated item fields get short keys (``PROFILE_LEGEND`` spells them out);
+- ``start_date``/``end_date`` fold into one ``d`` ("2021-03..present");
+- skills and enrichment become ``"label: details"`` strings;
+- separators carry no whitespace.
+
+Items of the index-referenced sections (``INDEXED_SECTIONS`` —
+``TailoredCV`` picks experience/projects/education/publications/extras by
+0-based index) are never dropped, even when empty (they serialize as
+``{}``), so the LLM's indices still resolve against ``profile.data``.
+
+``scripts/bench_profile_tokens.py`` measures the savings against
+``json.dumps`` on the example profiles.
+"""
+from __future__ import annotations
+
+import json
+
+from app.config import llm_compact_profile
+from app.llm.prompts import stable_json
+
+INDEXED_SECTIONS = ("experience", "projects", "education", "publications", "extras")
+
+_KEYS = {
+    "company": "co",
+    "position": "pos",
+    "institution": "inst",
+    "degree": "deg",
+    "location": "loc",
+    "summary": "sum",
+    "highlights": "hl",
+    "authors": "au",
+    "journal": "jn",
+}
+
+PROFILE_LEGEND = (
+    "Empty fields omitted; co=company pos=position inst=institution deg=degree loc=location "
+    "sum=summary hl=highlights au=authors jn=journal d=start..end; list positions are the "
+    "0-based indices."
+)
+
+
+def _dates(item: dict) -> str:
+    start, end = item.get("start_date") or "", item.get("end_date") or ""
+    if start or end:
+        return f"{start}..{end}"
+    return item.get("date") or ""
+
+
+def _compact_item(item: dict) -> dict:
+    out = {}
+    dates = _dates(item)
+    if dates:
+        out["d"] = dates
+    for name, value in item.items():
+        if name in ("start_date", "end_date", "date") or value in ("", [], {}, None):
+            continue
+        out[_KEYS.get(name, name)] = value
+    return out
+
+
+def _pairs(items: list[dict], first: str, second: str) -> list[str]:
+    lines = []
+    for item in items:
+        head, tail = item.get(first) or "", item.get(second) or ""
+        if head or tail:
+            lines.append(f"{head}: {tail}" if head and tail else head or tail)
+    return lines
+
+
+def compact_profile(data: dict) -> dict:
+    """The compact form of ``profile.data`` described in the module docstring."""
+    out = {}
+    contact = data.get("contact") or {}
+    compact_contact = {
+        name: value
+        for name, value in contact.items()
+        if name != "social_networks" and value not in ("", [], None)
+    }
+    networks = _pairs(contact.get("social_networks") or [], "network", "username")
+    if networks:
+        compact_contact["social_networks"] = networks
+    if compact_contact:
+        out["contact"] = compact_contact
+    if data.get("summary"):
+        out["summary"] = data["summary"]
+    skills = _pairs(data.get("skills") or [], "label", "details")
+    if skills:
+        out["skills"] = skills
+    for section in INDEXED_SECTIONS:
+        items = data.get(section) or []
+        if items:
+            out[section] = [_compact_item(item) for item in items]
+    enrichment = _pairs(data.get("enrichment") or [], "key", "value")
+    if enrichment:
+        out["enrichment"] = enrichment
+    return out
+
+
+def compact_profile_json(data: dict) -> str:
+    """``compact_profile`` behind its legend, as whitespace-free, key-sorted
+    JSON (deterministic, so the prompt-cache prefix still matches)."""
+    body = json.dumps(compact_profile(data), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return f"{PROFILE_LEGEND}\n{body}"
+
+
+def profile_prompt_json(data: dict) -> str:
+    """``profile.data`` as embedded in a prompt: compact, or plain
+    ``stable_json`` when ``app.llm.compact_profile`` is off."""
+    return compact_profile_json(data) if llm_compact_profile() else stable_json(data)
@@ -0,0 +1,40 @@
+"""Who and what an LLM call is for, set by the code that makes it and read
+by the client wrappers (admission control, telemetry).
+
+Context variables rather than arguments: ``llm.invoke`` keeps llm_kit's own
+signature, and values set around an ``await`` carry into tasks spawned
+inside it (e.g. ``asyncio.gather``).
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+PRIORITIES = ("interactive", "parsing", "background")  # highest first
+
+current_user_id: ContextVar[str] = ContextVar("llm_user_id", default="-")
+current_priority: ContextVar[str] = ContextVar("llm_priority", default="interactive")
+current_site: ContextVar[str] = ContextVar("llm_site", default="other")
+
+
+@contextmanager
+def llm_context(
+    user_id: str | None = None, priority: str | None = None, site: str | None = None
+) -> Iterator[None]:
+    """Attribute LLM calls made inside the block to ``user_id`` at
+    ``priority`` (one of ``PRIORITIES``), from call site ``site`` (e.g.
+    "parse_job"). Unset arguments keep the enclosing values."""
+    if priority is not None and priority not in PRIORITIES:
+        raise ValueError(f"unknown LLM priority {priority!r}")
+    tokens = [
+        (var, var.set(value))
+        for var, value in ((current_user_id, user_id), (current_priority, priority), (current_site, site))
+        if value is not None
+    ]
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
@@ -0,0 +1,79 @@
+"""Cache-friendly prompt layout for the drafting calls.
+
+Providers cache prompt *prefixes*: OpenAI-compatible servers do it
+automatically, Anthropic from explicit ``cache_control`` breakpoints. So the
+tailoring prompts are laid out most-stable-first, each part byte-identical
+across calls:
+
+1. system — task instructions + the good_resume.md rulebook (same for every
+   call of that kind, for every user);
+2. user — the master profile (same across a user's drafts until they edit it);
+3. user — the job posting and any per-draft instructions.
+
+With Anthropic-format providers (``llm_kit.llm.message_format: anthropic``)
+and ``app.llm.prompt_caching`` on, parts 1 and 2 end in a cache breakpoint,
+so a second draft for the same user reads both from cache and only the job
+part is billed at the full input rate. That needs an llm_kit whose ``Message``
+carries a ``cache_control`` field; ``check_prompt_caching`` warns at startup
+when it doesn't.
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+
+from llm_kit import Message
+
+from app.config import llm_message_format, llm_prompt_caching
+
+logger = logging.getLogger("app.llm")
+
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def stable_json(data) -> str:
+    """Deterministic JSON for prompt bodies — key order must not vary between
+    calls, or the cached prefix stops matching."""
+    return json.dumps(data, sort_keys=True, ensure_ascii=False)
+
+
+def cache_breakpoints_enabled() -> bool:
+    return llm_prompt_caching() and llm_message_format() == "anthropic"
+
+
+def _message_supports_breakpoints() -> bool:
+    fields = getattr(Message, "model_fields", None) or getattr(Message, "__dataclass_fields__", {})
+    return "cache_control" in fields
+
+
+def check_prompt_caching() -> bool:
+    """Run once at startup: whether drafting calls will carry cache
+    breakpoints. Warns when they are configured (``app.llm.prompt_caching``
+    with the anthropic message format) but this llm_kit's ``Message`` has no
+    ``cache_control`` field to carry them — the layout then only gets the
+    provider's automatic prefix caching, if any."""
+    if not cache_breakpoints_enabled():
+        return False
+    if _message_supports_breakpoints():
+        return True
+    logger.warning(
+        "prompt caching is enabled but llm_kit's %s has no cache_control field — "
+        "no cache breakpoints will be sent", Message.__name__,
+    )
+    return False
+
+
+def _with_breakpoint(message: Message) -> Message:
+    """Mark ``message`` as the end of a cacheable prefix."""
+    if hasattr(message, "model_copy"):
+        return message.model_copy(update={"cache_control": _EPHEMERAL})
+    return dataclasses.replace(message, cache_control=_EPHEMERAL)
+
+
+def layered_messages(system_prompt: str, profile_block: str, request_block: str) -> list[Message]:
+    """The three-part layout described in the module docstring."""
+    messages = [Message.system(system_prompt), Message.user(profile_block)]
+    if cache_breakpoints_enabled() and _message_supports_breakpoints():
+        messages = [_with_breakpoint(m) for m in messages]
+    return [*messages, Message.user(request_block)]
@@ -293,6 +293,38 @@ class TailoredCV(BaseModel):
     extras: list[int] = Field(default_factory=list)
 
 
+class TailoredCVRevision(BaseModel):
+    """LLM output for revising a previous ``TailoredCV`` with new instructions
+    (e.g. "emphasize my Go work"): the same fields, each ``null`` unless that
+    section changes — so the model only emits what the instructions touch and
+    ``apply`` keeps the rest of the previous selection. A returned section
+    replaces the previous one whole (same per-section semantics as
+    ``TailoredCV``). See ``retailor_profile`` in ``backend/app/rendercv/tailor.py``."""
+
+    model_config = ConfigDict(
+        json_schema_extra=_require(
+            "summary", "section_order", "skills", "experience", "projects",
+            "education", "publications", "extras",
+        )
+    )
+
+    summary: str | None = None
+    section_order: list[str] | None = None
+    skills: list[SkillItem] | None = None
+    experience: list[TailoredExperienceEntry] | None = None
+    projects: list[TailoredEntry] | None = None
+    education: list[TailoredEducationEntry] | None = None
+    publications: list[int] | None = None
+    extras: list[int] | None = None
+
+    def changed_sections(self) -> list[str]:
+        return [name for name in type(self).model_fields if getattr(self, name) is not None]
+
+    def apply(self, previous: TailoredCV) -> TailoredCV:
+        changes = self.model_dump(include=set(self.changed_sections()))
+        return TailoredCV.model_validate({**previous.model_dump(), **changes})
+
+
 class TailoredCoverLetter(BaseModel):
     """LLM output for cover-letter tailoring — pure prose, no facts re-emitted
     (contact details come from the profile verbatim in Python, same as
@@ -0,0 +1,145 @@
+"""Per-call LLM telemetry: latency, tokens, errors and validation failures,
+keyed by call site (``llm_context(site=...)``) and model, exposed on
+``GET /api/admin/metrics``.
+
+``InstrumentedLLM`` wraps the bare ``LLMClient`` — inside admission control —
+so latency is the provider call alone, not time spent queued for admission.
+Not recorded: time-to-first-byte (llm_kit's ``invoke`` isn't streaming, so
+the first byte and the last arrive together here) and provider retries
+(llm_kit retries inside ``invoke``, out of sight of this wrapper; a retried
+call just shows up as a slower one).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from llm_kit.errors import LLMError, ValidationError
+
+from app.config import llm_model
+from app.llm.context import current_site
+from app.llm.usage import token_usage
+from app.metrics import RollingSamples
+
+logger = logging.getLogger("app.llm")
+
+
+class _Series:
+    """Counters and rolling samples for one (site, model) pair."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.validation_failures = 0
+        self.input_token_total = 0
+        self.output_token_total = 0
+        self.latency_ms = RollingSamples()
+        self.input_tokens = RollingSamples()
+        self.output_tokens = RollingSamples()
+
+    def summary(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "validation_failures": self.validation_failures,
+            "input_tokens_total": self.input_token_total,
+            "output_tokens_total": self.output_token_total,
+            "latency_ms": self.latency_ms.summary(),
+            "input_tokens": self.input_tokens.summary(),
+            "output_tokens": self.output_tokens.summary(),
+        }
+
+
+class LLMTelemetry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], _Series] = {}
+
+    def _get(self, site: str, model: str) -> _Series:
+        with self._lock:
+            series = self._series.get((site, model))
+            if series is None:
+                series = self._series[(site, model)] = _Series()
+            return series
+
+    def record(
+        self,
+        site: str,
+        model: str,
+        latency_ms: float,
+        *,
+        outcome: str = "ok",
+        input_tokens: int | None = None,
+        output_tokens: int | None = None,
+    ) -> None:
+        """Record one call; ``outcome`` is "ok", "error" or "validation_failed"."""
+        series = self._get(site, model)
+        with self._lock:
+            series.calls += 1
+            if outcome == "error":
+                series.errors += 1
+            elif outcome == "validation_failed":
+                series.validation_failures += 1
+            if input_tokens is not None:
+                series.input_token_total += input_tokens
+            if output_tokens is not None:
+                series.output_token_total += output_tokens
+        series.latency_ms.observe(latency_ms)
+        if input_tokens is not None:
+            series.input_tokens.observe(input_tokens)
+        if output_tokens is not None:
+            series.output_tokens.observe(output_tokens)
+
+    def summary(self) -> dict:
+        """``{site: {model: series summary}}``."""
+        with self._lock:
+            items = sorted(self._series.items())
+        out: dict[str, dict] = {}
+        for (site, model), series in items:
+            out.setdefault(site, {})[model] = series.summary()
+        return out
+
+
+llm_telemetry = LLMTelemetry()
+
+
+class InstrumentedLLM:
+    """An ``LLMClient`` whose ``invoke`` calls are recorded in ``telemetry``;
+    every other attribute is the wrapped client's."""
+
+    def __init__(self, client, telemetry: LLMTelemetry = llm_telemetry):
+        self._client = client
+        self.telemetry = telemetry
+
+    async def invoke(self, messages, *args, **kwargs):
+        site = current_site.get()
+        started = time.perf_counter()
+        try:
+            result = await self._client.invoke(messages, *args, **kwargs)
+        except ValidationError:
+            self._record_failure(site, started, "validation_failed")
+            raise
+        except LLMError:
+            self._record_failure(site, started, "error")
+            raise
+        latency_ms = (time.perf_counter() - started) * 1000
+        usage = token_usage(result)
+        model = getattr(result, "model", None)
+        self.telemetry.record(
+            site,
+            model if isinstance(model, str) and model else llm_model(),
+            latency_ms,
+            input_tokens=usage.total_input if usage else None,
+            output_tokens=usage.output if usage else None,
+        )
+        logger.debug("llm call: site=%s latency=%.0fms", site, latency_ms)
+        return result
+
+    def _record_failure(self, site: str, started: float, outcome: str) -> None:
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.telemetry.record(site, llm_model(), latency_ms, outcome=outcome)
+        logger.info("llm call failed: site=%s outcome=%s latency=%.0fms", site, outcome, latency_ms)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
@@ -0,0 +1,113 @@
+"""Per-call token accounting, focused on prompt caching: how much of each
+call's input was read from the provider's prompt cache versus billed in full.
+
+llm_kit passes the provider's usage block through on the invoke result; its
+shape differs by provider (Anthropic: ``input_tokens`` +
+``cache_read_input_tokens`` / ``cache_creation_input_tokens``;
+OpenAI-compatible: ``prompt_tokens`` + ``prompt_tokens_details.cached_tokens``),
+so it is read defensively. A result without usage isn't counted; the first
+one logs a warning, since prompt-cache accounting is then blind.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+
+logger = logging.getLogger("app.llm")
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    uncached_input: int = 0  # input billed at the full rate
+    cache_read: int = 0  # input served from the prompt cache
+    cache_write: int = 0  # input written to the prompt cache
+    output: int = 0
+
+    @property
+    def total_input(self) -> int:
+        return self.uncached_input + self.cache_read + self.cache_write
+
+
+def _get(obj, name: str) -> int:
+    value = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def token_usage(result) -> TokenUsage | None:
+    usage = getattr(result, "usage", None)
+    if usage is None:
+        return None
+    if _get(usage, "input_tokens") or _get(usage, "cache_read_input_tokens"):
+        return TokenUsage(
+            uncached_input=_get(usage, "input_tokens"),
+            cache_read=_get(usage, "cache_read_input_tokens"),
+            cache_write=_get(usage, "cache_creation_input_tokens"),
+            output=_get(usage, "output_tokens"),
+        )
+    details = usage.get("prompt_tokens_details") if isinstance(usage, dict) else getattr(
+        usage, "prompt_tokens_details", None
+    )
+    cached = _get(details, "cached_tokens") if details is not None else 0
+    prompt = _get(usage, "prompt_tokens")
+    if not prompt:
+        return None
+    return TokenUsage(
+        uncached_input=prompt - cached,
+        cache_read=cached,
+        output=_get(usage, "completion_tokens"),
+    )
+
+
+class PromptCacheStats:
+    """Cumulative token counts per call site (``tailor_profile``,
+    ``tailor_cover_letter``, ...)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sites: dict[str, dict[str, int]] = {}
+
+    def record(self, site: str, usage: TokenUsage) -> None:
+        with self._lock:
+            totals = self._sites.setdefault(
+                site, {"calls": 0, "uncached_input": 0, "cache_read": 0, "cache_write": 0, "output": 0}
+            )
+            totals["calls"] += 1
+            totals["uncached_input"] += usage.uncached_input
+            totals["cache_read"] += usage.cache_read
+            totals["cache_write"] += usage.cache_write
+            totals["output"] += usage.output
+
+    def summary(self) -> dict:
+        with self._lock:
+            sites = {site: dict(totals) for site, totals in self._sites.items()}
+        for totals in sites.values():
+            total_input = totals["uncached_input"] + totals["cache_read"] + totals["cache_write"]
+            totals["cached_ratio"] = totals["cache_read"] / total_input if total_input else 0.0
+        return sites
+
+
+prompt_cache_stats = PromptCacheStats()
+
+
+_warned_no_usage = False
+
+
+def record_usage(site: str, result) -> TokenUsage | None:
+    """Log and count the token usage of one ``llm.invoke`` result."""
+    global _warned_no_usage
+    usage = token_usage(result)
+    if usage is None:
+        if not _warned_no_usage:
+            _warned_no_usage = True
+            logger.warning(
+                "llm result for site=%s carries no usage block (%s) — prompt-cache "
+                "accounting is unavailable", site, type(result).__name__,
+            )
+        return None
+    prompt_cache_stats.record(site, usage)
+    logger.info(
+        "llm usage: site=%s input=%d cached=%d cache_write=%d uncached=%d output=%d",
+        site, usage.total_input, usage.cache_read, usage.cache_write, usage.uncached_input, usage.output,
+    )
+    return usage
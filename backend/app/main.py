@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api.admin import router as admin_router
 from app.api.analytics import router as analytics_router
@@ -17,10 +19,20 @@ from app.api.jobs import router as jobs_router
 from app.api.profile import router as profile_router
 from app.applications.scheduler import build_scheduler, run_automation_once
 from app.applications.service import backfill_applications
+from app.config import warmup_enabled
 from app.db.engine import SessionLocal
 from app.db.migrate import run_migrations
 from app.internal import router as internal_router
 from app.llm.client import build_llm
+from app.llm.prompts import check_prompt_caching
+from app.parsing import fetch as job_fetch
+from app.parsing.pool import build_extraction_pool
+from app.parsing.upgrade import build_job_parse_upgrader
+from app.rendercv.cache import get_compile_cache
+from app.rendercv.pool import build_compile_pool
+from app.rendercv.precompile import build_precompiler
+from app.rendercv.speculative import build_speculative_tailor
+from app.warmup import build_warmup
 
 # Attach our handlers to uvicorn's stream so `app.*` loggers surface in the
 # server terminal with a consistent format. `force=True` reclaims the root from
@@ -41,6 +53,19 @@ def _under_pytest() -> bool:
 async def lifespan(app: FastAPI):
     run_migrations()
     app.state.llm = build_llm()
+    check_prompt_caching()
+    # Workers spawn lazily on the first compile, so tests and idle dev servers
+    # that never compile don't pay for the worker processes.
+    app.state.compile_pool = build_compile_pool()
+    app.state.extraction_pool = build_extraction_pool()
+    app.state.precompiler = build_precompiler(app.state.compile_pool, get_compile_cache())
+    app.state.speculative = build_speculative_tailor()
+    app.state.parse_upgrader = build_job_parse_upgrader()
+    app.state.warmup = build_warmup(
+        app.state.compile_pool,
+        app.state.extraction_pool,
+        enabled=warmup_enabled() and not _under_pytest(),
+    )
     app.state.scheduler = None
     # The scheduler/backfill below call SessionLocal() directly (bypassing
     # FastAPI's get_db dependency), so they always hit the real on-disk
@@ -51,17 +76,33 @@ async def lifespan(app: FastAPI):
         db = SessionLocal()
         try:
             backfill_applications(db)
+            # Upgrades pending at the last shutdown were dropped with it.
+            app.state.parse_upgrader.resume(db, app.state.llm)
         finally:
             db.close()
         app.state.scheduler = build_scheduler()
         app.state.scheduler.start()
         run_automation_once()
+        # Also skipped under pytest: it would spawn compile workers behind
+        # every test that drafts or saves a document.
+        app.state.precompiler.start()
+    # Runs after startup returns, i.e. while the server is already taking
+    # traffic; /health/ready reports its progress.
+    warmup_task = asyncio.create_task(app.state.warmup.run()) if app.state.warmup.enabled else None
     try:
         yield
     finally:
+        if warmup_task is not None:
+            warmup_task.cancel()
         if app.state.scheduler is not None:
             app.state.scheduler.shutdown()
+        app.state.parse_upgrader.shutdown()
+        app.state.speculative.shutdown()
+        app.state.precompiler.shutdown()
+        app.state.compile_pool.shutdown()
+        app.state.extraction_pool.shutdown()
         await app.state.llm.aclose()
+        await job_fetch.aclose()
 
 
 app = FastAPI(title="hirable", lifespan=lifespan)
@@ -88,3 +129,11 @@ app.include_router(internal_router)
 @app.get("/health")
 async def health() -> dict:
     return {"status": "ok"}
+
+
+@app.get("/health/ready")
+async def health_ready(request: Request) -> JSONResponse:
+    """503 until the start-up warm-up (if enabled) has finished; always
+    reports per-component state and duration."""
+    report = request.app.state.warmup.report()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
@@ -0,0 +1,67 @@
+"""Tiny in-process metric primitives for the admin metrics endpoint
+(``GET /api/admin/metrics``). Process-local and reset on restart — this is a
+single-process, self-hosted app, so there is no exporter/aggregation layer.
+"""
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+
+class RollingSamples:
+    """The last ``maxlen`` observations of one measurement (e.g. latency in
+    ms), summarized as count/percentiles on demand."""
+
+    def __init__(self, maxlen: int = 512):
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=maxlen)
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._samples.append(value)
+            self.count += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            ordered = sorted(self._samples)
+            count = self.count
+        if not ordered:
+            return {"count": count, "p50": None, "p95": None, "max": None}
+        return {
+            "count": count,
+            "p50": round(_percentile(ordered, 0.50), 1),
+            "p95": round(_percentile(ordered, 0.95), 1),
+            "max": round(ordered[-1], 1),
+        }
+
+
+class HitCounter:
+    """Hit/miss counts for one cache, with the hit rate on demand."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already-sorted, non-empty list."""
+    index = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+    return ordered[index]
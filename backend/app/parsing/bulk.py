@@ -0,0 +1,185 @@
+"""Bulk job ingestion (``POST /api/jobs/bulk``): many postings — URLs and/or
+pasted texts — fetched, parsed and saved concurrently, with each item's
+outcome yielded as soon as it is settled.
+
+Limits (``app.jobs_bulk`` in config.yaml):
+- fetches: ``fetch_concurrency`` in total and ``per_domain_concurrency`` per
+  host, so twenty links to one job board don't hammer it (or get us
+  rate-limited) while links to other hosts proceed;
+- parses: ``llm_concurrency`` ``parse_job`` calls in flight for this request,
+  admitted at ``background`` priority so a user's bulk import never queues
+  ahead of anyone's drafts or single adds (app/llm/admission.py). As for a
+  single add, the heuristic fast path skips the LLM, and an LLM failure
+  falls back to the heuristic parse, upgraded in the background. Items
+  with the same text (after ``parse_cache_key`` normalization) share one
+  parse (whose parse-cache I/O never touches the request's session, which
+  the batch writes below commit on);
+- writes: finished items are saved together — whatever has completed by the
+  time the previous batch is committed, up to ``batch_size`` — one
+  transaction per batch for the ``Job`` and ``Application`` rows.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from fastapi import HTTPException
+from llm_kit import LLMClient
+from sqlalchemy.orm import Session
+
+from app.config import (
+    job_heuristics_fast_path,
+    jobs_bulk_batch_size,
+    jobs_bulk_fetch_concurrency,
+    jobs_bulk_llm_concurrency,
+    jobs_bulk_per_domain_concurrency,
+)
+from app.db.models import Application, Job
+from app.llm.context import llm_context
+from app.llm.schemas import JobModel
+from app.parsing.jobs import fetch_job_text, parse_cache_key, parse_job_or_heuristic
+from app.parsing.upgrade import schedule_parse_upgrade
+from app.schemas import JobCreateRequest, JobOut
+
+logger = logging.getLogger("app.jobs")
+
+
+@dataclass
+class _Outcome:
+    index: int
+    item: JobCreateRequest
+    status: str  # "parsed" (not yet saved), "needs_paste" or "error"
+    raw_text: str | None = None
+    parsed: JobModel | None = None
+    parsed_by: str = "llm"
+    detail: str | None = None
+
+
+def _domain(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host.removeprefix("www.")
+
+
+class _DomainLimiter:
+    def __init__(self, per_domain: int):
+        self._per_domain = per_domain
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def __call__(self, url: str) -> asyncio.Semaphore:
+        return self._semaphores.setdefault(_domain(url), asyncio.Semaphore(self._per_domain))
+
+
+async def ingest_jobs(
+    db: Session, llm: LLMClient, user_id: str, items: list[JobCreateRequest]
+) -> AsyncIterator[dict]:
+    """Yield one result per item, in completion order — ``{"index", "status":
+    "created", "job"}``, ``{"index", "status": "needs_paste", "url"}`` or
+    ``{"index", "status": "error", "detail"}`` — then a summary line with
+    ``"done": true`` and per-status counts. Stopping early (client
+    disconnect) cancels the outstanding items; batches already committed
+    stay."""
+    fetch_slots = asyncio.Semaphore(jobs_bulk_fetch_concurrency())
+    domain_slots = _DomainLimiter(jobs_bulk_per_domain_concurrency())
+    llm_slots = asyncio.Semaphore(jobs_bulk_llm_concurrency())
+    finished: asyncio.Queue[_Outcome] = asyncio.Queue()
+    fast_path = job_heuristics_fast_path()
+    parses: dict[str, asyncio.Task[tuple[JobModel, str]]] = {}
+
+    async def parse(raw_text: str) -> tuple[JobModel, str]:
+        async with llm_slots:
+            with llm_context(user_id, "background"):
+                return await parse_job_or_heuristic(llm, raw_text, db, fast_path=fast_path)
+
+    async def process(index: int, item: JobCreateRequest) -> _Outcome:
+        raw_text = item.raw_text
+        if not raw_text:
+            async with fetch_slots, domain_slots(item.url):
+                raw_text = await fetch_job_text(item.url)
+            if raw_text is None:
+                return _Outcome(index, item, "needs_paste")
+        key = parse_cache_key(raw_text)
+        if key not in parses:
+            parses[key] = asyncio.create_task(parse(raw_text))
+        parsed, parsed_by = await asyncio.shield(parses[key])
+        return _Outcome(index, item, "parsed", raw_text=raw_text, parsed=parsed, parsed_by=parsed_by)
+
+    async def run(index: int, item: JobCreateRequest) -> None:
+        try:
+            outcome = await process(index, item)
+        except HTTPException as exc:
+            outcome = _Outcome(index, item, "error", detail=str(exc.detail))
+        except Exception:
+            logger.exception("bulk job ingest: item %d failed", index)
+            outcome = _Outcome(index, item, "error", detail="Internal error")
+        finished.put_nowait(outcome)
+
+    tasks = [asyncio.create_task(run(i, item)) for i, item in enumerate(items)]
+    counts = {"created": 0, "needs_paste": 0, "error": 0}
+    try:
+        remaining = len(items)
+        while remaining:
+            batch = [await finished.get()]
+            while len(batch) < jobs_bulk_batch_size() and not finished.empty():
+                batch.append(finished.get_nowait())
+            remaining -= len(batch)
+            for line in _save_batch(db, llm, user_id, batch):
+                counts[line["status"]] += 1
+                yield line
+    finally:
+        for task in [*tasks, *parses.values()]:
+            task.cancel()
+    logger.info(
+        "bulk job ingest: user=%s items=%d created=%d needs_paste=%d errors=%d",
+        user_id, len(items), counts["created"], counts["needs_paste"], counts["error"],
+    )
+    yield {"done": True, **counts}
+
+
+def _save_batch(db: Session, llm: LLMClient, user_id: str, batch: list[_Outcome]) -> list[dict]:
+    """Create the ``Job`` + ``Application`` rows for the parsed outcomes in
+    one transaction, and schedule the LLM upgrade of heuristic parses;
+    returns the result line for every outcome."""
+    parsed = [o for o in batch if o.status == "parsed"]
+    jobs = [
+        Job(
+            user_id=user_id,
+            source_url=o.item.url,
+            raw_text=o.raw_text,
+            parsed=o.parsed.model_dump(),
+            parsed_by=o.parsed_by,
+        )
+        for o in parsed
+    ]
+    if jobs:
+        try:
+            db.add_all(jobs)
+            db.flush()
+            db.add_all([Application(user_id=user_id, job_id=job.id) for job in jobs])
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("bulk job ingest: saving a batch of %d failed", len(jobs))
+            for outcome in parsed:
+                outcome.status, outcome.detail = "error", "Could not save job"
+            jobs = []
+    for job in jobs:
+        if job.parsed_by == "heuristic":
+            schedule_parse_upgrade(db, llm, job)
+    lines = []
+    saved = iter(jobs)
+    for outcome in batch:
+        if outcome.status == "parsed":
+            job = next(saved)
+            lines.append({
+                "index": outcome.index,
+                "status": "created",
+                "job": JobOut.model_validate(job).model_dump(mode="json"),
+            })
+        elif outcome.status == "needs_paste":
+            lines.append({"index": outcome.index, "status": "needs_paste", "url": outcome.item.url})
+        else:
+            lines.append({"index": outcome.index, "status": "error", "detail": outcome.detail})
+    return lines
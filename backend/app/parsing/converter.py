@@ -0,0 +1,143 @@
+"""Process-wide docling ``DocumentConverter``s for resume extraction.
+
+Building a converter and initializing its PDF pipeline (layout and table
+models) costs far more than converting a one- or two-page resume, so
+converters are built once and reused: up to ``app.docling.converters`` of
+them per process, built on first demand (or by the ``docling`` warm-up,
+app/warmup.py), each used by one conversion at a time. Pipeline options come
+from ``app.docling`` too (``ocr``, ``table_structure``).
+
+Every conversion logs its stages — pipeline init (only on a converter's
+first use of a format), convert, markdown export — and whether it was cold
+or warm.
+"""
+from __future__ import annotations
+
+import io
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Generic, TypeVar
+
+from app.config import docling_converters, docling_ocr, docling_table_structure
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _ms(started: float) -> int:
+    return round((time.perf_counter() - started) * 1000)
+
+
+class ConverterPool(Generic[T]):
+    """Up to ``size`` objects from ``build``, built on first demand and then
+    reused; callers beyond ``size`` wait for one to be released."""
+
+    def __init__(self, build: Callable[[], T], size: int):
+        self._build = build
+        self._size = max(1, size)
+        self._idle: queue.LifoQueue[T] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self.built = 0
+
+    @contextmanager
+    def acquire(self) -> Iterator[T]:
+        item = self._take()
+        try:
+            yield item
+        finally:
+            self._idle.put(item)
+
+    def _take(self) -> T:
+        with self._lock:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                build = self.built < self._size
+                if build:
+                    self.built += 1
+        if not build:
+            return self._idle.get()
+        try:
+            return self._build()
+        except BaseException:
+            with self._lock:
+                self.built -= 1
+            raise
+
+
+class DoclingConverter:
+    """One configured ``DocumentConverter`` plus the formats whose pipeline
+    it has initialized."""
+
+    def __init__(self):
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import PdfPipelineOptions
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+
+        started = time.perf_counter()
+        options = PdfPipelineOptions(do_ocr=docling_ocr(), do_table_structure=docling_table_structure())
+        self._formats = {"pdf": InputFormat.PDF, "docx": InputFormat.DOCX}
+        self._converter = DocumentConverter(
+            allowed_formats=list(self._formats.values()),
+            format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=options)},
+        )
+        self._ready: set[str] = set()
+        logger.info(
+            "docling converter built: ocr=%s table_structure=%s [%dms]",
+            options.do_ocr, options.do_table_structure, _ms(started),
+        )
+
+    def prepare(self, fmt: str) -> int | None:
+        """Initialize the pipeline for ``fmt`` if not yet done; the time it
+        took, or None if it was already warm."""
+        if fmt in self._ready:
+            return None
+        started = time.perf_counter()
+        self._converter.initialize_pipeline(self._formats[fmt])
+        self._ready.add(fmt)
+        return _ms(started)
+
+    def to_markdown(self, data: bytes, fmt: str) -> str:
+        from docling.datamodel.base_models import DocumentStream
+
+        init_ms = self.prepare(fmt)
+        started = time.perf_counter()
+        result = self._converter.convert(DocumentStream(name=f"resume.{fmt}", stream=io.BytesIO(data)))
+        convert_ms = _ms(started)
+        started = time.perf_counter()
+        text = result.document.export_to_markdown()
+        logger.info(
+            "docling %s (%s): init=%dms convert=%dms export=%dms",
+            fmt, "warm" if init_ms is None else "cold", init_ms or 0, convert_ms, _ms(started),
+        )
+        return text
+
+
+_pool: ConverterPool[DoclingConverter] | None = None
+_pool_lock = threading.Lock()
+
+
+def _converters() -> ConverterPool[DoclingConverter]:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConverterPool(DoclingConverter, docling_converters())
+        return _pool
+
+
+def docling_markdown(data: bytes, fmt: str) -> str:
+    """PDF/DOCX bytes → markdown on a pooled converter."""
+    with _converters().acquire() as converter:
+        return converter.to_markdown(data, fmt)
+
+
+def warm_up_converter() -> None:
+    """Build a pooled converter and initialize its PDF pipeline."""
+    with _converters().acquire() as converter:
+        init_ms = converter.prepare("pdf")
+    logger.info("docling warm-up: pdf pipeline %s", "already warm" if init_ms is None else f"[{init_ms}ms]")
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from fastapi import Request
+
+from app.parsing.pool import ExtractionPool
+
+
+def get_extraction_pool(request: Request) -> ExtractionPool:
+    return request.app.state.extraction_pool
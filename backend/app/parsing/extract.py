@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import io
 import logging
 import re
 
 from fastapi import HTTPException
 
+from app.parsing.converter import docling_markdown, warm_up_converter
+
 logger = logging.getLogger(__name__)
 
 _MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10 MB
@@ -33,15 +34,22 @@ def _strip_latex(text: str) -> str:
 def _extract_with_docling(data: bytes, fmt: str) -> str:
     """Convert PDF/DOCX bytes to markdown via docling.
 
-    Feeds docling an in-memory ``DocumentStream`` (no temp file).
+    Feeds docling an in-memory ``DocumentStream`` (no temp file) on a pooled,
+    already-initialized converter (app/parsing/converter.py).
     """
-    from docling.datamodel.base_models import DocumentStream
-    from docling.document_converter import DocumentConverter
+    return docling_markdown(data, fmt)
+
 
-    converter = DocumentConverter()
-    source = DocumentStream(name=f"resume.{fmt}", stream=io.BytesIO(data))
-    result = converter.convert(source)
-    return result.document.export_to_markdown()
+def warm_up_docling() -> bool:
+    """Build the pooled docling converter and load its PDF pipeline (layout
+    models) ahead of the first upload — see ``app.warmup``. Returns False if
+    docling isn't installed."""
+    try:
+        import docling  # noqa: F401
+    except ImportError:
+        return False
+    warm_up_converter()
+    return True
 
 
 def extract_text(data: bytes, fmt: str) -> str:
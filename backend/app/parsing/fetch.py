@@ -0,0 +1,93 @@
+"""Non-blocking job-page fetching for ``fetch_job_text``.
+
+One pooled ``httpx.AsyncClient`` is shared by every fetch in the process
+(connections to a job board are reused across a bulk import), created on
+first use and closed by the lifespan. Limits come from ``app.job_fetch`` in
+config.yaml: connect and overall timeouts, a redirect cap, and a body-size
+cap — a page that streams past ``max_bytes`` is abandoned rather than
+buffered. HTML → text extraction (trafilatura, CPU-bound lxml work) runs on
+a small dedicated thread pool so it never blocks the event loop or competes
+with ``asyncio.to_thread`` callers for the default executor.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from app.config import (
+    job_fetch_connect_timeout_s,
+    job_fetch_extract_workers,
+    job_fetch_max_bytes,
+    job_fetch_max_connections,
+    job_fetch_max_redirects,
+    job_fetch_timeout_s,
+)
+
+logger = logging.getLogger("app.jobs")
+
+_USER_AGENT = "Mozilla/5.0 (compatible; hirable job fetcher)"
+
+_client: httpx.AsyncClient | None = None
+_extract_pool: ThreadPoolExecutor | None = None
+
+
+def http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(job_fetch_timeout_s(), connect=job_fetch_connect_timeout_s()),
+            follow_redirects=True,
+            max_redirects=job_fetch_max_redirects(),
+            limits=httpx.Limits(max_connections=job_fetch_max_connections()),
+            headers={"User-Agent": _USER_AGENT, "Accept": "text/html,application/xhtml+xml"},
+        )
+    return _client
+
+
+async def fetch_html(url: str) -> bytes | None:
+    """The body of a successful (2xx) response for ``url``, or None if the
+    request fails, times out, is refused, or exceeds ``max_bytes``."""
+    max_bytes = job_fetch_max_bytes()
+    try:
+        async with asyncio.timeout(job_fetch_timeout_s()):
+            async with http_client().stream("GET", url) as response:
+                if not response.is_success:
+                    logger.info("job fetch: HTTP %d url=%s", response.status_code, url)
+                    return None
+                if int(response.headers.get("content-length") or 0) > max_bytes:
+                    logger.info("job fetch: body over %d bytes url=%s", max_bytes, url)
+                    return None
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) > max_bytes:
+                        logger.info("job fetch: body over %d bytes url=%s", max_bytes, url)
+                        return None
+                return bytes(body)
+    except (httpx.HTTPError, TimeoutError) as exc:
+        logger.info("job fetch: %s url=%s", type(exc).__name__, url)
+        return None
+
+
+async def run_extraction(fn, *args, **kwargs):
+    """Run blocking extraction ``fn`` on the extraction thread pool."""
+    global _extract_pool
+    if _extract_pool is None:
+        _extract_pool = ThreadPoolExecutor(
+            max_workers=job_fetch_extract_workers(), thread_name_prefix="job-extract"
+        )
+    return await asyncio.get_running_loop().run_in_executor(_extract_pool, lambda: fn(*args, **kwargs))
+
+
+async def aclose() -> None:
+    """Close the shared client and extraction pool (lifespan shutdown)."""
+    global _client, _extract_pool
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if _extract_pool is not None:
+        _extract_pool.shutdown(wait=False, cancel_futures=True)
+        _extract_pool = None
@@ -0,0 +1,210 @@
+"""LLM-free job-posting extraction: a provisional ``JobModel`` in
+milliseconds, for the fast path of ``POST /api/jobs``
+(``app.job_heuristics.fast_path``). app/parsing/upgrade.py replaces it with
+the ``parse_job`` result once that completes.
+
+Deliberately shallow and deterministic: label lines ("Location: ...") and
+the first line for title/company/location, section headings to route
+bullets into responsibilities / must_have / nice_to_have, and a curated
+lexicon for keywords. Fields that need judgement (why_opened_guess,
+company_type, team_*) stay empty rather than guessed.
+``backend/scripts/bench_job_heuristics.py`` scores it against stored LLM
+parses.
+"""
+from __future__ import annotations
+
+import re
+
+from app.llm.schemas import JobModel
+
+_MAX_ITEMS = 15
+_MAX_ITEM_CHARS = 300
+_MAX_KEYWORDS = 25
+
+_BULLET = re.compile(r"^\s*(?:[-*+•·▪◦‣–—]|\d{1,2}[.)])\s+(.*\S)")
+
+# Checked in order — "preferred qualifications" is nice-to-have, not must-have.
+_SECTION_HEADINGS: list[tuple[str, re.Pattern[str]]] = [
+    ("nice_to_have", re.compile(
+        r"nice[- ]to[- ]haves?|preferred|bonus|desired|good to have|extra credit|plus(es)?\b", re.I
+    )),
+    ("must_have", re.compile(
+        r"requirements?|qualifications?|must[- ]haves?|what you('|’)?ll (bring|need)|"
+        r"what we('|’)?re looking for|about you|who you are|you have|skills|experience", re.I
+    )),
+    ("responsibilities", re.compile(
+        r"responsibilit|what you('|’)?ll (do|be doing)|what you will do|the role|your role|"
+        r"day[- ]to[- ]day|in this role|duties|your impact|you will", re.I
+    )),
+    ("other", re.compile(
+        r"about (us|the company|the team)|who we are|benefits|perks|compensation|salary|"
+        r"what we offer|equal opportunity|how to apply", re.I
+    )),
+]
+
+_LABELS = {
+    "title": re.compile(r"^\s*(?:job title|title|position|role)\s*[:|]\s*(.+)$", re.I),
+    "company": re.compile(r"^\s*(?:company|employer|organi[sz]ation)\s*[:|]\s*(.+)$", re.I),
+    "location": re.compile(r"^\s*(?:location|based in|office|where)\s*[:|]\s*(.+)$", re.I),
+}
+_LABELS_ANY = re.compile("|".join(p.pattern for p in _LABELS.values()), re.I)
+_TITLE_AT_COMPANY = re.compile(r"^(.{3,80}?)\s+(?:at|@|[-–—|])\s+(.{2,60})$")
+_ABOUT_COMPANY = re.compile(r"^\s*about\s+(?!us\b|the\b|you\b|this\b|our\b)(.{2,40}?)\s*:?\s*$", re.I)
+_COMPANY_IS = re.compile(r"^((?:[A-Z][\w&.'-]*\s?){1,4}) is (?:a|an|the)\b")
+_REMOTE = re.compile(r"\b(?:fully remote|remote[- ]first|100% remote|remote)\b", re.I)
+
+_SENIORITY: list[tuple[str, re.Pattern[str]]] = [
+    ("principal", re.compile(r"\bprincipal\b", re.I)),
+    ("staff", re.compile(r"\bstaff\b", re.I)),
+    ("director", re.compile(r"\b(director|head of|vp)\b", re.I)),
+    ("manager", re.compile(r"\bmanager\b", re.I)),
+    ("lead", re.compile(r"\blead\b", re.I)),
+    ("senior", re.compile(r"\b(senior|sr\.?)\b", re.I)),
+    ("junior", re.compile(r"\b(junior|jr\.?|entry[- ]level|graduate|intern)\b", re.I)),
+    ("mid", re.compile(r"\bmid[- ]?level\b", re.I)),
+]
+
+# Canonical spelling → matched case-insensitively as a whole word, except the
+# entries in _CASE_SENSITIVE (common English words otherwise).
+_LEXICON = [
+    # languages
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "Golang", "Rust", "C++", "C#", "Ruby",
+    "PHP", "Scala", "Kotlin", "Swift", "Objective-C", "Elixir", "Haskell", "Clojure", "SQL",
+    "Bash", "MATLAB", "Julia", "Dart", "Solidity",
+    # frontend / backend frameworks
+    "React", "React Native", "Next.js", "Vue", "Angular", "Svelte", "Node.js", "Express",
+    "Django", "Flask", "FastAPI", "Spring", "Spring Boot", "Rails", ".NET", "GraphQL", "gRPC",
+    "REST", "Redux", "Tailwind", "HTML", "CSS", "Flutter",
+    # data / ML
+    "PostgreSQL", "MySQL", "SQLite", "MongoDB", "Redis", "Cassandra", "DynamoDB", "Elasticsearch",
+    "Snowflake", "BigQuery", "Redshift", "Databricks", "Spark", "Hadoop", "Kafka", "Airflow",
+    "dbt", "Flink", "Pandas", "NumPy", "PyTorch", "TensorFlow", "JAX", "scikit-learn", "Keras",
+    "Hugging Face", "LLM", "LLMs", "NLP", "Computer Vision", "Machine Learning", "Deep Learning",
+    "MLOps", "ETL", "Data Warehousing", "Tableau", "Looker", "Power BI", "Statistics",
+    # infrastructure
+    "AWS", "GCP", "Azure", "Kubernetes", "Docker", "Terraform", "Ansible", "Helm", "Linux",
+    "CI/CD", "GitHub Actions", "Jenkins", "Prometheus", "Grafana", "Datadog", "Nginx",
+    "Microservices", "Distributed Systems", "Serverless", "Lambda", "Observability", "SRE",
+    "DevOps", "Networking", "Security", "OAuth",
+    # practice / domain
+    "Agile", "Scrum", "TDD", "System Design", "API Design", "Mobile", "iOS", "Android",
+    "Embedded", "Payments", "Fintech", "E-commerce", "SaaS", "B2B", "Product Management",
+    "Figma", "UX", "A/B Testing", "Experimentation", "Git",
+]
+_CASE_SENSITIVE = {"Go", "Spring", "Express", "REST", "Lambda", "Security", "Mobile", "Networking"}
+
+
+def _term_pattern(term: str) -> re.Pattern[str]:
+    flags = 0 if term in _CASE_SENSITIVE else re.I
+    return re.compile(r"(?<![\w+#.])" + re.escape(term) + r"(?![\w+#]|\.\w)", flags)
+
+
+_KEYWORD_PATTERNS = [(term, _term_pattern(term)) for term in _LEXICON]
+
+
+def _clean(line: str) -> str:
+    return re.sub(r"\s+", " ", line.strip(" \t#*_|:")).strip()
+
+
+def _heading_kind(line: str) -> str | None:
+    """The section a heading line opens, "other" for an unrecognised
+    heading, or None if ``line`` is not a heading."""
+    if _BULLET.match(line):
+        return None
+    text = _clean(line)
+    if not text or len(text.split()) > 8:
+        return None
+    explicit = line.rstrip().endswith(":") or line.lstrip().startswith("#") or text.isupper()
+    for kind, pattern in _SECTION_HEADINGS:
+        if pattern.search(text) and (explicit or len(text.split()) <= 5):
+            return kind
+    return "other" if explicit and not _LABELS_ANY.match(line) else None
+
+
+def _sections(lines: list[str]) -> dict[str, list[str]]:
+    """Route each bullet (or, in a section without bullets, each short line)
+    to the section its nearest heading opens; bullets before any heading go
+    to "unsectioned"."""
+    blocks: list[tuple[str, list[str]]] = [("unsectioned", [])]
+    for line in lines:
+        kind = _heading_kind(line)
+        if kind is not None:
+            blocks.append((kind, []))
+        elif line.strip():
+            blocks[-1][1].append(line)
+    sections: dict[str, list[str]] = {}
+    for kind, block in blocks:
+        bullets = [m.group(1) for m in map(_BULLET.match, block) if m]
+        if not bullets and kind != "unsectioned":
+            bullets = [line for line in block if len(line) <= _MAX_ITEM_CHARS]
+        items = sections.setdefault(kind, [])
+        items.extend(_clean(b)[:_MAX_ITEM_CHARS] for b in bullets if _clean(b))
+    return sections
+
+
+def _label(lines: list[str], field: str) -> str:
+    for line in lines:
+        match = _LABELS[field].match(line)
+        if match:
+            return _clean(match.group(1))
+    return ""
+
+
+def _title_and_company(lines: list[str]) -> tuple[str, str]:
+    title, company = _label(lines, "title"), _label(lines, "company")
+    first = next((_clean(line) for line in lines if _clean(line)), "")
+    if first and len(first.split()) <= 12 and not first.endswith(".") and _heading_kind(first) is None:
+        match = _TITLE_AT_COMPANY.match(first)
+        if match:
+            title = title or match.group(1).strip()
+            company = company or match.group(2).strip()
+        elif not _LABELS_ANY.match(first):
+            title = title or first
+    if not company:
+        for line in lines:
+            match = _ABOUT_COMPANY.match(line) or _COMPANY_IS.match(line.strip())
+            if match:
+                company = _clean(match.group(1))
+                break
+    return title, company
+
+
+def _location(lines: list[str], text: str) -> str:
+    location = _label(lines, "location")
+    if location:
+        return "Remote" if location.lower() in {"remote", "anywhere", "fully remote"} else location
+    return "Remote" if _REMOTE.search(text) else ""
+
+
+def _keywords(text: str) -> list[str]:
+    found = [(m.start(), term) for term, pattern in _KEYWORD_PATTERNS if (m := pattern.search(text))]
+    return [term for _, term in sorted(found)][:_MAX_KEYWORDS]
+
+
+def _seniority(title: str) -> str:
+    return next((level for level, pattern in _SENIORITY if pattern.search(title)), "")
+
+
+def heuristic_parse_job(raw_text: str) -> JobModel:
+    """A provisional ``JobModel`` for ``raw_text`` — no LLM, no I/O."""
+    lines = raw_text.splitlines()
+    sections = _sections(lines)
+    title, company = _title_and_company(lines)
+    must_have = sections.get("must_have", [])
+    nice_to_have = sections.get("nice_to_have", [])
+    # Bullets outside any heading: only the ones that say what they are.
+    for item in sections.get("unsectioned", []):
+        if re.search(r"\b(preferred|nice to have|bonus|a plus)\b", item, re.I):
+            nice_to_have.append(item)
+        elif re.search(r"\b(required|must|\d+\+? years)\b", item, re.I):
+            must_have.append(item)
+    return JobModel(
+        company=company,
+        title=title,
+        location=_location(lines, raw_text),
+        responsibilities=sections.get("responsibilities", [])[:_MAX_ITEMS],
+        must_have=must_have[:_MAX_ITEMS],
+        nice_to_have=nice_to_have[:_MAX_ITEMS],
+        keywords=_keywords(raw_text),
+        seniority=_seniority(title),
+    )
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timedelta, timezone
 
 import trafilatura
 from fastapi import HTTPException
 from llm_kit import LLMClient, Message
 from llm_kit.errors import LLMError, ValidationError
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
 
+from app.config import job_parse_cache_max_entries, job_parse_cache_ttl_days, llm_model
+from app.db.models import JobParseCache
+from app.llm.context import llm_context
 from app.llm.schemas import JobModel
+from app.metrics import HitCounter
+from app.parsing.fetch import fetch_html, run_extraction
+from app.parsing.heuristic import heuristic_parse_job
+from app.parsing.memo import parse_key, prompt_version
 
 logger = logging.getLogger("app.jobs")
 
@@ -31,20 +41,98 @@ Rules:
 """
 
 
-def fetch_job_text(url: str) -> str | None:
+_PROMPT_VERSION = prompt_version(_SYSTEM_PROMPT, JobModel)
+
+parse_cache_counter = HitCounter()
+
+
+def parse_cache_key(raw_text: str, model: str | None = None) -> str:
+    return parse_key(raw_text, _PROMPT_VERSION, model)
+
+
+def _cache_session(db: Session) -> Session:
+    """A short-lived session on ``db``'s engine for parse-cache I/O, so a
+    memo lookup or write never commits or rolls back the caller's work."""
+    return Session(bind=db.get_bind(), autoflush=False)
+
+
+def _cached_parse(db: Session, key: str) -> JobModel | None:
+    with _cache_session(db) as cache_db:
+        row = cache_db.get(JobParseCache, key)
+        if row is None:
+            return None
+        now = datetime.now(timezone.utc)
+        created_at = row.created_at if row.created_at.tzinfo else row.created_at.replace(tzinfo=timezone.utc)
+        if now - created_at > timedelta(days=job_parse_cache_ttl_days()):
+            cache_db.delete(row)
+            cache_db.commit()
+            return None
+        row.hits += 1
+        row.last_used_at = now
+        cache_db.commit()
+        return JobModel.model_validate(row.parsed)
+
+
+def _store_parse(db: Session, key: str, parsed: JobModel) -> None:
+    with _cache_session(db) as cache_db:
+        cache_db.merge(
+            JobParseCache(
+                key=key,
+                model=llm_model(),
+                prompt_version=_PROMPT_VERSION,
+                parsed=parsed.model_dump(),
+            )
+        )
+        cache_db.flush()
+        cutoff = datetime.now(timezone.utc) - timedelta(days=job_parse_cache_ttl_days())
+        cache_db.execute(delete(JobParseCache).where(JobParseCache.created_at < cutoff))
+        overflow = cache_db.scalars(
+            select(JobParseCache.key)
+            .order_by(JobParseCache.last_used_at.desc())
+            .offset(job_parse_cache_max_entries())
+        ).all()
+        if overflow:
+            cache_db.execute(delete(JobParseCache).where(JobParseCache.key.in_(overflow)))
+        cache_db.commit()
+
+
+def peek_job_parse(db: Session, raw_text: str) -> JobModel | None:
+    """The memoized LLM parse of ``raw_text``, if there is one — for the
+    heuristic fast path, which only calls ``parse_job`` (recording the miss)
+    in the background upgrade."""
+    cached = _cached_parse(db, parse_cache_key(raw_text))
+    if cached is not None:
+        parse_cache_counter.record(hit=True)
+    return cached
+
+
+def check_job_text_size(raw_text: str) -> None:
+    if len(raw_text) > _MAX_RAW_TEXT_CHARS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Job posting text too large (max {_MAX_RAW_TEXT_CHARS} characters)",
+        )
+
+
+async def fetch_job_text(url: str) -> str | None:
     """Fetch and extract the main content of a job posting URL via trafilatura.
 
     Returns None on any failure — blocked response, empty body, or extraction
     producing no usable text. Never raises: many job boards block bots (403,
     empty body, JS-rendered shell), and that is an expected, not exceptional,
     outcome here. The caller treats None as the `needs_paste` signal.
+
+    Non-blocking: the page is fetched on the shared async HTTP client and
+    extracted on a worker thread (app/parsing/fetch.py).
     """
     try:
-        html = trafilatura.fetch_url(url)
+        html = await fetch_html(url)
         if not html:
             logger.info("job fetch: blocked/empty response url=%s", url)
             return None
-        text = trafilatura.extract(html, url=url, include_comments=False, include_tables=False)
+        text = await run_extraction(
+            trafilatura.extract, html, url=url, include_comments=False, include_tables=False
+        )
         if not text or not text.strip():
             logger.info("job fetch: extraction produced no text url=%s", url)
             return None
@@ -54,27 +142,38 @@ def fetch_job_text(url: str) -> str | None:
         return None
 
 
-async def parse_job(llm: LLMClient, raw_text: str) -> JobModel:
+async def parse_job(llm: LLMClient, raw_text: str, db: Session | None = None) -> JobModel:
     """Call the LLM to extract a structured JobModel from raw job-posting text.
 
+    With ``db``, results are memoized in ``job_parse_cache`` keyed by the
+    normalized text, the model and the prompt version (``app.job_parse_cache``
+    in config.yaml sets the TTL and entry cap), so re-adding a posting — by
+    the same or another user — skips the LLM call. Only ``db``'s engine is
+    used: cache reads and writes run on their own short-lived session and
+    never commit or roll back the caller's.
+
     JobModel is flat (no nested list-of-object fields), so a single
     llm.invoke() call is expected to work — unlike parse_resume()'s
     Part1/Part2 split, which was needed only because of ProfileModel's nested
     list-of-object fields. See JobModel's docstring if this ever 400s.
     """
-    if len(raw_text) > _MAX_RAW_TEXT_CHARS:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Job posting text too large (max {_MAX_RAW_TEXT_CHARS} characters)",
-        )
+    check_job_text_size(raw_text)
+    key = parse_cache_key(raw_text) if db is not None else None
+    if key is not None:
+        cached = _cached_parse(db, key)
+        parse_cache_counter.record(hit=cached is not None)
+        if cached is not None:
+            logger.info("job parse: cache hit key=%s", key[:12])
+            return cached
     try:
-        result = await llm.invoke(
-            [
-                Message.system(_SYSTEM_PROMPT),
-                Message.user(f"Parse the following job posting:\n\n{raw_text}"),
-            ],
-            response_model=JobModel,
-        )
+        with llm_context(site="parse_job"):
+            result = await llm.invoke(
+                [
+                    Message.system(_SYSTEM_PROMPT),
+                    Message.user(f"Parse the following job posting:\n\n{raw_text}"),
+                ],
+                response_model=JobModel,
+            )
     except ValidationError as exc:
         raise HTTPException(
             status_code=502, detail=f"LLM returned malformed job data: {exc}"
@@ -83,4 +182,36 @@ async def parse_job(llm: LLMClient, raw_text: str) -> JobModel:
         raise HTTPException(
             status_code=502, detail=f"LLM error during job parsing: {exc}"
         ) from exc
+    if key is not None:
+        try:
+            _store_parse(db, key, result.parsed)
+        except Exception:
+            # Only the memo is lost; the parse itself is good.
+            logger.exception("job parse: could not cache key=%s", key[:12])
     return result.parsed
+
+
+async def parse_job_or_heuristic(
+    llm: LLMClient, raw_text: str, db: Session, *, fast_path: bool
+) -> tuple[JobModel, str]:
+    """``(parsed, parsed_by)`` for a new job. With ``fast_path``
+    (``app.job_heuristics.fast_path``) a cached LLM parse or else
+    ``heuristic_parse_job`` — no LLM call. Otherwise ``parse_job``, falling
+    back to ``heuristic_parse_job`` when it fails on an LLM error (provider
+    outage, unusable output) so the job can still be saved. A
+    ``"heuristic"`` result is for the caller to hand to
+    ``schedule_parse_upgrade`` (app/parsing/upgrade.py), which retries the
+    LLM with backoff."""
+    if fast_path:
+        check_job_text_size(raw_text)
+        parsed = peek_job_parse(db, raw_text)
+        if parsed is not None:
+            return parsed, "llm"
+        return heuristic_parse_job(raw_text), "heuristic"
+    try:
+        return await parse_job(llm, raw_text, db), "llm"
+    except HTTPException as exc:
+        if not isinstance(exc.__cause__, LLMError):
+            raise
+        logger.warning("job parse failed, using heuristic parse: %s", exc.detail)
+        return heuristic_parse_job(raw_text), "heuristic"
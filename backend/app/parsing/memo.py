@@ -0,0 +1,37 @@
+"""Content keys for memoized LLM parses.
+
+A parse is a function of the input text, the model and the prompt/output
+schema, so that triple is what the key hashes. Text is normalized first: the
+same posting or resume reaching us twice usually differs only in Unicode
+forms and whitespace.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import unicodedata
+
+from pydantic import BaseModel
+
+from app.config import llm_model
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(raw_text: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", raw_text)).strip()
+
+
+def prompt_version(system_prompt: str, *schemas: type[BaseModel]) -> str:
+    """Short hash of a prompt and its response models; changes whenever
+    either does, so parses from an older prompt are never reused."""
+    material = system_prompt + "".join(
+        json.dumps(schema.model_json_schema(), sort_keys=True) for schema in schemas
+    )
+    return hashlib.sha256(material.encode()).hexdigest()[:12]
+
+
+def parse_key(raw_text: str, version: str, model: str | None = None) -> str:
+    material = f"{model or llm_model()}\0{version}\0{normalize_text(raw_text)}"
+    return hashlib.sha256(material.encode()).hexdigest()
@@ -0,0 +1,195 @@
+"""Process pool for resume text extraction (``extract_text``).
+
+Docling's PDF/DOCX conversion is seconds of CPU-bound work. Run inline in
+``upload_resume`` it froze the event loop — every other request and chat
+websocket on the worker — for the whole conversion. It now runs in separate
+processes owned by this pool:
+
+- **Parallel.** ``app.extraction.workers`` processes, spawned on first use
+  (or by the ``docling`` warm-up), each with its own pooled, warm docling
+  converter (app/parsing/converter.py), so concurrent uploads use separate
+  cores.
+- **Bounded.** At most ``workers + max_queue`` extractions are admitted at
+  once; anything beyond that is rejected with ``ExtractionPoolBusy`` (→ 503)
+  instead of piling up behind a burst of uploads.
+- **Recoverable.** A worker that dies (e.g. killed for memory on a
+  pathological file) breaks the executor; it is replaced, and only the
+  extractions in flight at the time fail — with a retryable 503, since the
+  crash may have been caused by any one of them.
+
+``upload_resume`` only sends PDF/DOCX here; ``.tex`` stripping is cheap
+enough to run inline.
+
+Extraction errors cross the process boundary as plain tuples, not
+``HTTPException``s (which do not unpickle), and are re-raised here.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import HTTPException
+
+from app.config import extraction_max_queue, extraction_workers
+from app.metrics import RollingSamples
+
+logger = logging.getLogger("app.parsing.pool")
+
+
+class ExtractionPoolBusy(Exception):
+    """Raised when the pool's admission bound is reached."""
+
+
+def _init_worker() -> None:
+    # Spawned workers start without the API process's logging setup; give
+    # them the same format so docling stage timings reach the terminal.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)-7s %(name)s | %(message)s",
+        datefmt="%H:%M:%S",
+    )
+
+
+def _extract(data: bytes, fmt: str) -> tuple:
+    """Worker side of ``extract``: ``("ok", text)`` or ``("error", status,
+    detail)``."""
+    from app.parsing.extract import extract_text
+
+    try:
+        return ("ok", extract_text(data, fmt))
+    except HTTPException as exc:
+        return ("error", exc.status_code, exc.detail)
+
+
+def _warm_worker() -> bool:
+    from app.parsing.extract import warm_up_docling
+
+    return warm_up_docling()
+
+
+class ExtractionPool:
+    """Started lazily on first use (or explicitly via ``warm``)."""
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = max(1, workers)
+        self._max_pending = self.workers + max(0, max_queue)
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._closed = False
+        self._pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.restarts = 0
+        self.latency_ms = RollingSamples()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._executor
+
+    def _replace(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not broken or self._closed:
+                return
+            self._executor = None
+            self.restarts += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+        logger.warning("extraction worker died — pool replaced")
+
+    def _submit(self, fn, *args) -> tuple[Future, ProcessPoolExecutor]:
+        with self._lock:
+            if self._closed:
+                raise ExtractionPoolBusy("extraction pool is shut down")
+            if self._pending >= self._max_pending:
+                self.rejected += 1
+                raise ExtractionPoolBusy(f"{self._pending} extractions already queued or running")
+            executor = self._get_executor()
+            self._pending += 1
+        try:
+            try:
+                future = executor.submit(fn, *args)
+            except BrokenProcessPool:  # a worker died since the last extraction
+                self._replace(executor)
+                with self._lock:
+                    executor = self._get_executor()
+                future = executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _f: self._release())
+        return future, executor
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def extract(self, data: bytes, fmt: str) -> str:
+        """``extract_text(data, fmt)`` on a worker process. Raises
+        ``ExtractionPoolBusy`` when the pool is full, a 503 ``HTTPException``
+        if the worker died mid-extraction, and the same ``HTTPException``s as
+        ``extract_text`` otherwise."""
+        started = time.perf_counter()
+        future, executor = self._submit(_extract, data, fmt)
+        try:
+            result = await asyncio.wrap_future(future)
+        except BrokenProcessPool as exc:
+            self.failed += 1
+            self._replace(executor)
+            # Not the file's fault (the crash may have been another upload's):
+            # report it as retryable.
+            raise HTTPException(
+                status_code=503,
+                detail="The extraction worker restarted — try the upload again.",
+                headers={"Retry-After": "1"},
+            ) from exc
+        self.latency_ms.observe((time.perf_counter() - started) * 1000)
+        if result[0] == "error":
+            self.failed += 1
+            raise HTTPException(status_code=result[1], detail=result[2])
+        self.completed += 1
+        return result[1]
+
+    def warm(self) -> bool:
+        """Spawn the workers and load docling in each (best effort: one
+        warm-up task per worker). False if docling isn't installed."""
+        with self._lock:
+            executor = self._get_executor()
+        futures = [executor.submit(_warm_worker) for _ in range(self.workers)]
+        return all(future.result() for future in futures)
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = self._pending
+        return {
+            "workers": self.workers,
+            "started": self._executor is not None,
+            "pending": pending,
+            "max_pending": self._max_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "restarts": self.restarts,
+            "latency_ms": self.latency_ms.summary(),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def build_extraction_pool() -> ExtractionPool:
+    """The app's shared pool, configured from ``app.extraction``."""
+    return ExtractionPool(workers=extraction_workers(), max_queue=extraction_max_queue())
@@ -6,7 +6,9 @@ from fastapi import HTTPException
 from llm_kit import LLMClient, Message
 from llm_kit.errors import LLMError, ValidationError
 
+from app.llm.context import llm_context
 from app.llm.schemas import ProfileModel, ProfileModelPart1, ProfileModelPart2
+from app.parsing.memo import parse_key, prompt_version
 
 _SYSTEM_PROMPT = """You are a resume parser. Extract every piece of information from the resume into the structured JSON schema provided.
 
@@ -35,6 +37,13 @@ Rules:
 - If a field is absent from the resume, leave it as an empty string or empty list. Do NOT fabricate information.
 """
 
+_PROMPT_VERSION = prompt_version(_SYSTEM_PROMPT, ProfileModelPart1, ProfileModelPart2)
+
+
+def resume_parse_key(raw_text: str, model: str | None = None) -> str:
+    """Memo key for ``parse_resume`` output (see ``Resume.parse_key``)."""
+    return parse_key(raw_text, _PROMPT_VERSION, model)
+
 
 async def parse_resume(llm: LLMClient, raw_text: str) -> ProfileModel:
     """Call the LLM to extract a structured ProfileModel from raw resume text.
@@ -49,14 +58,15 @@ async def parse_resume(llm: LLMClient, raw_text: str) -> ProfileModel:
     ``education`` + ``publications`` — well under the limit with margin to spare.
     """
     user_msg = Message.user(f"Parse the following resume:\n\n{raw_text}")
+
+    async def parse_part(site: str, response_model):
+        with llm_context(site=site):
+            return await llm.invoke([Message.system(_SYSTEM_PROMPT), user_msg], response_model=response_model)
+
     try:
         part1_result, part2_result = await asyncio.gather(
-            llm.invoke(
-                [Message.system(_SYSTEM_PROMPT), user_msg], response_model=ProfileModelPart1
-            ),
-            llm.invoke(
-                [Message.system(_SYSTEM_PROMPT), user_msg], response_model=ProfileModelPart2
-            ),
+            parse_part("parse_resume_part1", ProfileModelPart1),
+            parse_part("parse_resume_part2", ProfileModelPart2),
         )
     except ValidationError as exc:
         raise HTTPException(
@@ -0,0 +1,152 @@
+"""Background LLM upgrade of heuristically parsed jobs.
+
+With ``app.job_heuristics.fast_path`` on, ``POST /api/jobs`` saves the job
+with the provisional ``heuristic_parse_job`` result (``parsed_by =
+"heuristic"``) and returns at once; this module then runs ``parse_job`` for
+it at ``background`` priority (app/llm/admission.py) and swaps the result
+in (``parsed_by = "llm"``). Jobs saved with the heuristic parse because
+``parse_job`` failed (fast path or not) are upgraded the same way.
+
+An upgrade that fails on an LLM error — e.g. during a provider outage — is
+retried after each of ``_RETRY_DELAYS_S``; one that still fails, or fails
+for any other reason, leaves the provisional parse in place. A job edited
+by hand (``parsed_by = "user"``) or deleted in the meantime is left alone.
+
+Each upgrade runs on its own session, bound to the same engine as the
+request that scheduled it. Nothing is persisted about pending upgrades;
+instead ``resume`` re-queues every job still on its heuristic parse at
+startup.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from llm_kit import LLMClient
+from llm_kit.errors import LLMError
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import job_heuristics_fast_path
+from app.db.models import Job
+from app.llm.context import llm_context
+from app.parsing.jobs import parse_job
+from app.rendercv.speculative import schedule_pretailoring
+
+logger = logging.getLogger("app.jobs")
+
+# Backoff between attempts of an upgrade that failed on an LLM error.
+_RETRY_DELAYS_S = (30.0, 120.0, 600.0)
+
+
+def _llm_failure(exc: Exception) -> bool:
+    """Whether ``exc`` is (``parse_job``'s 502 for) an LLM error."""
+    return isinstance(exc, LLMError) or isinstance(exc.__cause__, LLMError)
+
+
+class JobParseUpgrader:
+    def __init__(self):
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self.scheduled = 0
+        self.upgraded = 0
+        self.skipped = 0
+        self.retried = 0
+        self.failed = 0
+
+    def schedule(self, db: Session, llm: LLMClient, job: Job) -> None:
+        job_id = job.id
+        if job_id in self._tasks:
+            return
+        task = asyncio.create_task(self._upgrade(db.get_bind(), llm, job_id, job.user_id, job.raw_text))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job_id, None))
+        self.scheduled += 1
+
+    def resume(self, db: Session, llm: LLMClient) -> int:
+        """Schedule an upgrade for every job still on its heuristic parse,
+        e.g. left over from before a restart. How many were scheduled."""
+        jobs = db.scalars(select(Job).where(Job.parsed_by == "heuristic")).all()
+        for job in jobs:
+            self.schedule(db, llm, job)
+        if jobs:
+            logger.info("job parse upgrades resumed: %d jobs", len(jobs))
+        return len(jobs)
+
+    async def _parse(self, llm: LLMClient, job_id: str, user_id: str, raw_text: str, db: Session):
+        for attempt, delay in enumerate((*_RETRY_DELAYS_S, None), start=1):
+            try:
+                with llm_context(user_id, "background"):
+                    return await parse_job(llm, raw_text, db)
+            except Exception as exc:
+                if delay is None or not _llm_failure(exc):
+                    raise
+                self.retried += 1
+                logger.info(
+                    "job parse upgrade attempt %d failed, retrying in %.0fs: job=%s %s",
+                    attempt, delay, job_id, getattr(exc, "detail", exc),
+                )
+            await asyncio.sleep(delay)
+
+    async def _upgrade(self, bind: Engine, llm: LLMClient, job_id: str, user_id: str, raw_text: str) -> None:
+        db = Session(bind=bind, autoflush=False)
+        try:
+            parsed = await self._parse(llm, job_id, user_id, raw_text, db)
+            job = db.get(Job, job_id)
+            if job is None or job.parsed_by != "heuristic":
+                self.skipped += 1
+                return
+            job.parsed = parsed.model_dump()
+            job.parsed_by = "llm"
+            job.updated_at = datetime.now(timezone.utc)
+            db.commit()
+            self.upgraded += 1
+            logger.info("job parse upgraded: job=%s company=%r title=%r", job_id, parsed.company, parsed.title)
+            schedule_pretailoring(db, llm, job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.failed += 1
+            logger.info(
+                "job parse upgrade failed: job=%s %s", job_id, getattr(exc, "detail", exc)
+            )
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": job_heuristics_fast_path(),
+            "pending": len(self._tasks),
+            "scheduled": self.scheduled,
+            "upgraded": self.upgraded,
+            "skipped": self.skipped,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+    def shutdown(self) -> None:
+        global _active
+        if _active is self:
+            _active = None
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._tasks.clear()
+
+
+_active: JobParseUpgrader | None = None
+
+
+def build_job_parse_upgrader() -> JobParseUpgrader:
+    global _active
+    _active = JobParseUpgrader()
+    return _active
+
+
+def schedule_parse_upgrade(db: Session, llm: LLMClient, job: Job) -> bool:
+    """Queue the LLM parse that replaces ``job``'s heuristic one. False (and
+    nothing queued) outside the app."""
+    if _active is None:
+        return False
+    _active.schedule(db, llm, job)
+    return True
@@ -0,0 +1,109 @@
+"""Batch compile: many documents → one streamed ZIP.
+
+Compiles fan out over the shared compile pool, at most ``pool.workers`` at a
+time and at ``background`` priority — a worker goes to any waiting
+interactive compile (a preview, a single PDF) first — and each finished PDF is written into the archive and flushed to the
+client as soon as it completes (completion order, not request order). The
+archive is written to a non-seekable sink, so ``zipfile`` emits data
+descriptors instead of seeking back — memory stays bounded by the window of
+in-flight PDFs regardless of batch size.
+
+A failed item becomes ``<name>.error.json`` carrying ``CompileError.stage``
+and ``errors``; a trailing ``manifest.json`` lists every item's outcome.
+"""
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import zipfile
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from app.rendercv.compile import CompileError
+from app.rendercv.pool import CompilePool, CompilePoolBusy
+
+# A batch yields to interactive compiles: items are submitted as background
+# work, and when the pool is at its admission bound the batch waits and
+# retries rather than failing the item.
+_BUSY_RETRY_S = 0.25
+_BUSY_MAX_RETRIES = 120
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    document_id: str
+    name: str  # archive file stem, unique within the batch
+    source_text: str
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable buffer drained after every archive entry."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _compile(pool: CompilePool, source_text: str) -> bytes:
+    for _ in range(_BUSY_MAX_RETRIES):
+        try:
+            return await asyncio.wrap_future(pool.submit(source_text, background=True))
+        except CompilePoolBusy:
+            await asyncio.sleep(_BUSY_RETRY_S)
+    raise CompileError("render", ["Compile service is busy"])
+
+
+async def stream_compile_zip(pool: CompilePool, items: list[BatchItem]) -> AsyncIterator[bytes]:
+    sink = _ChunkSink()
+    archive = zipfile.ZipFile(sink, "w")
+    manifest: list[dict] = []
+    remaining = iter(items)
+    in_flight: dict[asyncio.Task, BatchItem] = {}
+
+    def _launch() -> None:
+        while len(in_flight) < pool.workers:
+            item = next(remaining, None)
+            if item is None:
+                return
+            in_flight[asyncio.ensure_future(_compile(pool, item.source_text))] = item
+
+    try:
+        _launch()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = in_flight.pop(task)
+                entry = {"document_id": item.document_id}
+                try:
+                    pdf_bytes = task.result()
+                except CompileError as exc:
+                    error = {"document_id": item.document_id, "stage": exc.stage, "errors": exc.errors}
+                    entry.update(status="error", file=f"{item.name}.error.json", stage=exc.stage)
+                    archive.writestr(entry["file"], json.dumps(error, indent=2))
+                else:
+                    entry.update(status="ok", file=f"{item.name}.pdf")
+                    archive.writestr(entry["file"], pdf_bytes)  # PDFs are already compressed
+                manifest.append(entry)
+                yield sink.drain()
+            _launch()
+
+        archive.writestr(
+            "manifest.json", json.dumps(manifest, indent=2), compress_type=zipfile.ZIP_DEFLATED
+        )
+        archive.close()
+        yield sink.drain()
+    finally:
+        for task in in_flight:  # client went away mid-stream
+            task.cancel()
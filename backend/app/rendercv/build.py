@@ -292,10 +292,13 @@ def build_rendercv_yaml(
     if sections:
         cv["sections"] = sections
 
-    doc: dict = {"cv": cv, "design": {"theme": theme}}
-
+    # Pin the render date so recompiling a saved version later gives the same
+    # PDF (and the same compile-cache key) — see app/rendercv/cache.py.
+    settings: dict = {"current_date": datetime.now(timezone.utc).date().isoformat()}
     bold_keywords = [k for k in job_parsed.get("keywords", []) if k][:_MAX_BOLD_KEYWORDS]
     if bold_keywords:
-        doc["settings"] = {"bold_keywords": bold_keywords}
+        settings["bold_keywords"] = bold_keywords
+
+    doc: dict = {"cv": cv, "design": {"theme": theme}, "settings": settings}
 
     return yaml.safe_dump(doc, sort_keys=False, allow_unicode=True)
@@ -0,0 +1,213 @@
+"""Content-addressed cache for compiled RenderCV artifacts (PDF and PNG bytes).
+
+Compiling depends on the source text, the installed rendercv version and the
+render date: the theme, fonts and every other design choice live inside the
+source's own ``design:`` block, but RenderCV stamps ``settings.current_date``
+(default: today) into the "last updated" note and "present" durations.
+Sources built by app/rendercv/build.py and letter.py pin that date, so for
+them the same bytes in always produce the same PDF out; for a source that
+doesn't (hand-edited, or saved before pinning), today's date is part of the
+key. Saved ``Document`` versions are append-only (see its docstring), so an
+entry for a saved version never goes stale — there is no invalidation, only
+capacity eviction.
+
+Two tiers:
+- an in-process LRU of the most recently served artifacts, and
+- a size-capped on-disk tier under ``app/data/pdf_cache`` that survives
+  restarts, evicted least-recently-used (by mtime, touched on every hit).
+
+The disk tier is the one exception to "no PDFs on disk" (SPEC §2): entries
+are keyed by a hash, not a user or document id, and are purged alongside the
+source rows when a document or user is deleted (see ``discard_sources``).
+Set ``app.rendercv.cache.disk_max_mb: 0`` to keep everything in memory.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+import rendercv
+
+from app.config import (
+    rendercv_cache_disk_max_mb,
+    rendercv_cache_memory_entries,
+    rendercv_preview_ppi,
+    rendercv_thumbnail_ppi,
+)
+from app.db.engine import _DATA_DIR
+
+logger = logging.getLogger("app.rendercv.cache")
+
+_CACHE_DIR = _DATA_DIR / "pdf_cache"
+
+
+_PINNED_DATE = re.compile(r"^\s+current_date:\s*['\"]?\d{4}-\d{2}-\d{2}\b", re.MULTILINE)
+
+
+def pins_current_date(source_text: str) -> bool:
+    """Whether ``source_text`` sets ``settings.current_date`` to a fixed date,
+    i.e. compiles to the same output whatever day it is."""
+    return _PINNED_DATE.search(source_text) is not None
+
+
+def cache_key(source_text: str, kind: str = "pdf") -> str:
+    """Hash of everything a compiled artifact depends on. ``kind`` separates
+    artifact families (PDF vs. anything else derived from the same source)."""
+    render_date = "" if pins_current_date(source_text) else date.today().isoformat()
+    digest = hashlib.sha256()
+    for part in (kind, rendercv.__version__, render_date, source_text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def artifact_kind(fmt: str = "pdf", ppi: float | None = None) -> str:
+    """Cache ``kind`` for one output format/resolution, e.g. "pdf", "png@20"."""
+    return fmt if ppi is None else f"{fmt}@{ppi:g}"
+
+
+class CompileCache:
+    """Thread-safe two-tier LRU. ``directory=None`` or ``disk_max_bytes=0``
+    disables the disk tier."""
+
+    def __init__(self, directory: Path | None, memory_entries: int, disk_max_bytes: int):
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_entries = memory_entries
+        self._dir = directory if disk_max_bytes > 0 else None
+        self._disk_max_bytes = disk_max_bytes
+        self._disk_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self._dir is not None:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(p.stat().st_size for p in self._dir.glob("*/*.bin"))
+
+    def _path(self, key: str) -> Path:
+        assert self._dir is not None
+        return self._dir / key[:2] / f"{key}.bin"
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return data
+            if self._dir is not None:
+                path = self._path(key)
+                try:
+                    data = path.read_bytes()
+                except FileNotFoundError:
+                    data = None
+                if data is not None:
+                    os.utime(path)  # mark recently used for disk eviction
+                    self._remember(key, data)
+                    self.disk_hits += 1
+                    return data
+            self.misses += 1
+            return None
+
+    def contains(self, key: str) -> bool:
+        """Presence check that doesn't count as a lookup or refresh recency."""
+        with self._lock:
+            if key in self._memory:
+                return True
+            return self._dir is not None and self._path(key).exists()
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._remember(key, data)
+            if self._dir is None or len(data) > self._disk_max_bytes:
+                return
+            path = self._path(key)
+            if path.exists():
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)  # atomic — a concurrent reader never sees a partial file
+            self._disk_bytes += len(data)
+            self._evict_disk()
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._dir is not None:
+                path = self._path(key)
+                try:
+                    size = path.stat().st_size
+                    path.unlink()
+                    self._disk_bytes -= size
+                except FileNotFoundError:
+                    pass
+
+    def _remember(self, key: str, data: bytes) -> None:
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        if self._disk_bytes <= self._disk_max_bytes:
+            return
+        entries = sorted(
+            ((p.stat().st_mtime, p.stat().st_size, p) for p in self._dir.glob("*/*.bin")),
+            key=lambda e: e[0],
+        )
+        evicted = 0
+        for _mtime, size, path in entries:
+            if self._disk_bytes <= self._disk_max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._disk_bytes -= size
+            evicted += 1
+        self.evictions += evicted
+        logger.info("pdf cache: evicted %d disk entries (now %d bytes)", evicted, self._disk_bytes)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+                "disk_bytes": self._disk_bytes,
+                "disk_max_bytes": self._disk_max_bytes if self._dir is not None else 0,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_compile_cache() -> CompileCache:
+    return CompileCache(
+        _CACHE_DIR,
+        memory_entries=rendercv_cache_memory_entries(),
+        disk_max_bytes=int(rendercv_cache_disk_max_mb() * 1024 * 1024),
+    )
+
+
+def discard_sources(source_texts: list[str]) -> None:
+    """Drop cached artifacts (PDF, preview and thumbnail PNGs) for deleted
+    documents' sources."""
+    cache = get_compile_cache()
+    kinds = [
+        artifact_kind(),
+        artifact_kind("png", rendercv_preview_ppi()),
+        artifact_kind("png", rendercv_thumbnail_ppi()),
+    ]
+    for source_text in source_texts:
+        for kind in kinds:
+            cache.discard(cache_key(source_text, kind))
+
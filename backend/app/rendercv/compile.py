@@ -1,22 +1,45 @@
-"""Compile RenderCV YAML source to PDF bytes, in-process (no subprocess).
+"""Compile RenderCV YAML source to PDF (or first-page PNG) bytes, in-process.
 
 RenderCV renders via Typst (not LaTeX/TinyTeX — see CLAUDE.md's Typst-not-
 TinyTeX correction), and ships a clean Python API for both validation and
 rendering (rendercv.schema.rendercv_model_builder + rendercv.renderer.*).
-Nothing is ever written outside a TemporaryDirectory — no PDFs or Typst
-sources are persisted (see Document model's docstring: source_text is the
-only thing stored).
+No PDFs or Typst sources are persisted (see Document model's docstring:
+source_text is the only thing stored).
+
+Two compile modes (``app.rendercv.compile_mode``):
+- "memory" (default): YAML → model → Typst source → PDF bytes without
+  touching the filesystem. The Typst source is rendered with RenderCV's own
+  template function and handed to one long-lived ``typst.Compiler`` as bytes.
+- "tempdir": RenderCV's path-based flow — write cv.yaml, let it write the .typ
+  and .pdf, read the PDF back. Memory mode falls back to this only when the
+  source references a local photo file, which RenderCV must copy next to the
+  .typ file.
+
+Both modes resolve relative paths against, and create temp dirs under, the
+scratch root: ``app.rendercv.scratch_dir``, else /dev/shm when it is writable,
+else the system temp dir — so any fallback I/O lands on tmpfs when available,
+not on the volume holding the SQLite DB.
 """
 from __future__ import annotations
 
+import os
 import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
 
+import rendercv_fonts
+import typst
 from rendercv.exception import RenderCVInternalError, RenderCVUserError, RenderCVUserValidationError
-from rendercv.renderer.pdf_png import generate_pdf
+from rendercv.renderer.pdf_png import copy_photo_next_to_typst_file, generate_pdf, get_package_path
+from rendercv.renderer.templater.templater import render_full_template
 from rendercv.renderer.typst import generate_typst
 from rendercv.schema.rendercv_model_builder import build_rendercv_dictionary_and_model
 
+from app.config import rendercv_compile_mode, rendercv_scratch_dir
+
+COMPILE_MODES = ("memory", "tempdir")
+
 
 class CompileError(Exception):
     """Raised on any compile failure. ``stage`` is one of:
@@ -32,34 +55,153 @@ class CompileError(Exception):
         super().__init__(f"{stage}: {'; '.join(errors)}")
 
 
-def compile_pdf(source_text: str) -> bytes:
-    with tempfile.TemporaryDirectory(prefix="hirable-cv-") as tmp:
+@lru_cache(maxsize=1)
+def scratch_root() -> Path:
+    configured = rendercv_scratch_dir()
+    if configured:
+        base = Path(configured)
+    elif os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        base = Path("/dev/shm")
+    else:
+        base = Path(tempfile.gettempdir())
+    root = base / "hirable-rendercv"
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+@lru_cache(maxsize=1)
+def _typst_compiler() -> typst.Compiler:
+    """One compiler per process. RenderCV's own ``get_typst_compiler`` is
+    keyed by the per-compile temp dir, so the tempdir flow rebuilds it (and
+    reloads every font) on each call."""
+    return typst.Compiler(
+        root=str(scratch_root()),
+        font_paths=[str(p) for p in rendercv_fonts.paths_to_font_folders],
+        package_path=str(get_package_path()),
+    )
+
+
+# typst.Compiler isn't safe to drive from two threads at once; pool workers
+# are single-threaded, this only serializes in-process callers.
+_compiler_lock = threading.Lock()
+
+
+# What building the model raises for a bad source. An internal error there
+# means the YAML parsed but RenderCV couldn't turn it into a model, so it is
+# reported as a schema problem rather than escaping as a 500.
+MODEL_ERRORS = (RenderCVUserValidationError, RenderCVUserError, RenderCVInternalError)
+
+
+def model_error_stage(exc: Exception) -> str:
+    """``CompileError.stage`` ("yaml" or "schema") for one of ``MODEL_ERRORS``."""
+    if isinstance(exc, RenderCVUserValidationError):
+        # Both plain YAML syntax errors and schema-validation errors raise
+        # this same exception type; schema_location is None only for the
+        # former (see rendercv.schema.rendercv_model_builder).
+        return "yaml" if all(e.schema_location is None for e in exc.validation_errors) else "schema"
+    return "schema" if isinstance(exc, RenderCVInternalError) else "yaml"
+
+
+def parse_source(source_text: str, input_path: Path):
+    """YAML parse + RenderCV model validation only; raises one of
+    ``MODEL_ERRORS`` for a bad source. ``input_path`` is never written — it
+    only anchors relative paths (e.g. a photo)."""
+    _, model = build_rendercv_dictionary_and_model(
+        source_text,
+        input_file_path=input_path,
+        dont_generate_html=True,
+        dont_generate_markdown=True,
+        dont_generate_png=True,
+    )
+    return model
+
+
+def _build_model(source_text: str, input_path: Path):
+    try:
+        model = parse_source(source_text, input_path)
+    except MODEL_ERRORS as exc:
+        if isinstance(exc, RenderCVUserValidationError):
+            errors = [e.message for e in exc.validation_errors]
+        else:
+            errors = [exc.message or str(exc)]
+        raise CompileError(model_error_stage(exc), errors) from exc
+    return model
+
+
+def _render_error(exc: Exception) -> CompileError:
+    message = getattr(exc, "message", None) or str(exc)
+    return CompileError("render", [message])
+
+
+def compile_pdf(source_text: str, mode: str | None = None) -> bytes:
+    """``mode`` overrides ``app.rendercv.compile_mode`` (used by benchmarks)."""
+    mode = mode or rendercv_compile_mode()
+    if mode == "tempdir":
+        return _compile_in_tempdir(source_text)
+    if mode != "memory":
+        raise ValueError(f"unknown compile mode {mode!r}; expected one of {COMPILE_MODES}")
+
+    # input_path is never written — it only anchors relative paths (e.g. a
+    # photo) inside the scratch root, as the temp dir did before.
+    model = _build_model(source_text, scratch_root() / "cv.yaml")
+    if isinstance(model.cv.photo, Path):
+        return _compile_in_tempdir(source_text)
+
+    try:
+        typst_source = render_full_template(model, "typst")
+        pdf_bytes = _run_compiler(typst_source.encode("utf-8"), "pdf")
+    except (RenderCVUserError, RenderCVInternalError, typst.TypstError) as exc:
+        raise _render_error(exc) from exc
+
+    if not pdf_bytes:
+        raise CompileError("render", ["PDF generation produced no output"])
+    return pdf_bytes
+
+
+def compile_png(source_text: str, ppi: float) -> bytes:
+    """First page as a PNG at ``ppi`` — for quick previews and list
+    thumbnails. In memory unless the source references a local photo, in
+    which case the .typ file and the photo go in a scratch temp dir (under the
+    compiler's root) so Typst can resolve the image next to the source."""
+    model = _build_model(source_text, scratch_root() / "cv.yaml")
+    try:
+        typst_source = render_full_template(model, "typst")
+        if isinstance(model.cv.photo, Path):
+            with tempfile.TemporaryDirectory(prefix="hirable-cv-", dir=scratch_root()) as tmp:
+                typst_path = Path(tmp) / "cv.typ"
+                typst_path.write_text(typst_source, encoding="utf-8")
+                copy_photo_next_to_typst_file(model, typst_path)
+                pages = _run_compiler(str(typst_path), "png", ppi)
+        else:
+            pages = _run_compiler(typst_source.encode("utf-8"), "png", ppi)
+    except (RenderCVUserError, RenderCVInternalError, typst.TypstError) as exc:
+        raise _render_error(exc) from exc
+
+    # typst returns bare bytes for a one-page document, a list otherwise
+    if isinstance(pages, list):
+        pages = pages[0] if pages else None
+    if not pages:
+        raise CompileError("render", ["PNG generation produced no output"])
+    return pages
+
+
+def _run_compiler(source: bytes | str, fmt: str, ppi: float | None = None):
+    options = {"ppi": ppi} if ppi else {}
+    with _compiler_lock:
+        return _typst_compiler().compile(input=source, format=fmt, **options)
+
+
+def _compile_in_tempdir(source_text: str) -> bytes:
+    with tempfile.TemporaryDirectory(prefix="hirable-cv-", dir=scratch_root()) as tmp:
         input_path = Path(tmp) / "cv.yaml"
         input_path.write_text(source_text, encoding="utf-8")
-
-        try:
-            _, model = build_rendercv_dictionary_and_model(
-                source_text,
-                input_file_path=input_path,
-                dont_generate_html=True,
-                dont_generate_markdown=True,
-                dont_generate_png=True,
-            )
-        except RenderCVUserValidationError as exc:
-            # Both plain YAML syntax errors and schema-validation errors raise
-            # this same exception type; schema_location is None only for the
-            # former (see rendercv.schema.rendercv_model_builder).
-            stage = "yaml" if all(e.schema_location is None for e in exc.validation_errors) else "schema"
-            raise CompileError(stage, [e.message for e in exc.validation_errors]) from exc
-        except RenderCVUserError as exc:
-            raise CompileError("yaml", [exc.message or str(exc)]) from exc
+        model = _build_model(source_text, input_path)
 
         try:
             typst_path = generate_typst(model)
             pdf_path = generate_pdf(model, typst_path)
-        except (RenderCVUserError, RenderCVInternalError) as exc:
-            message = getattr(exc, "message", None) or str(exc)
-            raise CompileError("render", [message]) from exc
+        except (RenderCVUserError, RenderCVInternalError, typst.TypstError) as exc:
+            raise _render_error(exc) from exc
 
         if pdf_path is None:
             raise CompileError("render", ["PDF generation produced no output"])
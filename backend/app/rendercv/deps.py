@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from fastapi import Request
+
+from app.rendercv.pool import CompilePool
+
+
+def get_compile_pool(request: Request) -> CompilePool:
+    return request.app.state.compile_pool
@@ -7,15 +7,19 @@ reused unchanged and the letter shares the CV's theme automatically.
 """
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import yaml
 from fastapi import HTTPException
-from llm_kit import LLMClient, Message
+from llm_kit import LLMClient
 from llm_kit.errors import LLMError, ValidationError
 
+from app.llm.compact import profile_prompt_json
+from app.llm.context import llm_context
+from app.llm.prompts import layered_messages, stable_json
 from app.llm.schemas import TailoredCoverLetter
+from app.llm.usage import record_usage
 from app.rendercv.build import _build_contact
 from app.rendercv.rules import good_resume_rules
 
@@ -41,33 +45,36 @@ Your output:
 - closing: e.g. "Sincerely,".
 """
 
-_USER_MESSAGE_TEMPLATE = """Candidate's master profile:
-{profile_json}
+_PROFILE_MESSAGE_TEMPLATE = """Candidate's master profile:
+{profile_json}"""
 
-Job posting:
+_REQUEST_MESSAGE_TEMPLATE = """Job posting:
 {job_json}
 {instructions_block}"""
 
 
+@lru_cache(maxsize=1)
+def _system_prompt() -> str:
+    return _SYSTEM_PROMPT_TEMPLATE.format(good_resume_rules=good_resume_rules())
+
+
 async def tailor_cover_letter(
     llm: LLMClient,
     profile_data: dict,
     job_parsed: dict,
     instructions: str | None = None,
 ) -> TailoredCoverLetter:
-    """Call the LLM to produce a TailoredCoverLetter for one job."""
-    system_prompt = _SYSTEM_PROMPT_TEMPLATE.format(good_resume_rules=good_resume_rules())
+    """Call the LLM to produce a TailoredCoverLetter for one job. Same
+    cache-friendly prompt layout as ``tailor_profile``."""
     instructions_block = f"\n\nAdditional instructions from the user:\n{instructions}" if instructions else ""
-    user_message = _USER_MESSAGE_TEMPLATE.format(
-        profile_json=json.dumps(profile_data),
-        job_json=json.dumps(job_parsed),
-        instructions_block=instructions_block,
+    messages = layered_messages(
+        _system_prompt(),
+        _PROFILE_MESSAGE_TEMPLATE.format(profile_json=profile_prompt_json(profile_data)),
+        _REQUEST_MESSAGE_TEMPLATE.format(job_json=stable_json(job_parsed), instructions_block=instructions_block),
     )
     try:
-        result = await llm.invoke(
-            [Message.system(system_prompt), Message.user(user_message)],
-            response_model=TailoredCoverLetter,
-        )
+        with llm_context(site="tailor_cover_letter"):
+            result = await llm.invoke(messages, response_model=TailoredCoverLetter)
     except ValidationError as exc:
         raise HTTPException(
             status_code=502, detail=f"LLM returned malformed cover letter data: {exc}"
@@ -76,6 +83,7 @@ async def tailor_cover_letter(
         raise HTTPException(
             status_code=502, detail=f"LLM error while drafting cover letter: {exc}"
         ) from exc
+    record_usage("tailor_cover_letter", result)
     return result.parsed
 
 
@@ -103,5 +111,5 @@ def build_cover_letter_yaml(
     if paragraphs:
         cv["sections"] = {"Cover Letter": paragraphs}
 
-    doc: dict = {"cv": cv, "design": {"theme": theme}}
+    doc: dict = {"cv": cv, "design": {"theme": theme}, "settings": {"current_date": now.date().isoformat()}}
     return yaml.safe_dump(doc, sort_keys=False, allow_unicode=True)
@@ -0,0 +1,454 @@
+"""Dedicated pool of pre-warmed RenderCV/Typst compile worker processes.
+
+Compiling used to run inline on FastAPI's shared sync threadpool, so a handful
+of concurrent previews starved every other sync endpoint (login, list pages).
+Compiles now run in separate processes owned by this pool:
+
+- **Warm.** Each worker imports rendercv and runs one throwaway compile on
+  start-up, so the theme templates and Typst font set are already loaded by
+  the time a real request arrives.
+- **Bounded.** At most ``workers + max_queue`` compiles are admitted at once;
+  anything beyond that is rejected with ``CompilePoolBusy`` (→ 503) instead of
+  piling up.
+- **Isolated.** Each compile has a wall-clock timeout and each worker an
+  address-space ceiling (``RLIMIT_AS``). A worker that blows either is killed
+  and replaced — pathological YAML costs one worker restart, never the API
+  process. A replacement that fails to start is retried, with backoff, by
+  the next caller that needs a worker.
+
+Callers waiting on a worker block a thread from this pool's own dispatcher,
+never the event loop or the shared threadpool (see ``compile_async``).
+Successful compiles are written through to the content-addressed cache,
+cache hits skip the queue entirely, and a request identical to one already
+in flight shares its result. Workers produce PDFs or first-page PNGs.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing.connection import Connection
+
+from app.config import (
+    rendercv_pool_max_queue,
+    rendercv_pool_memory_limit_mb,
+    rendercv_pool_timeout_s,
+    rendercv_pool_workers,
+)
+from app.metrics import RollingSamples
+from app.rendercv.cache import CompileCache, artifact_kind, cache_key, get_compile_cache
+from app.rendercv.compile import CompileError, compile_pdf, compile_png
+
+logger = logging.getLogger("app.rendercv.pool")
+
+_WARMUP_SOURCE = "cv:\n  name: Warm Up\n  sections:\n    Summary:\n      - Warming fonts.\n"
+_READY_TIMEOUT_S = 120.0
+# After a failed respawn, the next attempt waits this long, doubling per
+# consecutive failure up to the max.
+_RESPAWN_BACKOFF_S = 1.0
+_RESPAWN_BACKOFF_MAX_S = 60.0
+
+
+class CompilePoolBusy(Exception):
+    """Raised when the pool's admission bound is reached."""
+
+
+def _limit_memory(memory_limit_mb: int) -> None:
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # non-POSIX — no ceiling, timeout still applies
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _worker_main(conn: Connection, memory_limit_mb: int) -> None:
+    """Worker process loop: warm up, then serve ``(fmt, source_text, ppi)``
+    requests (fmt "pdf" or "png") until the pipe closes. Replies are
+    ``("ok", bytes)`` or ``("error", stage, errors)``."""
+    _limit_memory(memory_limit_mb)
+    try:
+        compile_pdf(_WARMUP_SOURCE)
+    except Exception:
+        pass  # a broken warm-up surfaces on the first real compile instead
+    conn.send(("ready",))
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if request is None:
+            return
+        fmt, source_text, ppi = request
+        try:
+            data = compile_png(source_text, ppi) if fmt == "png" else compile_pdf(source_text)
+            conn.send(("ok", data))
+        except CompileError as exc:
+            conn.send(("error", exc.stage, exc.errors))
+        except MemoryError:
+            conn.send(("error", "render", ["Compile exceeded the worker memory limit"]))
+        except Exception as exc:
+            conn.send(("error", "render", [str(exc) or type(exc).__name__]))
+
+
+class _Worker:
+    def __init__(self, ctx, memory_limit_mb: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, memory_limit_mb), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def wait_ready(self) -> None:
+        if not self.conn.poll(_READY_TIMEOUT_S):
+            raise RuntimeError("compile worker did not become ready")
+        self.conn.recv()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+class CompilePool:
+    """Started lazily on first use (or explicitly via ``start``)."""
+
+    def __init__(
+        self,
+        workers: int,
+        max_queue: int,
+        timeout_s: float,
+        memory_limit_mb: int,
+        cache: CompileCache | None = None,
+    ):
+        self.workers = max(1, workers)
+        self._max_pending = self.workers + max(0, max_queue)
+        self._timeout_s = timeout_s
+        self._memory_limit_mb = memory_limit_mb
+        self._cache = cache
+        self._ctx = multiprocessing.get_context("spawn")
+        self._cond = threading.Condition()
+        self._idle: list[_Worker] = []
+        self._all: list[_Worker] = []
+        self._started = False
+        self._ready = False  # the current start() finished (successfully or not)
+        self._closed = False
+        self._pending = 0
+        self._waiting = 0  # interactive callers blocked on a worker
+        self._waiting_background = 0
+        self._spawning = 0  # replacement workers being started
+        self._respawn_backoff_s = 0.0
+        self._respawn_at = 0.0  # monotonic time before which no respawn is tried
+        self._inflight: dict[str, Future[bytes]] = {}
+        self._background: set[str] = set()  # in-flight keys only background callers want
+        self._dispatcher = ThreadPoolExecutor(
+            max_workers=self._max_pending, thread_name_prefix="compile-dispatch"
+        )
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.restarts = 0
+        self.rejected = 0
+        self.latency_ms = RollingSamples()
+        self.queue_wait_ms = RollingSamples()
+
+    # ---- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        with self._cond:
+            if self._started:
+                return
+            self._started = True
+            self._ready = False
+        spawned: list[_Worker] = []
+        try:
+            spawned = [_Worker(self._ctx, self._memory_limit_mb) for _ in range(self.workers)]
+            for worker in spawned:
+                worker.wait_ready()
+        except Exception:
+            for worker in spawned:
+                worker.kill()
+            spawned = []
+            with self._cond:
+                self._started = False  # let the next caller try again
+            raise
+        finally:
+            # Callers that raced this start() wait on _ready rather than
+            # seeing an empty pool and reporting it unavailable.
+            with self._cond:
+                self._all.extend(spawned)
+                self._idle.extend(spawned)
+                self._ready = True
+                self._cond.notify_all()
+        logger.info("compile pool started: workers=%d", self.workers)
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._closed = True
+            workers, self._all, self._idle = self._all, [], []
+            self._cond.notify_all()
+        self._dispatcher.shutdown(wait=False, cancel_futures=True)
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self) -> CompilePool:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    # ---- compile API -------------------------------------------------------
+
+    def submit(
+        self,
+        source_text: str,
+        fmt: str = "pdf",
+        ppi: float | None = None,
+        background: bool = False,
+    ) -> Future[bytes]:
+        """Admit one compile, or raise ``CompilePoolBusy``. The returned
+        future resolves to PDF bytes (or first-page PNG bytes for
+        ``fmt="png"``) or raises ``CompileError``. A request identical to one
+        already queued or running shares its future instead of compiling
+        twice. ``background`` compiles only get a worker while no interactive
+        compile is waiting for one; an interactive request that joins one
+        promotes it to interactive."""
+        key = cache_key(source_text, artifact_kind(fmt, ppi))
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                future: Future[bytes] = Future()
+                future.set_result(cached)
+                return future
+        with self._cond:
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                if not background and key in self._background:
+                    # An interactive caller now waits on it: _acquire re-checks
+                    # the flag, so wake it to stop deferring.
+                    self._background.discard(key)
+                    self._cond.notify_all()
+                return inflight
+            if self._pending >= self._max_pending:
+                self.rejected += 1
+                raise CompilePoolBusy(f"{self._pending} compiles already queued or running")
+            self._pending += 1
+            if background:
+                self._background.add(key)
+            future = self._dispatcher.submit(self._run, key, (fmt, source_text, ppi), time.perf_counter())
+            self._inflight[key] = future
+        future.add_done_callback(lambda _f: self._on_done(key))
+        return future
+
+    def compile(
+        self,
+        source_text: str,
+        fmt: str = "pdf",
+        ppi: float | None = None,
+        background: bool = False,
+    ) -> bytes:
+        return self.submit(source_text, fmt, ppi, background).result()
+
+    async def compile_async(
+        self, source_text: str, fmt: str = "pdf", ppi: float | None = None
+    ) -> bytes:
+        return await asyncio.wrap_future(self.submit(source_text, fmt, ppi))
+
+    # ---- internals ---------------------------------------------------------
+
+    def _on_done(self, key: str) -> None:
+        with self._cond:
+            self._pending -= 1
+            self._inflight.pop(key, None)
+            self._background.discard(key)
+
+    def _acquire(self, key: str) -> _Worker:
+        self.start()
+        with self._cond:
+            background = key in self._background
+            if background:
+                self._waiting_background += 1
+            else:
+                self._waiting += 1
+            try:
+                while True:
+                    if background and key not in self._background:
+                        self._waiting_background -= 1
+                        self._waiting += 1
+                        background = False
+                    if self._idle and not (background and self._waiting):
+                        return self._idle.pop()
+                    if self._should_respawn():
+                        self._spawning += 1
+                        self._cond.release()
+                        try:
+                            fresh = self._spawn()
+                        finally:
+                            self._cond.acquire()
+                            self._spawning -= 1
+                        if fresh is not None:
+                            self._all.append(fresh)
+                            self._idle.append(fresh)
+                            self._cond.notify_all()
+                        continue
+                    if self._closed or (self._ready and not self._all and not self._spawning):
+                        raise CompileError("render", ["Compile service is unavailable"])
+                    self._cond.wait(timeout=self._timeout_s)
+            finally:
+                if background:
+                    self._waiting_background -= 1
+                else:
+                    self._waiting -= 1
+
+    def _release(self, worker: _Worker) -> None:
+        with self._cond:
+            if self._closed:
+                worker.stop()
+                return
+            self._idle.append(worker)
+            # wake everyone: a woken background caller defers to any
+            # interactive one still waiting, so a single notify could stall
+            self._cond.notify_all()
+
+    def _should_respawn(self) -> bool:
+        """Whether a worker lost to a failed respawn should be started again
+        now. Called with ``_cond`` held."""
+        return (
+            self._ready
+            and not self._closed
+            and len(self._all) + self._spawning < self.workers
+            and time.monotonic() >= self._respawn_at
+        )
+
+    def _spawn(self) -> _Worker | None:
+        """A fresh, ready worker, or None if it failed to start — the next
+        attempt then waits out a growing backoff."""
+        worker = None
+        try:
+            worker = _Worker(self._ctx, self._memory_limit_mb)
+            worker.wait_ready()
+        except Exception:
+            logger.exception("compile worker restart failed")
+            if worker is not None:
+                worker.kill()
+            with self._cond:
+                self._respawn_backoff_s = min(
+                    _RESPAWN_BACKOFF_MAX_S, self._respawn_backoff_s * 2 or _RESPAWN_BACKOFF_S
+                )
+                self._respawn_at = time.monotonic() + self._respawn_backoff_s
+                self._cond.notify_all()
+            return None
+        with self._cond:
+            self._respawn_backoff_s = 0.0
+        return worker
+
+    def _replace(self, worker: _Worker) -> None:
+        """Kill a timed-out/crashed worker and hand a fresh one to the idle
+        list. If the respawn fails the pool is a worker short until
+        ``_acquire`` respawns it; it reports the pool unavailable only while
+        no worker is left or being started."""
+        worker.kill()
+        with self._cond:
+            self._all = [w for w in self._all if w is not worker]
+            self.restarts += 1
+            self._spawning += 1
+        try:
+            fresh = self._spawn()
+        finally:
+            with self._cond:
+                self._spawning -= 1
+        if fresh is None:
+            return
+        with self._cond:
+            self._all.append(fresh)
+        self._release(fresh)
+
+    def _run(self, key: str, request: tuple, submitted_at: float) -> bytes:
+        worker = self._acquire(key)
+        started = time.perf_counter()
+        self.queue_wait_ms.observe((started - submitted_at) * 1000)
+        try:
+            reply = self._exchange(worker, request)
+        except CompileError:
+            self._replace(worker)
+            raise
+        else:
+            self._release(worker)
+        finally:
+            self.latency_ms.observe((time.perf_counter() - started) * 1000)
+
+        if reply[0] == "error":
+            self.failed += 1
+            raise CompileError(reply[1], reply[2])
+        self.completed += 1
+        data = reply[1]
+        if self._cache is not None:
+            self._cache.put(key, data)
+        return data
+
+    def _exchange(self, worker: _Worker, request: tuple) -> tuple:
+        """Send one request and wait for its reply. Raises ``CompileError``
+        (and leaves the worker for the caller to replace) on timeout or crash."""
+        try:
+            worker.conn.send(request)
+            if not worker.conn.poll(self._timeout_s):
+                self.timeouts += 1
+                logger.warning("compile timed out after %.0fs — restarting worker", self._timeout_s)
+                raise CompileError("render", [f"Compile timed out after {self._timeout_s:g}s"])
+            return worker.conn.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError, OSError) as exc:
+            self.failed += 1
+            logger.warning("compile worker died (exit code %s)", worker.process.exitcode)
+            raise CompileError(
+                "render", ["Compile worker crashed — the document may be too large to render"]
+            ) from exc
+
+    def stats(self) -> dict:
+        with self._cond:
+            snapshot = {
+                "workers": len(self._all),
+                "idle": len(self._idle),
+                "queue_depth": self._waiting + self._waiting_background,
+                "background_waiting": self._waiting_background,
+                "pending": self._pending,
+                "max_pending": self._max_pending,
+            }
+        return {
+            **snapshot,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "restarts": self.restarts,
+            "rejected": self.rejected,
+            "latency_ms": self.latency_ms.summary(),
+            "queue_wait_ms": self.queue_wait_ms.summary(),
+        }
+
+
+def build_compile_pool() -> CompilePool:
+    """The app's shared pool, configured from ``app.rendercv.pool``."""
+    return CompilePool(
+        workers=rendercv_pool_workers(),
+        max_queue=rendercv_pool_max_queue(),
+        timeout_s=rendercv_pool_timeout_s(),
+        memory_limit_mb=rendercv_pool_memory_limit_mb(),
+        cache=get_compile_cache(),
+    )
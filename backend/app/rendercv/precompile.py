@@ -0,0 +1,164 @@
+"""Background pre-compile of newly saved document versions.
+
+Every new ``Document`` row (drafted by the LLM or saved from the editor) is
+queued here right after commit. A single background thread feeds the queue
+to the compile pool as *background* work — it only gets a worker while no
+interactive compile is waiting — and the pool writes the PDF through to the
+content-addressed cache, so the user's first preview of that version is a
+cache hit. Compile failures are remembered per source and exposed via
+``GET /api/documents/{id}/status``, so a broken draft can be flagged before
+the user opens the editor.
+
+Deduplicated by source hash: a source that is already queued, compiling or
+cached is not queued again. The queue is bounded; overflow is dropped (the
+version simply compiles on first preview, as before).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+
+from app.config import rendercv_precompile_enabled, rendercv_precompile_max_queue
+from app.rendercv.cache import CompileCache, cache_key
+from app.rendercv.compile import CompileError
+from app.rendercv.pool import CompilePool, CompilePoolBusy
+
+logger = logging.getLogger("app.rendercv.precompile")
+
+_HISTORY_ENTRIES = 2048  # per-source outcomes kept for the status endpoint
+_BUSY_BACKOFF_S = 1.0
+
+
+class Precompiler:
+    def __init__(self, pool: CompilePool, cache: CompileCache | None, max_queue: int):
+        self._pool = pool
+        self._cache = cache
+        self._max_queue = max_queue
+        self._cond = threading.Condition()
+        self._queue: deque[tuple[str, str]] = deque()  # (key, source_text)
+        self._states: OrderedDict[str, dict] = OrderedDict()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.enqueued = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.compiled = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and not self._closed
+
+    def start(self) -> None:
+        global _active
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="precompile", daemon=True)
+            self._thread.start()
+        _active = self
+
+    def shutdown(self) -> None:
+        global _active
+        if _active is self:
+            _active = None
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def enqueue(self, source_text: str) -> bool:
+        key = cache_key(source_text)
+        with self._cond:
+            state = self._states.get(key, {}).get("state")
+            if state in ("queued", "compiling") or (
+                self._cache is not None and self._cache.contains(key)
+            ):
+                self.deduplicated += 1
+                return False
+            if len(self._queue) >= self._max_queue:
+                self.dropped += 1
+                return False
+            self._queue.append((key, source_text))
+            self._set_state(key, "queued")
+            self.enqueued += 1
+            self._cond.notify()
+            return True
+
+    def status(self, source_text: str) -> dict:
+        """``state`` is "ready", "queued", "compiling", "failed" (with the
+        compile ``stage``/``errors``) or "not_compiled"."""
+        key = cache_key(source_text)
+        if self._cache is not None and self._cache.contains(key):
+            return {"state": "ready", "stage": None, "errors": []}
+        with self._cond:
+            state = self._states.get(key)
+        if state is None or state["state"] == "ready":  # ready but since evicted
+            return {"state": "not_compiled", "stage": None, "errors": []}
+        return {"stage": None, "errors": [], **state}
+
+    def stats(self) -> dict:
+        with self._cond:
+            queued = len(self._queue)
+        return {
+            "queued": queued,
+            "enqueued": self.enqueued,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "compiled": self.compiled,
+            "failed": self.failed,
+        }
+
+    def _set_state(self, key: str, state: str, **details) -> None:
+        self._states[key] = {"state": state, **details}
+        self._states.move_to_end(key)
+        while len(self._states) > _HISTORY_ENTRIES:
+            self._states.popitem(last=False)
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                key, source_text = self._queue.popleft()
+                self._set_state(key, "compiling")
+            try:
+                self._pool.compile(source_text, background=True)
+            except CompilePoolBusy:
+                with self._cond:  # pool saturated by interactive work — retry later
+                    self._queue.append((key, source_text))
+                    self._set_state(key, "queued")
+                time.sleep(_BUSY_BACKOFF_S)
+                continue
+            except CompileError as exc:
+                with self._cond:
+                    self.failed += 1
+                    self._set_state(key, "failed", stage=exc.stage, errors=exc.errors)
+                continue
+            except Exception:
+                logger.exception("precompile failed unexpectedly")
+                with self._cond:
+                    self._set_state(key, "not_compiled")
+                continue
+            with self._cond:
+                self.compiled += 1
+                self._set_state(key, "ready")
+
+
+_active: Precompiler | None = None
+
+
+def build_precompiler(pool: CompilePool, cache: CompileCache | None) -> Precompiler:
+    return Precompiler(pool, cache, max_queue=rendercv_precompile_max_queue())
+
+
+def precompile(source_text: str) -> None:
+    """Queue a freshly saved version. No-op unless the app's precompiler is
+    running (it isn't under pytest, in scripts, or when disabled)."""
+    if _active is not None and rendercv_precompile_enabled():
+        _active.enqueue(source_text)
@@ -1,18 +1,34 @@
-"""Shared draft_cv/draft_cover_letter logic — used by both the internal
-agent-tool routes (app/internal/documents.py) and the public API
-(app/api/documents.py), so generating a document works identically whether
-triggered by the agent or a UI button.
+"""Shared draft_cv/draft_cover_letter/draft_application_pack logic — used by
+both the internal agent-tool routes (app/internal/documents.py) and the
+public API (app/api/documents.py), so generating a document works identically
+whether triggered by the agent or a UI button.
 """
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Callable
+
 from llm_kit import LLMClient
 from sqlalchemy.orm import Session
 
-from app.config import rendercv_theme
+from app.config import llm_delta_retailoring, rendercv_theme
 from app.db.models import Document, Job, Profile
+from app.llm.context import llm_context
+from app.llm.schemas import TailoredCV
 from app.rendercv.build import build_rendercv_yaml
 from app.rendercv.letter import build_cover_letter_yaml, tailor_cover_letter
-from app.rendercv.tailor import tailor_profile
+from app.rendercv.precompile import precompile
+from app.rendercv.speculative import tailoring_stamp, take_pretailored
+from app.rendercv.tailor import retailor_profile, tailor_profile
+
+# Stage callback for the streaming draft endpoints: (stage, details). Stages,
+# in order: tailoring_started, tokens_received, yaml_assembled, persisted.
+Progress = Callable[[str, dict], None]
+
+
+def _noop(stage: str, details: dict) -> None:
+    pass
 
 
 def _next_version(db: Session, user_id: str, job_id: str, doc_type: str) -> int:
@@ -25,19 +41,82 @@ def _next_version(db: Session, user_id: str, job_id: str, doc_type: str) -> int:
     return (latest.version + 1) if latest else 1
 
 
+async def _timed(on_progress: Progress, document_type: str, tailoring):
+    """Await one tailoring call, reporting when it starts and when the LLM's
+    response has arrived."""
+    on_progress("tailoring_started", {"document_type": document_type})
+    started = time.perf_counter()
+    result = await tailoring
+    on_progress(
+        "tokens_received",
+        {"document_type": document_type, "elapsed_ms": round((time.perf_counter() - started) * 1000)},
+    )
+    return result
+
+
+def _previous_tailoring(db: Session, job: Job, profile: Profile) -> TailoredCV | None:
+    """The TailoredCV behind the latest CV version for ``job``, if that
+    version was drafted (not hand-edited) from the current profile and job."""
+    latest: Document | None = (
+        db.query(Document)
+        .filter_by(user_id=job.user_id, job_id=job.id, type="cv")
+        .order_by(Document.version.desc())
+        .first()
+    )
+    if latest is None or not latest.tailoring:
+        return None
+    if latest.tailoring.get("stamp") != list(tailoring_stamp(job, profile)):
+        return None
+    return TailoredCV.model_validate(latest.tailoring["cv"])
+
+
+def _tailoring_record(job: Job, profile: Profile, tailored: TailoredCV) -> dict:
+    return {"stamp": list(tailoring_stamp(job, profile)), "cv": tailored.model_dump()}
+
+
+async def _tailor_cv(
+    db: Session, llm: LLMClient, job: Job, profile: Profile, instructions: str | None
+) -> TailoredCV:
+    """Without instructions: the speculative pre-tailored result for this
+    job if there is one (app/rendercv/speculative.py). With instructions: a
+    revision of the previous draft's TailoredCV (changed sections only) if
+    there is one. Otherwise a full ``tailor_profile``."""
+    if not instructions:
+        tailored = await take_pretailored(job, profile)
+        if tailored is not None:
+            return tailored
+    elif llm_delta_retailoring():
+        previous = _previous_tailoring(db, job, profile)
+        if previous is not None:
+            return await retailor_profile(llm, profile.data, job.parsed, previous, instructions)
+    return await tailor_profile(llm, profile.data, job.parsed, instructions)
+
+
+def _persisted(on_progress: Progress, document: Document) -> None:
+    on_progress(
+        "persisted",
+        {"document_type": document.type, "document_id": document.id, "version": document.version},
+    )
+
+
 async def draft_cv_document(
     db: Session,
     llm: LLMClient,
     job: Job,
     profile: Profile,
     instructions: str | None = None,
+    on_progress: Progress = _noop,
 ) -> Document:
     """Tailor the profile to ``job``, assemble RenderCV YAML, and persist the
     next version row for this (user, job, "cv") family. Callers are
     responsible for user-scoped 404 checks on ``job``/``profile`` before
-    calling this."""
-    tailored = await tailor_profile(llm, profile.data, job.parsed, instructions)
+    calling this. The new version is queued for background pre-compile.
+    How the TailoredCV is obtained — fresh, pre-tailored, or revised from the
+    previous version — is up to ``_tailor_cv``; it is stored on the row."""
+    with llm_context(job.user_id, "interactive"):
+        tailored = await _timed(on_progress, "cv", _tailor_cv(db, llm, job, profile, instructions))
     source_text = build_rendercv_yaml(profile.data, tailored, job.parsed, rendercv_theme())
+    on_progress("yaml_assembled", {"document_type": "cv", "chars": len(source_text)})
 
     document = Document(
         user_id=job.user_id,
@@ -45,10 +124,13 @@ async def draft_cv_document(
         type="cv",
         source_text=source_text,
         version=_next_version(db, job.user_id, job.id, "cv"),
+        tailoring=_tailoring_record(job, profile, tailored),
     )
     db.add(document)
     db.commit()
     db.refresh(document)
+    _persisted(on_progress, document)
+    precompile(document.source_text)
     return document
 
 
@@ -58,13 +140,18 @@ async def draft_cover_letter_document(
     job: Job,
     profile: Profile,
     instructions: str | None = None,
+    on_progress: Progress = _noop,
 ) -> Document:
     """Tailor a cover letter to ``job`` and persist the next version row for
     this (user, job, "cover_letter") family — mirrors ``draft_cv_document``.
     Callers are responsible for user-scoped 404 checks on ``job``/``profile``
     before calling this."""
-    tailored = await tailor_cover_letter(llm, profile.data, job.parsed, instructions)
+    with llm_context(job.user_id, "interactive"):
+        tailored = await _timed(
+            on_progress, "cover_letter", tailor_cover_letter(llm, profile.data, job.parsed, instructions)
+        )
     source_text = build_cover_letter_yaml(profile.data, tailored, rendercv_theme())
+    on_progress("yaml_assembled", {"document_type": "cover_letter", "chars": len(source_text)})
 
     document = Document(
         user_id=job.user_id,
@@ -76,4 +163,54 @@ async def draft_cover_letter_document(
     db.add(document)
     db.commit()
     db.refresh(document)
+    _persisted(on_progress, document)
+    precompile(document.source_text)
     return document
+
+
+async def draft_application_pack(
+    db: Session,
+    llm: LLMClient,
+    job: Job,
+    profile: Profile,
+    instructions: str | None = None,
+    on_progress: Progress = _noop,
+) -> tuple[Document, Document]:
+    """Draft the CV and the cover letter for ``job`` together: both tailoring
+    calls run concurrently (wall time ≈ the slower one, not the sum), and
+    both new versions are persisted in one transaction — either both land or
+    neither does. Same 404 contract as ``draft_cv_document``."""
+    with llm_context(job.user_id, "interactive"):
+        tailored_cv, tailored_letter = await asyncio.gather(
+            _timed(on_progress, "cv", _tailor_cv(db, llm, job, profile, instructions)),
+            _timed(
+                on_progress, "cover_letter", tailor_cover_letter(llm, profile.data, job.parsed, instructions)
+            ),
+        )
+    theme = rendercv_theme()
+    cv = Document(
+        user_id=job.user_id,
+        job_id=job.id,
+        type="cv",
+        source_text=build_rendercv_yaml(profile.data, tailored_cv, job.parsed, theme),
+        version=_next_version(db, job.user_id, job.id, "cv"),
+        tailoring=_tailoring_record(job, profile, tailored_cv),
+    )
+    cover_letter = Document(
+        user_id=job.user_id,
+        job_id=job.id,
+        type="cover_letter",
+        source_text=build_cover_letter_yaml(profile.data, tailored_letter, theme),
+        version=_next_version(db, job.user_id, job.id, "cover_letter"),
+    )
+    for document in (cv, cover_letter):
+        on_progress("yaml_assembled", {"document_type": document.type, "chars": len(document.source_text)})
+    db.add_all([cv, cover_letter])
+    db.commit()
+    db.refresh(cv)
+    db.refresh(cover_letter)
+    _persisted(on_progress, cv)
+    _persisted(on_progress, cover_letter)
+    precompile(cv.source_text)
+    precompile(cover_letter.source_text)
+    return cv, cover_letter
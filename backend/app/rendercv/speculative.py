@@ -0,0 +1,175 @@
+"""Speculative pre-tailoring (opt-in, ``app.speculative_tailoring``).
+
+Adding a job is almost always followed by drafting a CV for it, and the
+user then waits on ``tailor_profile``. When enabled, a successful
+``POST /api/jobs`` starts that ``TailoredCV`` computation right away, as
+``background``-priority LLM work (app/llm/admission.py), and keeps the
+result in process, keyed by job and stamped with the ``profile.version`` and
+``job.updated_at`` it was computed from.
+
+The next ``draft_cv_document`` / ``draft_application_pack`` for that job
+without custom ``instructions`` takes the result instead of calling the LLM
+— awaiting it if it is still in flight, after promoting its LLM call to the
+draft's own priority so it no longer queues as background work. A stamp
+mismatch (the profile or the job was edited since) discards it; a draft
+with instructions leaves it for a later plain draft. Each result is used at
+most once; at most ``max_entries`` are kept, oldest evicted first. Nothing
+is persisted — a restart just loses the head start.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timezone
+
+from llm_kit import LLMClient
+from sqlalchemy.orm import Session
+
+from app.config import speculative_tailoring_enabled, speculative_tailoring_max_entries
+from app.db.models import Job, Profile
+from app.llm.admission import AdmissionController
+from app.llm.context import current_priority, llm_context
+from app.llm.schemas import TailoredCV
+from app.rendercv.tailor import tailor_profile
+
+logger = logging.getLogger("app.rendercv.speculative")
+
+Stamp = tuple[int, str]
+
+
+def tailoring_stamp(job: Job, profile: Profile) -> Stamp:
+    """What a ``TailoredCV`` depends on: the profile version and the job's
+    last edit."""
+    updated_at = job.updated_at
+    if updated_at.tzinfo is not None:  # SQLite reads back naive UTC
+        updated_at = updated_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return profile.version, updated_at.isoformat()
+
+
+@dataclass
+class _Entry:
+    stamp: Stamp
+    task: asyncio.Task[TailoredCV | None]
+    admission: AdmissionController | None = None
+
+
+class SpeculativeTailor:
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.scheduled = 0
+        self.reused = 0
+        self.discarded = 0
+        self.failed = 0
+        self.evicted = 0
+
+    def schedule(self, llm: LLMClient, job: Job, profile: Profile) -> None:
+        """Start tailoring ``profile`` for ``job`` in the background,
+        replacing any earlier result for the job."""
+        self._drop(job.id)
+        task = asyncio.create_task(self._tailor(llm, job.user_id, profile.data, job.parsed))
+        admission = getattr(llm, "admission", None)
+        if not isinstance(admission, AdmissionController):
+            admission = None
+        self._entries[job.id] = _Entry(tailoring_stamp(job, profile), task, admission)
+        self.scheduled += 1
+        while len(self._entries) > self._max_entries:
+            _, oldest = self._entries.popitem(last=False)
+            oldest.task.cancel()
+            self.evicted += 1
+
+    async def take(self, job: Job, profile: Profile) -> TailoredCV | None:
+        """The pre-tailored result for ``job`` if it was computed from the
+        current profile and job, else None. Consumes the entry either way."""
+        entry = self._entries.pop(job.id, None)
+        if entry is None:
+            return None
+        if entry.stamp != tailoring_stamp(job, profile):
+            entry.task.cancel()
+            self.discarded += 1
+            logger.info("speculative tailoring: stale result discarded job=%s", job.id)
+            return None
+        if not entry.task.done() and entry.admission is not None:
+            entry.admission.promote(entry.task, current_priority.get())
+        tailored = await entry.task
+        if tailored is not None:
+            self.reused += 1
+            logger.info("speculative tailoring: reused job=%s", job.id)
+        return tailored
+
+    def discard(self, job_id: str) -> None:
+        if self._drop(job_id):
+            self.discarded += 1
+
+    def _drop(self, job_id: str) -> bool:
+        entry = self._entries.pop(job_id, None)
+        if entry is not None:
+            entry.task.cancel()
+        return entry is not None
+
+    async def _tailor(
+        self, llm: LLMClient, user_id: str, profile_data: dict, job_parsed: dict
+    ) -> TailoredCV | None:
+        try:
+            with llm_context(user_id, "background"):
+                return await tailor_profile(llm, profile_data, job_parsed)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.failed += 1
+            logger.info("speculative tailoring failed: %s", getattr(exc, "detail", exc))
+            return None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": speculative_tailoring_enabled(),
+            "pending": sum(not e.task.done() for e in self._entries.values()),
+            "ready": sum(e.task.done() for e in self._entries.values()),
+            "scheduled": self.scheduled,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "failed": self.failed,
+            "evicted": self.evicted,
+        }
+
+    def shutdown(self) -> None:
+        global _active
+        if _active is self:
+            _active = None
+        for entry in self._entries.values():
+            entry.task.cancel()
+        self._entries.clear()
+
+
+_active: SpeculativeTailor | None = None
+
+
+def build_speculative_tailor() -> SpeculativeTailor:
+    global _active
+    _active = SpeculativeTailor(max_entries=speculative_tailoring_max_entries())
+    return _active
+
+
+def schedule_pretailoring(db: Session, llm: LLMClient, job: Job) -> bool:
+    """Start pre-tailoring the user's profile for a just-added ``job``. No-op
+    (False) when disabled, outside the app, or before the user has a profile."""
+    if _active is None or not speculative_tailoring_enabled():
+        return False
+    profile = db.query(Profile).filter_by(user_id=job.user_id).first()
+    if profile is None:
+        return False
+    _active.schedule(llm, job, profile)
+    return True
+
+
+def discard_pretailored(job_id: str) -> None:
+    if _active is not None:
+        _active.discard(job_id)
+
+
+async def take_pretailored(job: Job, profile: Profile) -> TailoredCV | None:
+    if _active is None:
+        return None
+    return await _active.take(job, profile)
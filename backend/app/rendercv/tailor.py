@@ -7,15 +7,22 @@ ProfileModel's Part1/Part2 split.
 """
 from __future__ import annotations
 
-import json
+import logging
+from functools import lru_cache
 
 from fastapi import HTTPException
-from llm_kit import LLMClient, Message
+from llm_kit import LLMClient
 from llm_kit.errors import LLMError, ValidationError
 
-from app.llm.schemas import TailoredCV
+from app.llm.compact import profile_prompt_json
+from app.llm.context import llm_context
+from app.llm.prompts import layered_messages, stable_json
+from app.llm.schemas import TailoredCV, TailoredCVRevision
+from app.llm.usage import record_usage
 from app.rendercv.rules import good_resume_rules
 
+logger = logging.getLogger("app.rendercv.tailor")
+
 _SYSTEM_PROMPT_TEMPLATE = """You are a resume-tailoring assistant. Given a candidate's master \
 profile and a specific job posting, decide which profile items to feature in a tailored CV and \
 how to present them — never invent or alter facts (dates, company/institution names, emails, \
@@ -55,13 +62,30 @@ Your output:
   including for this job.
 """
 
-_USER_MESSAGE_TEMPLATE = """Master profile (list items are 0-indexed within each list):
-{profile_json}
+_PROFILE_MESSAGE_TEMPLATE = """Master profile (list items are 0-indexed within each list):
+{profile_json}"""
 
-Job posting:
+_REQUEST_MESSAGE_TEMPLATE = """Job posting:
 {job_json}
 {instructions_block}"""
 
+_REVISION_MESSAGE_TEMPLATE = """Job posting:
+{job_json}
+
+This is a revision. The current tailored CV for this job and profile is:
+{previous_json}
+
+Revise it per these instructions from the user:
+{instructions}
+
+Return ONLY the sections that must change to follow the instructions, each in full, with the \
+same meaning and rules as above; set every other section to null to keep it as is."""
+
+
+@lru_cache(maxsize=1)
+def _system_prompt() -> str:
+    return _SYSTEM_PROMPT_TEMPLATE.format(good_resume_rules=good_resume_rules())
+
 
 async def tailor_profile(
     llm: LLMClient,
@@ -69,19 +93,49 @@ async def tailor_profile(
     job_parsed: dict,
     instructions: str | None = None,
 ) -> TailoredCV:
-    """Call the LLM to produce a TailoredCV selection/rewrite for one job."""
-    system_prompt = _SYSTEM_PROMPT_TEMPLATE.format(good_resume_rules=good_resume_rules())
+    """Call the LLM to produce a TailoredCV selection/rewrite for one job.
+
+    The prompt is laid out rulebook → profile → job → instructions so repeat
+    drafts reuse the provider's prompt cache (see app/llm/prompts.py)."""
     instructions_block = f"\n\nAdditional instructions from the user:\n{instructions}" if instructions else ""
-    user_message = _USER_MESSAGE_TEMPLATE.format(
-        profile_json=json.dumps(profile_data),
-        job_json=json.dumps(job_parsed),
-        instructions_block=instructions_block,
+    messages = layered_messages(
+        _system_prompt(),
+        _PROFILE_MESSAGE_TEMPLATE.format(profile_json=profile_prompt_json(profile_data)),
+        _REQUEST_MESSAGE_TEMPLATE.format(job_json=stable_json(job_parsed), instructions_block=instructions_block),
     )
+    return await _invoke(llm, messages, TailoredCV, "tailor_profile")
+
+
+async def retailor_profile(
+    llm: LLMClient,
+    profile_data: dict,
+    job_parsed: dict,
+    previous: TailoredCV,
+    instructions: str,
+) -> TailoredCV:
+    """Revise ``previous`` (the TailoredCV of the last draft for this job and
+    profile) per ``instructions``, asking the LLM for the changed sections
+    only (``TailoredCVRevision``) and merging them over ``previous`` — far
+    fewer output tokens than re-tailoring every section. Same system and
+    profile messages as ``tailor_profile``, so the cached prefix is shared."""
+    messages = layered_messages(
+        _system_prompt(),
+        _PROFILE_MESSAGE_TEMPLATE.format(profile_json=profile_prompt_json(profile_data)),
+        _REVISION_MESSAGE_TEMPLATE.format(
+            job_json=stable_json(job_parsed),
+            previous_json=stable_json(previous.model_dump()),
+            instructions=instructions,
+        ),
+    )
+    revision: TailoredCVRevision = await _invoke(llm, messages, TailoredCVRevision, "retailor_profile")
+    logger.info("cv revision: changed sections=%s", ",".join(revision.changed_sections()) or "none")
+    return revision.apply(previous)
+
+
+async def _invoke(llm: LLMClient, messages, response_model, site: str):
     try:
-        result = await llm.invoke(
-            [Message.system(system_prompt), Message.user(user_message)],
-            response_model=TailoredCV,
-        )
+        with llm_context(site=site):
+            result = await llm.invoke(messages, response_model=response_model)
     except ValidationError as exc:
         raise HTTPException(
             status_code=502, detail=f"LLM returned malformed tailoring data: {exc}"
@@ -90,4 +144,5 @@ async def tailor_profile(
         raise HTTPException(
             status_code=502, detail=f"LLM error while tailoring CV: {exc}"
         ) from exc
+    record_usage(site, result)
     return result.parsed
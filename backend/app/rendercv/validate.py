@@ -0,0 +1,64 @@
+"""Schema-only validation of RenderCV YAML source, for live editor linting.
+
+Runs just the YAML parse + RenderCV model validation that ``compile_pdf``
+starts with — no Typst, no compile pool — so it answers in milliseconds and
+can run on every keystroke. Results are memoized per source text in-process:
+an editor re-sending unchanged text (or undoing back to it) is a dict lookup.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from rendercv.exception import RenderCVUserValidationError
+
+from app.rendercv.compile import MODEL_ERRORS, model_error_stage, parse_source, scratch_root
+
+_CACHE_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    message: str
+    # 1-based, as RenderCV reports them; None when the error has no position
+    # (e.g. the document isn't a mapping at all).
+    line: int | None = None
+    column: int | None = None
+    end_line: int | None = None
+    end_column: int | None = None
+    path: tuple[str, ...] = ()  # schema location, e.g. ("cv", "phone")
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    stage: str | None  # None when valid, else "yaml" | "schema" (same as CompileError.stage)
+    errors: tuple[ValidationIssue, ...] = ()
+
+    @property
+    def valid(self) -> bool:
+        return self.stage is None
+
+
+@lru_cache(maxsize=_CACHE_ENTRIES)
+def validate_source(source_text: str) -> ValidationResult:
+    try:
+        parse_source(source_text, scratch_root() / "cv.yaml")
+    except MODEL_ERRORS as exc:
+        if not isinstance(exc, RenderCVUserValidationError):
+            issue = ValidationIssue(message=exc.message or str(exc))
+            return ValidationResult(stage=model_error_stage(exc), errors=(issue,))
+        issues = []
+        for error in exc.validation_errors:
+            (line, column), (end_line, end_column) = error.yaml_location or ((None, None), (None, None))
+            issues.append(
+                ValidationIssue(
+                    message=error.message,
+                    line=line,
+                    column=column,
+                    end_line=end_line,
+                    end_column=end_column,
+                    path=tuple(str(part) for part in error.schema_location or ()),
+                )
+            )
+        return ValidationResult(stage=model_error_stage(exc), errors=tuple(issues))
+    return ValidationResult(stage=None)
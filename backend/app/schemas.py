@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, field_validator, model_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
 
 class SignupRequest(BaseModel):
@@ -69,6 +69,7 @@ class JobOut(BaseModel):
     source_url: str | None
     raw_text: str
     parsed: dict
+    parsed_by: str
     created_at: datetime
     updated_at: datetime
 
@@ -97,6 +98,11 @@ class DocumentOut(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class DocumentPackOut(BaseModel):
+    cv: DocumentOut
+    cover_letter: DocumentOut
+
+
 class DocumentListItemOut(BaseModel):
     id: str
     job_id: str
@@ -121,6 +127,50 @@ class DocumentCompileRequest(BaseModel):
     source_text: str
 
 
+class DocumentValidateRequest(BaseModel):
+    source_text: str
+
+
+class DocumentValidationIssueOut(BaseModel):
+    message: str
+    line: int | None
+    column: int | None
+    end_line: int | None
+    end_column: int | None
+    path: list[str]
+
+    model_config = {"from_attributes": True}
+
+
+class DocumentValidateOut(BaseModel):
+    valid: bool
+    stage: str | None
+    errors: list[DocumentValidationIssueOut]
+
+    model_config = {"from_attributes": True}
+
+
+class DocumentCompileStatusOut(BaseModel):
+    document_id: str
+    state: str  # "ready" | "queued" | "compiling" | "failed" | "not_compiled"
+    stage: str | None
+    errors: list[str]
+
+
+class DocumentCompileBatchRequest(BaseModel):
+    document_ids: list[str]
+
+    @field_validator("document_ids")
+    @classmethod
+    def dedupe_and_bound(cls, v: list[str]) -> list[str]:
+        v = list(dict.fromkeys(v))
+        if not v:
+            raise ValueError("document_ids must not be empty")
+        if len(v) > 500:
+            raise ValueError("at most 500 documents per batch")
+        return v
+
+
 class JobCreateRequest(BaseModel):
     url: str | None = None
     raw_text: str | None = None
@@ -132,6 +182,10 @@ class JobCreateRequest(BaseModel):
         return self
 
 
+class JobBulkCreateRequest(BaseModel):
+    items: list[JobCreateRequest] = Field(min_length=1)
+
+
 # ---- Applications (M7) -------------------------------------------------------
 
 
@@ -0,0 +1,60 @@
+"""Server-Sent Events for long-running requests (the ``/stream`` draft
+endpoints).
+
+``event_stream`` runs one coroutine as a task, handing it an ``emit(stage,
+data)`` callback; every emitted stage goes out as an SSE event as soon as it
+happens, followed by a final ``done`` (the coroutine's result) or ``error``
+event. While nothing is happening a comment line is sent every
+``keepalive_s`` so proxies and clients don't mistake a slow LLM provider for
+a dead connection. If the client disconnects, the task is cancelled.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from fastapi import HTTPException
+
+logger = logging.getLogger("app.sse")
+
+Emit = Callable[[str, dict], None]
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(name: str, data: dict) -> str:
+    return f"event: {name}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def event_stream(
+    run: Callable[[Emit], Awaitable[dict]], keepalive_s: float
+) -> AsyncIterator[str]:
+    queue: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
+
+    async def main() -> None:
+        try:
+            result = await run(lambda stage, data: queue.put_nowait((stage, data)))
+        except HTTPException as exc:
+            queue.put_nowait(("error", {"status_code": exc.status_code, "detail": exc.detail}))
+        except Exception:
+            logger.exception("streamed request failed")
+            queue.put_nowait(("error", {"status_code": 500, "detail": "Internal server error"}))
+        else:
+            queue.put_nowait(("done", result))
+
+    task = asyncio.create_task(main())
+    try:
+        while True:
+            try:
+                stage, data = await asyncio.wait_for(queue.get(), timeout=keepalive_s)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield sse_event(stage, data)
+            if stage in ("done", "error"):
+                return
+    finally:
+        if not task.done():
+            task.cancel()
@@ -0,0 +1,105 @@
+"""Opt-in start-up warm-up (``app.warmup`` in config.yaml).
+
+rendercv, the Typst font set (loaded by each compile worker) and docling's
+layout models all load lazily, so the first compile and the first resume
+upload after a deploy pay for them. When enabled, the lifespan schedules
+this warm-up as a background task: the server starts accepting traffic
+immediately, and each component is preloaded off the event loop, in
+parallel. Progress and per-component durations are reported on
+``GET /health/ready``, which answers 503 until every component has finished
+(successfully or not — a failed warm-up just means that component loads
+lazily on first use, as before).
+
+Components:
+- ``rendercv``: imports rendercv in the API process and validates a tiny CV
+  (the path ``POST /api/documents/validate`` uses).
+- ``compile_pool``: starts the compile workers, each of which imports
+  rendercv and runs one throwaway compile — loading the Typst fonts.
+- ``docling``: starts the extraction workers (app/parsing/pool.py), each of
+  which builds its pooled docling converter and initializes the PDF
+  pipeline (layout models). Skipped when docling isn't installed.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+from app.config import warmup_components
+
+logger = logging.getLogger("app.warmup")
+
+_WARMUP_SOURCE = "cv:\n  name: Warm Up\n"
+
+
+class Warmup:
+    """``steps`` maps component name → blocking callable; a callable that
+    returns False reports the component as skipped."""
+
+    def __init__(self, steps: dict[str, Callable[[], bool | None]], enabled: bool = True):
+        self.enabled = enabled
+        self._steps = steps if enabled else {}
+        self._started_at: float | None = None
+        self._total_ms: float | None = None
+        self.components = {
+            name: {"state": "pending", "duration_ms": None, "error": None} for name in self._steps
+        }
+
+    @property
+    def ready(self) -> bool:
+        return all(c["state"] not in ("pending", "running") for c in self.components.values())
+
+    async def run(self) -> None:
+        self._started_at = time.perf_counter()
+        await asyncio.gather(*(self._run_one(name, step) for name, step in self._steps.items()))
+        self._total_ms = round((time.perf_counter() - self._started_at) * 1000, 1)
+        logger.info(
+            "warm-up finished in %.0fms: %s",
+            self._total_ms,
+            ", ".join(f"{n}={c['state']}/{c['duration_ms']}ms" for n, c in self.components.items()),
+        )
+
+    async def _run_one(self, name: str, step: Callable[[], bool | None]) -> None:
+        component = self.components[name]
+        component["state"] = "running"
+        started = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(step)
+        except Exception as exc:
+            logger.warning("warm-up of %s failed: %s", name, exc)
+            component.update(state="failed", error=str(exc) or type(exc).__name__)
+        else:
+            component["state"] = "skipped" if result is False else "done"
+        component["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+    def report(self) -> dict:
+        return {
+            "ready": self.ready,
+            "warmup_enabled": self.enabled,
+            "total_ms": self._total_ms,
+            "components": self.components,
+        }
+
+
+def _warm_rendercv() -> None:
+    from app.rendercv.validate import validate_source
+
+    validate_source(_WARMUP_SOURCE)
+
+
+def build_warmup(compile_pool, extraction_pool, enabled: bool) -> Warmup:
+    """Warm-up for the configured components; a no-op (immediately ready)
+    when not ``enabled``."""
+    available = {
+        "rendercv": _warm_rendercv,
+        "compile_pool": compile_pool.start,
+        "docling": extraction_pool.warm,
+    }
+    steps = {}
+    for name in warmup_components():
+        if name in available:
+            steps[name] = available[name]
+        else:
+            logger.warning("unknown warm-up component %r (expected one of %s)", name, sorted(available))
+    return Warmup(steps, enabled=enabled)
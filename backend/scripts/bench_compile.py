@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Compile performance benchmark with a regression gate.
+
+Usage:
+    cd backend
+    uv run python scripts/bench_compile.py --output bench.json
+    uv run python scripts/bench_compile.py --baseline bench.json --threshold 0.15
+
+Cases are every examples/*.yaml plus synthetic large CVs built through
+build_rendercv_yaml (30 roles; short and long highlights), so changes to the
+YAML builder show up here as well as rendercv/Typst upgrades.
+
+Each case runs in fresh child processes (--processes, default 3). Each child
+times importing the compile module, its first (cold) compile_pdf call, then
+--runs warm compiles, and reports its peak RSS and the PDF size. Per case:
+
+    import_ms, cold_ms       median across child processes
+    warm_p50_ms, warm_p95_ms over all warm compiles
+    peak_rss_mb              max across child processes
+    pdf_bytes
+
+With --baseline, any metric above baseline * (1 + threshold) is reported as a
+regression and the script exits 1. Baselines are machine-specific: record one
+on the machine (or CI runner) that will run the comparison.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = BACKEND_DIR.parent / "examples"
+sys.path.insert(0, str(BACKEND_DIR))
+
+GATED_METRICS = ("cold_ms", "warm_p50_ms", "warm_p95_ms", "peak_rss_mb", "pdf_bytes")
+
+_LONG_HIGHLIGHT = (
+    "Led the redesign of the {area} platform serving {n}M requests/day, cutting p99 latency "
+    "by {pct}% and infrastructure cost by ${cost}K/year through request coalescing, "
+    "tiered caching and a staged migration that shipped with zero customer-facing downtime"
+)
+
+
+def _synthetic_source(roles: int, highlights: int, long: bool) -> str:
+    from app.llm.schemas import TailoredCV, TailoredEducationEntry, TailoredExperienceEntry
+    from app.rendercv.build import build_rendercv_yaml
+
+    def highlight(i: int, j: int) -> str:
+        if long:
+            return _LONG_HIGHLIGHT.format(area=f"service-{i}", n=j + 2, pct=10 + j, cost=40 + i)
+        return f"Shipped feature {j} for team {i}, improving conversion by {j + 1}%"
+
+    experience = [
+        {
+            "company": f"Company {i}",
+            "position": "Senior Software Engineer",
+            "start_date": f"{2024 - i}-01",
+            "end_date": f"{2024 - i}-12",
+            "date": "",
+            "location": "Remote",
+            "summary": "",
+            "highlights": [highlight(i, j) for j in range(highlights)],
+            "tech": ["Python", "Go"],
+        }
+        for i in range(roles)
+    ]
+    profile = {
+        "contact": {"name": "Bench Mark", "email": "bench@example.com", "location": "Remote"},
+        "summary": "Synthetic benchmark profile.",
+        "skills": [{"label": "Languages", "details": "Python, Go, Rust, TypeScript"}],
+        "experience": experience,
+        "projects": [],
+        "education": [
+            {
+                "institution": "State University",
+                "area": "Computer Science",
+                "degree": "B.S.",
+                "start_date": "1990-09",
+                "end_date": "1994-06",
+                "date": "",
+                "location": "",
+                "summary": "",
+                "highlights": [],
+            }
+        ],
+        "publications": [],
+        "extras": [],
+        "enrichment": [],
+    }
+    tailored = TailoredCV(
+        summary="Engineer with three decades of platform experience.",
+        section_order=["experience", "education", "skills"],
+        skills=[],
+        experience=[
+            TailoredExperienceEntry(index=i, summary="", highlights=e["highlights"])
+            for i, e in enumerate(experience)
+        ],
+        projects=[],
+        education=[TailoredEducationEntry(index=0, highlights=[])],
+        publications=[],
+        extras=[],
+    )
+    return build_rendercv_yaml(profile, tailored, {"keywords": []}, "engineeringresumes")
+
+
+def case_names() -> list[str]:
+    examples = [p.stem for p in sorted(EXAMPLES_DIR.glob("*.yaml"))]
+    return examples + ["synthetic_30_roles", "synthetic_30_roles_long_highlights"]
+
+
+def case_source(name: str) -> str:
+    if name == "synthetic_30_roles":
+        return _synthetic_source(roles=30, highlights=4, long=False)
+    if name == "synthetic_30_roles_long_highlights":
+        return _synthetic_source(roles=30, highlights=8, long=True)
+    return (EXAMPLES_DIR / f"{name}.yaml").read_text()
+
+
+# ---- child process ---------------------------------------------------------
+
+
+def run_child(name: str, runs: int, mode: str | None) -> None:
+    import resource
+
+    started = time.perf_counter()
+    from app.rendercv.compile import compile_pdf
+
+    import_ms = (time.perf_counter() - started) * 1000
+    source = case_source(name)
+
+    started = time.perf_counter()
+    pdf_bytes = compile_pdf(source, mode=mode)
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    warm_ms = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        compile_pdf(source, mode=mode)
+        warm_ms.append((time.perf_counter() - started) * 1000)
+
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KiB on Linux
+    if sys.platform == "darwin":
+        peak_rss_kb //= 1024  # bytes on macOS
+    print(json.dumps({
+        "import_ms": import_ms,
+        "cold_ms": cold_ms,
+        "warm_ms": warm_ms,
+        "peak_rss_mb": peak_rss_kb / 1024,
+        "pdf_bytes": len(pdf_bytes),
+    }))
+
+
+# ---- parent ----------------------------------------------------------------
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def bench_case(name: str, processes: int, runs: int, mode: str | None) -> dict:
+    samples = []
+    for _ in range(processes):
+        command = [sys.executable, __file__, "--child", name, "--runs", str(runs)]
+        if mode:
+            command += ["--mode", mode]
+        out = subprocess.run(command, cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    warm = sorted(ms for s in samples for ms in s["warm_ms"])
+    return {
+        "import_ms": round(statistics.median(s["import_ms"] for s in samples), 1),
+        "cold_ms": round(statistics.median(s["cold_ms"] for s in samples), 1),
+        "warm_p50_ms": round(statistics.median(warm), 1) if warm else None,
+        "warm_p95_ms": round(_percentile(warm, 0.95), 1) if warm else None,
+        "peak_rss_mb": round(max(s["peak_rss_mb"] for s in samples), 1),
+        "pdf_bytes": samples[-1]["pdf_bytes"],
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name, metrics in results["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if base is None:
+            continue
+        for metric in GATED_METRICS:
+            current, previous = metrics.get(metric), base.get(metric)
+            if current is None or not previous:
+                continue
+            if current > previous * (1 + threshold):
+                change = (current / previous - 1) * 100
+                regressions.append(f"{name}.{metric}: {previous} → {current} (+{change:.0f}%)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="warm compiles per child process")
+    parser.add_argument("--processes", type=int, default=3, help="fresh child processes per case")
+    parser.add_argument("--mode", choices=("memory", "tempdir"), help="override app.rendercv.compile_mode")
+    parser.add_argument("--cases", help="only run cases whose name contains this substring")
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative increase (0.15 = 15%%)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.runs, args.mode)
+        return 0
+
+    import rendercv
+
+    names = [n for n in case_names() if not args.cases or args.cases in n]
+    results = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "rendercv": rendercv.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mode": args.mode or "config",
+        "runs": args.runs,
+        "processes": args.processes,
+        "cases": {},
+    }
+    for name in names:
+        print(f"{name} ...", end=" ", flush=True)
+        results["cases"][name] = metrics = bench_case(name, args.processes, args.runs, args.mode)
+        print(", ".join(f"{k}={v}" for k, v in metrics.items()), flush=True)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
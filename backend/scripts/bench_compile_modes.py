@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Compare the two RenderCV compile modes (app.rendercv.compile_mode).
+
+Usage:
+    cd backend && uv run python scripts/bench_compile_modes.py [--runs 20] [--json]
+
+Compiles every examples/*.yaml in-process with compile_pdf(mode=...) for each
+mode, after one warm-up compile per mode, and reports per compile:
+
+- latency p50/p95 (ms)
+- read/write syscalls (syscr/syscw deltas from /proc/self/io; Linux only)
+- filesystem operations seen by Python audit hooks (file opens for writing,
+  mkdir, unlink/remove, rmdir, rename) — the TemporaryDirectory churn the
+  memory mode is meant to remove.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.rendercv.compile import COMPILE_MODES, compile_pdf, scratch_root
+
+EXAMPLES_DIR = Path(__file__).parent.parent.parent / "examples"
+
+_FS_EVENTS = {"os.mkdir", "os.remove", "os.rmdir", "os.rename", "shutil.rmtree", "shutil.copyfile"}
+_fs_ops = 0
+_counting = False
+
+
+def _audit(event: str, args: tuple) -> None:
+    global _fs_ops
+    if not _counting:
+        return
+    if event in _FS_EVENTS:
+        _fs_ops += 1
+    elif event == "open" and _opens_for_write(*args):
+        _fs_ops += 1
+
+
+def _opens_for_write(_path, mode, flags) -> bool:
+    if isinstance(mode, str):
+        return any(c in mode for c in "wax+")
+    return bool(flags & (os.O_WRONLY | os.O_RDWR | os.O_CREAT))
+
+
+def _proc_io() -> dict[str, int]:
+    try:
+        lines = Path("/proc/self/io").read_text().splitlines()
+    except OSError:
+        return {}
+    return {k: int(v) for k, v in (line.split(": ") for line in lines)}
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def bench_mode(mode: str, sources: list[str], runs: int) -> dict:
+    global _counting, _fs_ops
+    compile_pdf(sources[0], mode=mode)  # warm-up: fonts, templates, compiler
+
+    latencies: list[float] = []
+    _fs_ops = 0
+    io_before = _proc_io()
+    _counting = True
+    try:
+        for _ in range(runs):
+            for source in sources:
+                started = time.perf_counter()
+                compile_pdf(source, mode=mode)
+                latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        _counting = False
+    io_after = _proc_io()
+
+    n = len(latencies)
+    ordered = sorted(latencies)
+    result = {
+        "mode": mode,
+        "compiles": n,
+        "p50_ms": round(statistics.median(ordered), 1),
+        "p95_ms": round(_percentile(ordered, 0.95), 1),
+        "fs_ops_per_compile": round(_fs_ops / n, 1),
+    }
+    if io_before and io_after:
+        result["syscr_per_compile"] = round((io_after["syscr"] - io_before["syscr"]) / n, 1)
+        result["syscw_per_compile"] = round((io_after["syscw"] - io_before["syscw"]) / n, 1)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="passes over examples/*.yaml per mode")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    sources = [p.read_text() for p in sorted(EXAMPLES_DIR.glob("*.yaml"))]
+    if not sources:
+        print(f"No YAML files found in {EXAMPLES_DIR}")
+        return 1
+
+    sys.addaudithook(_audit)
+    results = [bench_mode(mode, sources, args.runs) for mode in COMPILE_MODES]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{len(sources)} example(s) x {args.runs} run(s); scratch root: {scratch_root()}\n")
+    columns = ["mode", "compiles", "p50_ms", "p95_ms", "fs_ops_per_compile", "syscr_per_compile", "syscw_per_compile"]
+    print("  ".join(f"{c:>18}" for c in columns))
+    for row in results:
+        print("  ".join(f"{str(row.get(c, '-')):>18}" for c in columns))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
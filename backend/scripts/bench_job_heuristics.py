@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Score the LLM-free job parser (app/parsing/heuristic.py) against the LLM
+parses already stored in the database.
+
+Usage:
+    cd backend && uv run python scripts/bench_job_heuristics.py [--db PATH] [--limit N] [--json]
+
+Every job whose ``parsed_by`` is "llm" is re-parsed heuristically from its
+``raw_text`` and compared field by field with the stored parse:
+- title / company / location / seniority: exact match (case- and
+  whitespace-insensitive), plus how often the heuristic left it empty;
+- responsibilities / must_have / nice_to_have: precision and recall, an item
+  counting as matched when its word overlap (Jaccard) with some item on the
+  other side is at least 0.5;
+- keywords: precision and recall over case-insensitive terms.
+Also reports heuristic latency (p50/p95). Note that seed_demo_data.py's jobs
+are hand-written, not LLM parses — benchmark on a database of real adds.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.db.models import Job
+from app.parsing.heuristic import heuristic_parse_job
+
+SCALAR_FIELDS = ["title", "company", "location", "seniority"]
+LIST_FIELDS = ["responsibilities", "must_have", "nice_to_have"]
+_MATCH_JACCARD = 0.5
+
+
+def _norm(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def _words(text: str) -> set[str]:
+    return set(re.findall(r"[\w+#.]+", text.casefold()))
+
+
+def _jaccard(a: str, b: str) -> float:
+    wa, wb = _words(a), _words(b)
+    return len(wa & wb) / len(wa | wb) if wa | wb else 0.0
+
+
+def _matched(items: list[str], others: list[str]) -> int:
+    return sum(any(_jaccard(item, other) >= _MATCH_JACCARD for other in others) for item in items)
+
+
+def _ratio(num: int, den: int) -> float | None:
+    return round(num / den, 3) if den else None
+
+
+def score(pairs: list[tuple[dict, dict, float]]) -> dict:
+    """``pairs``: (stored LLM parse, heuristic parse, heuristic ms) per job."""
+    result: dict = {"jobs": len(pairs)}
+    for field in SCALAR_FIELDS:
+        exact = sum(_norm(llm.get(field, "")) == _norm(h[field]) for llm, h, _ in pairs)
+        empty = sum(not h[field] for _, h, _ in pairs)
+        result[field] = {"exact": _ratio(exact, len(pairs)), "empty": _ratio(empty, len(pairs))}
+    for field in LIST_FIELDS:
+        h_items = sum(len(h[field]) for _, h, _ in pairs)
+        llm_items = sum(len(llm.get(field, [])) for llm, _, _ in pairs)
+        result[field] = {
+            "precision": _ratio(sum(_matched(h[field], llm.get(field, [])) for llm, h, _ in pairs), h_items),
+            "recall": _ratio(sum(_matched(llm.get(field, []), h[field]) for llm, h, _ in pairs), llm_items),
+        }
+    hits = h_total = llm_total = 0
+    for llm, h, _ in pairs:
+        expected = {_norm(k) for k in llm.get("keywords", [])}
+        got = {_norm(k) for k in h["keywords"]}
+        hits, h_total, llm_total = hits + len(expected & got), h_total + len(got), llm_total + len(expected)
+    result["keywords"] = {"precision": _ratio(hits, h_total), "recall": _ratio(hits, llm_total)}
+    latencies = sorted(ms for _, _, ms in pairs)
+    result["latency_ms"] = {
+        "p50": round(statistics.median(latencies), 2),
+        "p95": round(latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))], 2),
+    }
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", type=Path, default=BACKEND_DIR / "app" / "data" / "hirable.db")
+    parser.add_argument("--limit", type=int, default=None, help="score at most N jobs (newest first)")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        print(f"no database at {args.db}", file=sys.stderr)
+        return 1
+    engine = create_engine(f"sqlite:///{args.db}")
+    with Session(engine) as db:
+        query = select(Job.raw_text, Job.parsed).where(Job.parsed_by == "llm").order_by(Job.created_at.desc())
+        rows = db.execute(query.limit(args.limit)).all()
+    if not rows:
+        print("no LLM-parsed jobs to compare against", file=sys.stderr)
+        return 1
+
+    pairs = []
+    for raw_text, parsed in rows:
+        started = time.perf_counter()
+        heuristic = heuristic_parse_job(raw_text).model_dump()
+        pairs.append((parsed, heuristic, (time.perf_counter() - started) * 1000))
+    result = score(pairs)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(f"jobs: {result['jobs']}   heuristic latency p50 {result['latency_ms']['p50']} ms, "
+          f"p95 {result['latency_ms']['p95']} ms")
+    print(f"{'field':<18}{'exact':>8}{'empty':>8}")
+    for field in SCALAR_FIELDS:
+        print(f"{field:<18}{result[field]['exact']:>8}{result[field]['empty']:>8}")
+    print(f"{'field':<18}{'precision':>10}{'recall':>8}")
+    for field in [*LIST_FIELDS, "keywords"]:
+        print(f"{field:<18}{str(result[field]['precision']):>10}{str(result[field]['recall']):>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
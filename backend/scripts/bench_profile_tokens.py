@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Measure the prompt tokens saved by the compact profile serializer
+(app/llm/compact.py) against the json.dumps(profile.data) it replaces.
+
+Usage:
+    cd backend && uv run python scripts/bench_profile_tokens.py [--json]
+
+Profiles are every examples/*.yaml (converted with seed_demo_data.py's
+yaml_to_profile_model) plus synthetic 10- and 30-role histories. Per profile it reports the
+size of the profile block each drafting call embeds — characters and
+tokens — both ways, and the per-call saving. Tokens are counted with
+tiktoken's cl100k_base when tiktoken is installed (a proxy: Anthropic's
+tokenizer isn't public), else estimated at 4 characters per token. For real
+per-call numbers, compare ``input_tokens`` under ``llm`` in
+GET /api/admin/metrics before and after toggling app.llm.compact_profile.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import yaml
+
+BACKEND_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = BACKEND_DIR.parent / "examples"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.llm.compact import compact_profile_json
+from app.llm.schemas import ContactInfo, EducationItem, ExperienceItem, ProfileModel, SkillItem
+from seed_demo_data import yaml_to_profile_model
+
+try:
+    import tiktoken
+except ImportError:  # optional — fall back to the chars/4 estimate
+    tiktoken = None
+
+
+def _counter():
+    if tiktoken is None:
+        return "chars/4", lambda text: len(text) // 4 + 1
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return "cl100k_base", lambda text: len(encoding.encode(text))
+
+
+def _synthetic_profile(roles: int) -> dict:
+    return ProfileModel(
+        contact=ContactInfo(name="Sam Synthetic", email="sam@example.com", location="Remote"),
+        summary="Backend engineer with a long career across infrastructure and data teams.",
+        skills=[SkillItem(label="Languages", details="Python, Go, SQL")],
+        experience=[
+            ExperienceItem(
+                company=f"Company {i}",
+                position="Senior Software Engineer",
+                start_date=f"{2024 - 2 * i}-01",
+                end_date="present" if i == 0 else f"{2025 - 2 * i}-12",
+                highlights=[f"Shipped feature {j} for team {i}, improving conversion by {j + 1}%" for j in range(4)],
+            )
+            for i in range(roles)
+        ],
+        education=[EducationItem(institution="State University", area="Computer Science", degree="B.S.")],
+    ).model_dump()
+
+
+def _example_profile(path: Path) -> dict:
+    cv_dict = yaml.safe_load(path.read_text())
+    cv = cv_dict.get("cv", {})
+    # yaml_to_profile_model looks sections up by their title-cased names.
+    cv["sections"] = {name.title(): entries for name, entries in cv.get("sections", {}).items()}
+    return yaml_to_profile_model(cv_dict).model_dump()
+
+
+def profiles() -> dict[str, dict]:
+    cases = {path.stem: _example_profile(path) for path in sorted(EXAMPLES_DIR.glob("*.yaml"))}
+    cases["synthetic_10_roles"] = _synthetic_profile(10)
+    cases["synthetic_30_roles"] = _synthetic_profile(30)
+    return cases
+
+
+def measure(data: dict, count) -> dict:
+    before = json.dumps(data)
+    after = compact_profile_json(data)
+    before_tokens, after_tokens = count(before), count(after)
+    return {
+        "chars_before": len(before),
+        "chars_after": len(after),
+        "tokens_before": before_tokens,
+        "tokens_after": after_tokens,
+        "tokens_saved": before_tokens - after_tokens,
+        "saved_pct": round(100 * (before_tokens - after_tokens) / before_tokens, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    tokenizer, count = _counter()
+    results = {name: measure(data, count) for name, data in profiles().items()}
+    if args.json:
+        print(json.dumps({"tokenizer": tokenizer, "profiles": results}, indent=2))
+        return 0
+
+    print(f"tokenizer: {tokenizer} (per drafting call; tailor_profile and tailor_cover_letter each embed it)")
+    print(f"{'profile':<24}{'tokens before':>14}{'after':>8}{'saved':>8}{'saved %':>9}")
+    for name, r in results.items():
+        print(f"{name:<24}{r['tokens_before']:>14}{r['tokens_after']:>8}{r['tokens_saved']:>8}{r['saved_pct']:>8}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ import app.db.models  # noqa: F401 — registers all models on Base.metadata
 from app.auth.dependencies import get_db
 from app.db.base import Base
 from app.main import app
+from app.rendercv.cache import get_compile_cache
 
 
 @pytest.fixture()
@@ -36,7 +37,12 @@ def db_session(db_engine):
 
 
 @pytest.fixture()
-def client(db_session):
+def client(db_session, tmp_path, monkeypatch):
+    # Keep the compile cache's disk tier out of app/data, and give each test a
+    # fresh cache: get_compile_cache() is a singleton built on first use.
+    monkeypatch.setattr("app.rendercv.cache._CACHE_DIR", tmp_path / "pdf_cache")
+    get_compile_cache.cache_clear()
+
     def override_get_db():
         try:
             yield db_session
@@ -47,3 +53,4 @@ def client(db_session):
     with TestClient(app, raise_server_exceptions=True) as c:
         yield c
     app.dependency_overrides.clear()
+    get_compile_cache.cache_clear()
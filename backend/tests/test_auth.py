@@ -124,6 +124,26 @@ class TestAdmin:
         r2 = client.post("/api/auth/login", json={"email": "user@example.com", "password": "password123"})
         assert r2.status_code == 403
 
+    def test_admin_can_read_metrics(self, client):
+        self._setup_admin_and_user(client)
+        r = client.get("/api/admin/metrics")
+        assert r.status_code == 200
+        assert "hit_rate" in r.json()["compile_cache"]
+        assert "queue_depth" in r.json()["compile_pool"]
+        assert "rejected" in r.json()["extraction_pool"]
+        assert "queued" in r.json()["precompile"]
+        assert "entries" in r.json()["job_parse_cache"]
+        assert "upgraded" in r.json()["job_parse_upgrades"]
+        assert "prompt_cache" in r.json()
+        assert "queue_wait_ms" in r.json()["llm_admission"]
+        assert "llm" in r.json()
+
+    def test_non_admin_cannot_read_metrics(self, client):
+        _signup(client, "admin@example.com")
+        client.post("/api/auth/logout")
+        _signup(client, "user@example.com")
+        assert client.get("/api/admin/metrics").status_code == 403
+
     def test_admin_delete_cascades(self, client):
         admin, user = self._setup_admin_and_user(client)
         user_id = user["id"]
@@ -0,0 +1,78 @@
+"""Compact profile serialization for prompts (app/llm/compact.py)."""
+from __future__ import annotations
+
+import json
+
+from app.llm import compact
+from app.llm.compact import PROFILE_LEGEND, compact_profile, compact_profile_json, profile_prompt_json
+from app.llm.schemas import (
+    ContactInfo,
+    EnrichmentItem,
+    ExperienceItem,
+    ProfileModel,
+    ProjectItem,
+    SkillItem,
+    SocialNetworkItem,
+)
+
+
+def _profile() -> dict:
+    return ProfileModel(
+        contact=ContactInfo(
+            name="Jane Doe",
+            email="jane@example.com",
+            social_networks=[SocialNetworkItem(network="GitHub", username="jane")],
+        ),
+        summary="Software engineer",
+        skills=[SkillItem(label="Languages", details="Python, Go"), SkillItem()],
+        experience=[
+            ExperienceItem(
+                company="Acme",
+                position="Engineer",
+                start_date="2021-03",
+                end_date="present",
+                highlights=["Shipped X"],
+            ),
+            ExperienceItem(),  # empty — must still hold index 1
+            ExperienceItem(company="Initech", date="Summer 2019"),
+        ],
+        projects=[ProjectItem(name="Tool", tech=["Rust"])],
+        enrichment=[EnrichmentItem(key="Target Role", value="Staff Engineer")],
+    ).model_dump()
+
+
+class TestCompactProfile:
+    def test_drops_empties_and_shortens_keys(self):
+        out = compact_profile(_profile())
+
+        assert out["contact"] == {
+            "name": "Jane Doe",
+            "email": "jane@example.com",
+            "social_networks": ["GitHub: jane"],
+        }
+        assert out["experience"][0] == {"co": "Acme", "pos": "Engineer", "d": "2021-03..present", "hl": ["Shipped X"]}
+        assert out["projects"] == [{"name": "Tool", "tech": ["Rust"]}]
+        assert out["skills"] == ["Languages: Python, Go"]
+        assert out["enrichment"] == ["Target Role: Staff Engineer"]
+        assert "publications" not in out and "education" not in out
+
+    def test_indexed_items_keep_their_positions(self):
+        data = _profile()
+        out = compact_profile(data)
+
+        assert len(out["experience"]) == len(data["experience"])
+        assert out["experience"][1] == {}
+        assert out["experience"][2] == {"co": "Initech", "d": "Summer 2019"}
+
+    def test_smaller_than_json_dumps_and_deterministic(self):
+        data = _profile()
+        text = compact_profile_json(data)
+
+        assert text.startswith(PROFILE_LEGEND)
+        assert len(text) - len(PROFILE_LEGEND) < len(json.dumps(data)) / 2
+        assert compact_profile_json(dict(reversed(list(data.items())))) == text
+
+    def test_config_off_falls_back_to_full_json(self, monkeypatch):
+        data = _profile()
+        monkeypatch.setattr(compact, "llm_compact_profile", lambda: False)
+        assert json.loads(profile_prompt_json(data)) == data
@@ -0,0 +1,67 @@
+"""Pooled docling converters (app/parsing/converter.py) — pool mechanics
+only; the converters themselves need docling."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app.parsing.converter import ConverterPool
+
+
+class _Fake:
+    pass
+
+
+class TestConverterPool:
+    def test_built_lazily_and_reused(self):
+        builds = []
+        pool = ConverterPool(lambda: builds.append(_Fake()) or builds[-1], size=2)
+        assert pool.built == 0
+
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            pass
+        assert first is second
+        assert len(builds) == 1
+
+    def test_concurrent_callers_beyond_size_wait(self):
+        pool = ConverterPool(_Fake, size=2)
+        held: list[_Fake] = []
+        release = threading.Event()
+
+        def use():
+            with pool.acquire() as converter:
+                held.append(converter)
+                release.wait(timeout=2)
+
+        threads = [threading.Thread(target=use) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        assert len(held) == 2  # the third caller is waiting
+        release.set()
+        for thread in threads:
+            thread.join(timeout=2)
+        assert len(held) == 3
+        assert pool.built == 2
+        assert held[2] in held[:2]
+
+    def test_failed_build_frees_its_slot(self):
+        calls = {"n": 0}
+
+        def build():
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RuntimeError("model download failed")
+            return _Fake()
+
+        pool = ConverterPool(build, size=1)
+        with pytest.raises(RuntimeError):
+            with pool.acquire():
+                pass
+        with pool.acquire() as converter:
+            assert isinstance(converter, _Fake)
+        assert pool.built == 1
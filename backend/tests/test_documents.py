@@ -1,14 +1,20 @@
-"""M5 public documents API — draft/list/get/save/delete/compile, isolation."""
+"""M5 public documents API — draft/list/get/save/delete/compile(-batch)/preview/pdf/thumbnail, validate, isolation."""
 from __future__ import annotations
 
+import asyncio
+import io
+import json
+import zipfile
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from rendercv.exception import RenderCVInternalError
 
 from app.db.models import Document, Job, Profile
 from app.llm.deps import get_llm
-from app.llm.schemas import ProfileModel, TailoredCoverLetter, TailoredCV
+from app.llm.schemas import JobModel, ProfileModel, TailoredCoverLetter, TailoredCV, TailoredCVRevision
 from app.main import app
+from app.rendercv.validate import validate_source
 
 
 def _signup(client, email: str, password: str = "password123") -> dict:
@@ -84,6 +90,26 @@ def patched_letter_client(client):
     app.dependency_overrides.pop(get_llm, None)
 
 
+@pytest.fixture()
+def patched_pack_client(client):
+    """LLM fake answering by response_model, recording how many calls overlap."""
+    canned = {TailoredCV: _fake_tailored_cv(), TailoredCoverLetter: _fake_tailored_cover_letter()}
+    overlap = {"current": 0, "max": 0}
+
+    async def invoke(messages, response_model):
+        overlap["current"] += 1
+        overlap["max"] = max(overlap["max"], overlap["current"])
+        await asyncio.sleep(0.05)
+        overlap["current"] -= 1
+        return MagicMock(parsed=canned[response_model])
+
+    fake_llm = MagicMock()
+    fake_llm.invoke = AsyncMock(side_effect=invoke)
+    app.dependency_overrides[get_llm] = lambda: fake_llm
+    yield client, fake_llm, overlap
+    app.dependency_overrides.pop(get_llm, None)
+
+
 class TestDraft:
     def test_draft_creates_v1(self, patched_client, db_session):
         client, _ = patched_client
@@ -224,6 +250,284 @@ class TestCompile:
         r = client.post("/api/documents/compile", json={"source_text": "cv:\n  name: X\n"})
         assert r.status_code == 401
 
+    def test_compile_batch_streams_zip_with_per_item_errors(self, patched_client, db_session):
+        client, _ = patched_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+        good = client.post("/api/documents/draft", json={"job_id": job.id}).json()
+        bad = client.put(
+            f"/api/documents/{good['id']}", json={"source_text": "cv:\n  name: [unterminated"}
+        ).json()
+
+        r = client.post("/api/documents/compile-batch", json={"document_ids": [good["id"], bad["id"]]})
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "application/zip"
+
+        with zipfile.ZipFile(io.BytesIO(r.content)) as archive:
+            manifest = json.loads(archive.read("manifest.json"))
+            by_id = {entry["document_id"]: entry for entry in manifest}
+            assert by_id[good["id"]]["status"] == "ok"
+            assert archive.read(by_id[good["id"]]["file"])[:4] == b"%PDF"
+            assert by_id[bad["id"]]["stage"] == "yaml"
+            error = json.loads(archive.read(by_id[bad["id"]]["file"]))
+            assert error["stage"] == "yaml"
+
+    def test_compile_batch_rejects_other_users_documents(self, patched_client, db_session):
+        client, _ = patched_client
+        user_a = _signup(client, "a@example.com")
+        _seed_profile(db_session, user_a["id"])
+        job = _seed_job(db_session, user_a["id"])
+        doc = client.post("/api/documents/draft", json={"job_id": job.id}).json()
+        client.post("/api/auth/logout")
+
+        _signup(client, "b@example.com")
+        r = client.post("/api/documents/compile-batch", json={"document_ids": [doc["id"]]})
+        assert r.status_code == 404
+
+
+class TestPreview:
+    def test_preview_returns_first_page_png_and_queues_pdf(self, patched_client):
+        client, _ = patched_client
+        _signup(client, "a@example.com")
+        source = "cv:\n  name: Preview Probe\n"
+
+        r = client.post("/api/documents/preview", json={"source_text": source})
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "image/png"
+        assert r.content[:8] == b"\x89PNG\r\n\x1a\n"
+
+        r = client.post("/api/documents/compile", json={"source_text": source})
+        assert r.content[:4] == b"%PDF"
+
+    def test_preview_invalid_yaml_returns_422_with_stage(self, patched_client):
+        client, _ = patched_client
+        _signup(client, "a@example.com")
+
+        r = client.post("/api/documents/preview", json={"source_text": "cv:\n  name: [unterminated"})
+        assert r.status_code == 422
+        assert r.json()["detail"]["stage"] == "yaml"
+
+    def test_thumbnail_is_png_and_cacheable(self, patched_client, db_session):
+        client, _ = patched_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+        doc = client.post("/api/documents/draft", json={"job_id": job.id}).json()
+
+        r = client.get(f"/api/documents/{doc['id']}/thumbnail")
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "image/png"
+        assert "immutable" in r.headers["cache-control"]
+
+        r = client.get(
+            f"/api/documents/{doc['id']}/thumbnail", headers={"If-None-Match": r.headers["etag"]}
+        )
+        assert r.status_code == 304
+
+    def test_thumbnail_of_other_users_document_404(self, patched_client, db_session):
+        client, _ = patched_client
+        user_a = _signup(client, "a@example.com")
+        _seed_profile(db_session, user_a["id"])
+        job = _seed_job(db_session, user_a["id"])
+        doc = client.post("/api/documents/draft", json={"job_id": job.id}).json()
+        client.post("/api/auth/logout")
+
+        _signup(client, "b@example.com")
+        assert client.get(f"/api/documents/{doc['id']}/thumbnail").status_code == 404
+
+
+class TestDocumentPdf:
+    def _draft(self, client, db_session) -> dict:
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+        return client.post("/api/documents/draft", json={"job_id": job.id}).json()
+
+    def test_pdf_has_strong_etag_and_immutable_cache_headers(self, patched_client, db_session):
+        client, _ = patched_client
+        doc = self._draft(client, db_session)
+
+        r = client.get(f"/api/documents/{doc['id']}/pdf")
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "application/pdf"
+        assert r.content[:4] == b"%PDF"
+        assert r.headers["etag"].startswith('"') and not r.headers["etag"].startswith("W/")
+        assert "immutable" in r.headers["cache-control"]
+        assert r.headers["accept-ranges"] == "bytes"
+
+    def test_if_none_match_returns_304(self, patched_client, db_session):
+        client, _ = patched_client
+        doc = self._draft(client, db_session)
+        etag = client.get(f"/api/documents/{doc['id']}/pdf").headers["etag"]
+
+        r = client.get(f"/api/documents/{doc['id']}/pdf", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert r.content == b""
+        assert r.headers["etag"] == etag
+
+    def test_new_version_gets_new_etag(self, patched_client, db_session):
+        client, _ = patched_client
+        doc = self._draft(client, db_session)
+        edited = client.put(
+            f"/api/documents/{doc['id']}", json={"source_text": "cv:\n  name: Edited\n"}
+        ).json()
+
+        first = client.get(f"/api/documents/{doc['id']}/pdf").headers["etag"]
+        second = client.get(f"/api/documents/{edited['id']}/pdf").headers["etag"]
+        assert first != second
+
+    def test_unpinned_render_date_gets_weak_etag_without_immutable(self, patched_client, db_session):
+        client, _ = patched_client
+        doc = self._draft(client, db_session)
+        edited = client.put(
+            f"/api/documents/{doc['id']}", json={"source_text": "cv:\n  name: Edited\n"}
+        ).json()
+
+        r = client.get(f"/api/documents/{edited['id']}/pdf")
+        etag = r.headers["etag"]
+        assert etag.startswith('W/"')
+        assert "immutable" not in r.headers["cache-control"]
+        assert "no-cache" in r.headers["cache-control"]
+
+        r = client.get(f"/api/documents/{edited['id']}/pdf", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+
+        r = client.get(
+            f"/api/documents/{edited['id']}/pdf", headers={"Range": "bytes=0-3", "If-Range": etag}
+        )
+        assert r.status_code == 200  # If-Range never matches a weak ETag
+
+    def test_byte_range_returns_206(self, patched_client, db_session):
+        client, _ = patched_client
+        doc = self._draft(client, db_session)
+        full = client.get(f"/api/documents/{doc['id']}/pdf").content
+
+        r = client.get(f"/api/documents/{doc['id']}/pdf", headers={"Range": "bytes=0-3"})
+        assert r.status_code == 206
+        assert r.content == b"%PDF"
+        assert r.headers["content-range"] == f"bytes 0-3/{len(full)}"
+
+        r = client.get(f"/api/documents/{doc['id']}/pdf", headers={"Range": "bytes=-5"})
+        assert r.content == full[-5:]
+
+    def test_range_past_end_returns_416(self, patched_client, db_session):
+        client, _ = patched_client
+        doc = self._draft(client, db_session)
+
+        r = client.get(f"/api/documents/{doc['id']}/pdf", headers={"Range": "bytes=99999999-"})
+        assert r.status_code == 416
+        assert r.headers["content-range"].startswith("bytes */")
+
+    def test_stale_if_range_serves_full_body(self, patched_client, db_session):
+        client, _ = patched_client
+        doc = self._draft(client, db_session)
+
+        r = client.get(
+            f"/api/documents/{doc['id']}/pdf",
+            headers={"Range": "bytes=0-3", "If-Range": '"stale"'},
+        )
+        assert r.status_code == 200
+        assert r.content[:4] == b"%PDF"
+
+    def test_pdf_of_other_users_document_404(self, patched_client, db_session):
+        client, _ = patched_client
+        doc = self._draft(client, db_session)
+        client.post("/api/auth/logout")
+
+        _signup(client, "b@example.com")
+        assert client.get(f"/api/documents/{doc['id']}/pdf").status_code == 404
+
+
+class TestCompileStatus:
+    def test_status_ready_once_pdf_is_cached(self, patched_client, db_session):
+        client, _ = patched_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+        doc = client.post("/api/documents/draft", json={"job_id": job.id}).json()
+
+        client.post("/api/documents/compile", json={"source_text": doc["source_text"]})
+        r = client.get(f"/api/documents/{doc['id']}/status")
+        assert r.status_code == 200
+        assert r.json()["document_id"] == doc["id"]
+        assert r.json()["state"] == "ready"
+
+    def test_status_of_other_users_document_404(self, patched_client, db_session):
+        client, _ = patched_client
+        user_a = _signup(client, "a@example.com")
+        _seed_profile(db_session, user_a["id"])
+        job = _seed_job(db_session, user_a["id"])
+        doc = client.post("/api/documents/draft", json={"job_id": job.id}).json()
+        client.post("/api/auth/logout")
+
+        _signup(client, "b@example.com")
+        assert client.get(f"/api/documents/{doc['id']}/status").status_code == 404
+
+
+class TestValidate:
+    def test_valid_source(self, patched_client):
+        client, _ = patched_client
+        _signup(client, "a@example.com")
+
+        r = client.post("/api/documents/validate", json={"source_text": "cv:\n  name: Jane Doe\n"})
+        assert r.status_code == 200
+        assert r.json() == {"valid": True, "stage": None, "errors": []}
+
+    def test_yaml_error_has_line_and_column(self, patched_client):
+        client, _ = patched_client
+        _signup(client, "a@example.com")
+
+        r = client.post("/api/documents/validate", json={"source_text": "cv:\n  name: [unterminated"})
+        assert r.status_code == 200
+        body = r.json()
+        assert body["valid"] is False
+        assert body["stage"] == "yaml"
+        assert body["errors"][0]["line"] is not None
+        assert body["errors"][0]["column"] is not None
+
+    def test_schema_error_has_path(self, patched_client):
+        client, _ = patched_client
+        _signup(client, "a@example.com")
+
+        r = client.post(
+            "/api/documents/validate",
+            json={"source_text": "cv:\n  name: Jane Doe\n  phone: \"555-1234\"\n"},
+        )
+        body = r.json()
+        assert body["stage"] == "schema"
+        assert "phone" in body["errors"][0]["path"]
+        assert body["errors"][0]["line"] is not None
+
+    def test_internal_model_error_is_schema_stage_not_500(self, patched_client, monkeypatch):
+        client, _ = patched_client
+        _signup(client, "a@example.com")
+
+        def raise_internal(*args, **kwargs):
+            raise RenderCVInternalError("unexpected value for entry")
+
+        monkeypatch.setattr("app.rendercv.compile.build_rendercv_dictionary_and_model", raise_internal)
+        r = client.post("/api/documents/validate", json={"source_text": "cv:\n  name: Internal Probe\n"})
+        assert r.status_code == 200
+        body = r.json()
+        assert body["stage"] == "schema"
+        assert body["errors"][0]["message"] == "unexpected value for entry"
+
+    def test_repeat_source_served_from_cache(self, patched_client):
+        client, _ = patched_client
+        _signup(client, "a@example.com")
+        source = "cv:\n  name: Cache Probe\n"
+
+        client.post("/api/documents/validate", json={"source_text": source})
+        hits_before = validate_source.cache_info().hits
+        client.post("/api/documents/validate", json={"source_text": source})
+        assert validate_source.cache_info().hits == hits_before + 1
+
+    def test_validate_unauthenticated_401(self, patched_client):
+        client, _ = patched_client
+        r = client.post("/api/documents/validate", json={"source_text": "cv:\n  name: X\n"})
+        assert r.status_code == 401
+
 
 class TestDraftCoverLetter:
     def test_draft_creates_v1(self, patched_letter_client, db_session):
@@ -276,6 +580,326 @@ class TestDraftCoverLetter:
         assert r_cv.json() == []
 
 
+class TestDraftPack:
+    def test_drafts_both_concurrently(self, patched_pack_client, db_session):
+        client, fake_llm, overlap = patched_pack_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+
+        r = client.post("/api/documents/draft-pack", json={"job_id": job.id, "instructions": "Go"})
+        assert r.status_code == 201, r.text
+        body = r.json()
+        assert body["cv"]["type"] == "cv" and body["cv"]["version"] == 1
+        assert body["cover_letter"]["type"] == "cover_letter" and body["cover_letter"]["version"] == 1
+        assert fake_llm.invoke.call_count == 2
+        assert overlap["max"] == 2
+
+    def test_versions_continue_existing_sequences(self, patched_pack_client, db_session):
+        client, _, _ = patched_pack_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+        client.post("/api/documents/draft", json={"job_id": job.id})
+
+        body = client.post("/api/documents/draft-pack", json={"job_id": job.id}).json()
+        assert body["cv"]["version"] == 2
+        assert body["cover_letter"]["version"] == 1
+
+    def test_llm_failure_persists_nothing(self, patched_pack_client, db_session):
+        from llm_kit.errors import LLMError
+
+        client, fake_llm, _ = patched_pack_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+
+        async def flaky(messages, response_model):
+            if response_model is TailoredCoverLetter:
+                raise LLMError("upstream down")
+            return MagicMock(parsed=_fake_tailored_cv())
+
+        fake_llm.invoke.side_effect = flaky
+        r = client.post("/api/documents/draft-pack", json={"job_id": job.id})
+        assert r.status_code == 502
+        assert db_session.query(Document).filter_by(job_id=job.id).count() == 0
+
+    def test_missing_profile_404(self, patched_pack_client, db_session):
+        client, _, _ = patched_pack_client
+        user = _signup(client, "a@example.com")
+        job = _seed_job(db_session, user["id"])
+
+        r = client.post("/api/documents/draft-pack", json={"job_id": job.id})
+        assert r.status_code == 404
+
+    def test_other_users_job_404(self, patched_pack_client, db_session):
+        client, _, _ = patched_pack_client
+        owner = _signup(client, "a@example.com")
+        job = _seed_job(db_session, owner["id"])
+        client.post("/api/auth/logout")
+        other = _signup(client, "b@example.com")
+        _seed_profile(db_session, other["id"])
+
+        r = client.post("/api/documents/draft-pack", json={"job_id": job.id})
+        assert r.status_code == 404
+
+
+@pytest.fixture()
+def speculative_client(client, monkeypatch):
+    """Speculative pre-tailoring on; the LLM fake answers by response_model
+    and records which models it was asked for."""
+    monkeypatch.setattr("app.rendercv.speculative.speculative_tailoring_enabled", lambda: True)
+    canned = {
+        JobModel: JobModel(company="Acme", title="Engineer"),
+        TailoredCV: _fake_tailored_cv(),
+        TailoredCoverLetter: _fake_tailored_cover_letter(),
+    }
+    calls: list[type] = []
+
+    async def invoke(messages, response_model):
+        calls.append(response_model)
+        return MagicMock(parsed=canned[response_model])
+
+    fake_llm = MagicMock()
+    fake_llm.invoke = AsyncMock(side_effect=invoke)
+    app.dependency_overrides[get_llm] = lambda: fake_llm
+    yield client, calls
+    app.dependency_overrides.pop(get_llm, None)
+
+
+def _add_job(client) -> str:
+    r = client.post("/api/jobs", json={"raw_text": "Engineer at Acme"})
+    assert r.status_code == 201, r.text
+    return r.json()["job"]["id"]
+
+
+class TestSpeculativeTailoring:
+    def test_draft_reuses_pretailored_cv(self, speculative_client, db_session):
+        client, calls = speculative_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job_id = _add_job(client)
+
+        r = client.post("/api/documents/draft", json={"job_id": job_id})
+        assert r.status_code == 201, r.text
+        assert "Tailored." in r.json()["source_text"]
+        assert calls.count(TailoredCV) == 1  # the speculative call only
+        assert app.state.speculative.stats()["reused"] == 1
+
+        client.post("/api/documents/draft", json={"job_id": job_id})
+        assert calls.count(TailoredCV) == 2  # used once, then tailored afresh
+
+    def test_profile_change_discards_result(self, speculative_client, db_session):
+        client, calls = speculative_client
+        user = _signup(client, "a@example.com")
+        profile = _seed_profile(db_session, user["id"])
+        job_id = _add_job(client)
+        profile.version += 1
+        db_session.commit()
+
+        client.post("/api/documents/draft", json={"job_id": job_id})
+        stats = app.state.speculative.stats()
+        assert stats["discarded"] == 1 and stats["reused"] == 0
+
+    def test_instructions_bypass_but_keep_result(self, speculative_client, db_session):
+        client, calls = speculative_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job_id = _add_job(client)
+
+        client.post("/api/documents/draft", json={"job_id": job_id, "instructions": "Emphasize Go"})
+        client.post("/api/documents/draft-pack", json={"job_id": job_id})
+        assert calls.count(TailoredCV) == 2  # speculative + the instructed draft
+        assert app.state.speculative.stats()["reused"] == 1
+        assert calls.count(TailoredCoverLetter) == 1
+
+    def test_off_by_default(self, speculative_client, db_session, monkeypatch):
+        client, calls = speculative_client
+        monkeypatch.setattr("app.rendercv.speculative.speculative_tailoring_enabled", lambda: False)
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        _add_job(client)
+        assert calls == [JobModel]
+
+
+@pytest.fixture()
+def retailor_client(client):
+    """LLM fake for delta re-tailoring: full tailoring returns the usual
+    TailoredCV, a revision changes only the summary."""
+    canned = {
+        TailoredCV: _fake_tailored_cv(),
+        TailoredCVRevision: TailoredCVRevision(summary="Go-focused."),
+    }
+    calls: list[type] = []
+
+    async def invoke(messages, response_model):
+        calls.append(response_model)
+        return MagicMock(parsed=canned[response_model])
+
+    fake_llm = MagicMock()
+    fake_llm.invoke = AsyncMock(side_effect=invoke)
+    app.dependency_overrides[get_llm] = lambda: fake_llm
+    yield client, calls
+    app.dependency_overrides.pop(get_llm, None)
+
+
+class TestDeltaRetailoring:
+    def test_draft_stores_tailoring(self, retailor_client, db_session):
+        client, _ = retailor_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+
+        r = client.post("/api/documents/draft", json={"job_id": job.id})
+        doc = db_session.get(Document, r.json()["id"])
+        assert doc.tailoring["stamp"][0] == 1
+        assert doc.tailoring["cv"] == _fake_tailored_cv().model_dump()
+
+    def test_instructions_revise_previous_tailoring(self, retailor_client, db_session):
+        client, calls = retailor_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+        client.post("/api/documents/draft", json={"job_id": job.id})
+
+        r = client.post("/api/documents/draft", json={"job_id": job.id, "instructions": "Emphasize Go"})
+        assert r.status_code == 201, r.text
+        assert calls == [TailoredCV, TailoredCVRevision]
+        assert "Go-focused." in r.json()["source_text"]
+        cv = db_session.get(Document, r.json()["id"]).tailoring["cv"]
+        assert cv["summary"] == "Go-focused."
+        assert cv["section_order"] == ["experience"]  # kept from v1
+
+    def test_profile_change_falls_back_to_full_tailoring(self, retailor_client, db_session):
+        client, calls = retailor_client
+        user = _signup(client, "a@example.com")
+        profile = _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+        client.post("/api/documents/draft", json={"job_id": job.id})
+        profile.version += 1
+        db_session.commit()
+
+        client.post("/api/documents/draft", json={"job_id": job.id, "instructions": "Emphasize Go"})
+        assert calls == [TailoredCV, TailoredCV]
+
+    def test_hand_edited_latest_version_falls_back(self, retailor_client, db_session):
+        client, calls = retailor_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+        v1 = client.post("/api/documents/draft", json={"job_id": job.id}).json()
+        client.put(f"/api/documents/{v1['id']}", json={"source_text": v1["source_text"]})
+
+        client.post("/api/documents/draft", json={"job_id": job.id, "instructions": "Emphasize Go"})
+        assert calls == [TailoredCV, TailoredCV]
+
+    def test_revision_apply_keeps_unchanged_sections(self):
+        previous = _fake_tailored_cv()
+        revision = TailoredCVRevision(summary="New.", publications=[0])
+
+        assert revision.changed_sections() == ["summary", "publications"]
+        merged = revision.apply(previous)
+        assert merged.summary == "New." and merged.publications == [0]
+        assert merged.section_order == previous.section_order
+
+
+def _sse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.split("\n\n"):
+        lines = [line for line in block.splitlines() if not line.startswith(":")]
+        if lines:
+            fields = dict(line.split(": ", 1) for line in lines)
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestDraftStream:
+    def test_cv_stream_reports_stages_then_done(self, patched_client, db_session):
+        client, _ = patched_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+
+        r = client.post("/api/documents/draft/stream", json={"job_id": job.id})
+        assert r.status_code == 200, r.text
+        assert r.headers["content-type"].startswith("text/event-stream")
+        events = _sse_events(r.text)
+        assert [name for name, _ in events] == [
+            "tailoring_started", "tokens_received", "yaml_assembled", "persisted", "done",
+        ]
+        persisted = events[3][1]
+        done = events[-1][1]
+        assert done["cv"]["id"] == persisted["document_id"]
+        assert done["cv"]["version"] == 1
+        assert db_session.get(Document, persisted["document_id"]) is not None
+
+    def test_pack_stream_reports_both_documents(self, patched_pack_client, db_session):
+        client, _, _ = patched_pack_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+
+        events = _sse_events(client.post("/api/documents/draft-pack/stream", json={"job_id": job.id}).text)
+        persisted = {data["document_type"] for name, data in events if name == "persisted"}
+        assert persisted == {"cv", "cover_letter"}
+        assert set(events[-1][1]) == {"cv", "cover_letter"}
+
+    def test_keepalive_while_llm_is_slow(self, patched_client, db_session, monkeypatch):
+        client, fake_llm = patched_client
+        monkeypatch.setattr("app.api.documents.draft_stream_keepalive_s", lambda: 0.01)
+        response = fake_llm.invoke.return_value
+
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return response
+
+        fake_llm.invoke.side_effect = slow
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+
+        r = client.post("/api/documents/draft/stream", json={"job_id": job.id})
+        assert ": keep-alive" in r.text
+        assert _sse_events(r.text)[-1][0] == "done"
+
+    def test_llm_failure_ends_with_error_event(self, patched_client, db_session):
+        from llm_kit.errors import LLMError
+
+        client, fake_llm = patched_client
+        fake_llm.invoke.side_effect = LLMError("upstream down")
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+
+        events = _sse_events(client.post("/api/documents/draft/stream", json={"job_id": job.id}).text)
+        assert [name for name, _ in events] == ["tailoring_started", "error"]
+        assert events[-1][1]["status_code"] == 502
+
+    def test_reports_precompile_outcome(self, patched_client, db_session):
+        client, _ = patched_client
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+
+        precompiler = app.state.precompiler
+        precompiler.start()
+        try:
+            events = _sse_events(client.post("/api/documents/draft/stream", json={"job_id": job.id}).text)
+        finally:
+            precompiler.shutdown()
+        precompiled = [data for name, data in events if name == "precompiled"]
+        assert len(precompiled) == 1
+        assert precompiled[0]["state"] == "ready"
+
+    def test_missing_profile_is_plain_404(self, patched_client, db_session):
+        client, _ = patched_client
+        user = _signup(client, "a@example.com")
+        job = _seed_job(db_session, user["id"])
+
+        r = client.post("/api/documents/draft/stream", json={"job_id": job.id})
+        assert r.status_code == 404
+
+
 class TestIsolation:
     def test_user_b_cannot_draft_for_user_a_job(self, patched_client, db_session):
         client, _ = patched_client
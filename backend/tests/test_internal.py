@@ -381,6 +381,36 @@ class TestDraftCv:
         assert r.status_code == 403
 
 
+class TestDraftApplicationPack:
+    def test_creates_both_documents(self, client, db_session):
+        canned = {TailoredCV: _fake_tailored_cv(), TailoredCoverLetter: _fake_tailored_cover_letter()}
+        fake_llm = MagicMock()
+        fake_llm.invoke = AsyncMock(side_effect=lambda messages, response_model: MagicMock(parsed=canned[response_model]))
+        app.dependency_overrides[get_llm] = lambda: fake_llm
+        user = _signup(client, "a@example.com")
+        _seed_profile(db_session, user["id"])
+        job = _seed_job(db_session, user["id"])
+
+        r = client.post(
+            "/internal/documents/draft-application-pack",
+            json={"user_id": user["id"], "job_id": job.id},
+            headers=_headers(),
+        )
+        app.dependency_overrides.pop(get_llm, None)
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert body["cv_version"] == 1 and body["cover_letter_version"] == 1
+        cv = db_session.get(Document, body["cv_document_id"])
+        letter = db_session.get(Document, body["cover_letter_document_id"])
+        assert (cv.type, letter.type) == ("cv", "cover_letter")
+
+    def test_missing_secret_rejected(self, client):
+        r = client.post(
+            "/internal/documents/draft-application-pack", json={"user_id": "u", "job_id": "j"}
+        )
+        assert r.status_code == 403
+
+
 class TestDraftCvIsolation:
     def test_user_b_cannot_draft_cv_for_user_a_job(self, patched_llm_client, db_session):
         client, _ = patched_llm_client
@@ -0,0 +1,63 @@
+"""LLM-free job-posting extraction (app/parsing/heuristic.py)."""
+from __future__ import annotations
+
+from app.parsing.heuristic import heuristic_parse_job
+
+_POSTING = """Senior Backend Engineer at Acme Corp
+Location: Berlin, Germany
+
+About Acme Corp
+Acme Corp is a fintech scaleup building payments infrastructure.
+
+What you'll do:
+- Design and build Python services on AWS
+- Own our Kafka-based event pipeline
+
+Requirements
+- 5+ years of backend experience with Python or Go
+- Strong PostgreSQL skills
+
+Nice to have
+* Terraform
+
+Benefits
+- 30 days vacation
+"""
+
+
+class TestHeuristicParseJob:
+    def test_extracts_header_fields(self):
+        job = heuristic_parse_job(_POSTING)
+        assert job.title == "Senior Backend Engineer"
+        assert job.company == "Acme Corp"
+        assert job.location == "Berlin, Germany"
+        assert job.seniority == "senior"
+
+    def test_routes_bullets_by_heading(self):
+        job = heuristic_parse_job(_POSTING)
+        assert job.responsibilities == [
+            "Design and build Python services on AWS",
+            "Own our Kafka-based event pipeline",
+        ]
+        assert job.must_have == ["5+ years of backend experience with Python or Go", "Strong PostgreSQL skills"]
+        assert job.nice_to_have == ["Terraform"]  # "Benefits" bullets go nowhere
+
+    def test_keywords_from_lexicon_in_order_of_appearance(self):
+        job = heuristic_parse_job(_POSTING)
+        assert job.keywords[:4] == ["Fintech", "Payments", "Python", "AWS"]
+        assert "Go" in job.keywords and "Terraform" in job.keywords
+
+    def test_lowercase_go_is_not_a_keyword(self):
+        assert "Go" not in heuristic_parse_job("We go the extra mile.").keywords
+
+    def test_labels_and_remote(self):
+        job = heuristic_parse_job(
+            "Title: Staff Data Engineer\nCompany: Initech\n\nThis is a fully remote role.\n"
+        )
+        assert (job.title, job.company, job.location, job.seniority) == (
+            "Staff Data Engineer", "Initech", "Remote", "staff",
+        )
+
+    def test_judgement_fields_left_empty(self):
+        job = heuristic_parse_job(_POSTING)
+        assert job.why_opened_guess == job.company_type == job.team_name == ""
@@ -1,13 +1,20 @@
 """M3 job ingest acceptance tests — add by URL, paste fallback, CRUD, isolation."""
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from llm_kit.errors import LLMError
 
+from app.db.models import Application, User
 from app.llm.deps import get_llm
 from app.llm.schemas import JobModel
 from app.main import app
+from app.parsing.jobs import fetch_job_text
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -84,7 +91,7 @@ class TestAddJobByUrl:
         # JobModel is flat — a single llm.invoke() call is expected (unlike
         # ProfileModel's Part1/Part2 split for its nested list-of-object fields).
         assert fake_llm.invoke.call_count == 1
-        fake_fetch.assert_called_once_with("https://example.com/job")
+        fake_fetch.assert_awaited_once_with("https://example.com/job")
 
     def test_unauthenticated_rejected(self, client):
         r = client.post("/api/jobs", json={"url": "https://example.com/job"})
@@ -211,6 +218,7 @@ class TestUpdateJob:
         assert r.status_code == 200
         body = r.json()
         assert body["parsed"]["title"] == "Staff Backend Engineer"
+        assert body["parsed_by"] == "user"
         assert body["updated_at"] != job["updated_at"] or body["updated_at"] >= job["updated_at"]
 
     def test_put_nonexistent_returns_404(self, patched_client):
@@ -247,6 +255,339 @@ class TestDeleteJob:
         assert r.status_code == 404
 
 
+class TestParseCache:
+    def test_same_posting_parsed_once(self, patched_client):
+        client, fake_llm, _ = patched_client
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+
+        text = "Senior Backend Engineer at Acme.\n\nWe need Python."
+        assert client.post("/api/jobs", json={"raw_text": text}).status_code == 201
+        # Whitespace-only differences hit the same entry.
+        r = client.post("/api/jobs", json={"raw_text": f"  {text.replace(chr(10), '  ')} "})
+        assert r.status_code == 201, r.text
+        assert r.json()["job"]["parsed"]["company"] == "Acme Corp"
+        assert fake_llm.invoke.call_count == 1
+
+    def test_cache_shared_across_users(self, patched_client):
+        client, fake_llm, _ = patched_client
+        for email in ("a@example.com", "b@example.com"):
+            _signup(client, email)
+            _login(client, email)
+            assert client.post("/api/jobs", json={"raw_text": "Shared posting"}).status_code == 201
+            client.post("/api/auth/logout")
+        assert fake_llm.invoke.call_count == 1
+
+    def test_model_change_misses(self):
+        from app.parsing.jobs import parse_cache_key
+
+        assert parse_cache_key("posting", model="a") != parse_cache_key("posting", model="b")
+        assert parse_cache_key("posting  text", model="a") == parse_cache_key(" posting text\n", model="a")
+
+    def test_expired_entry_reparsed(self, patched_client, monkeypatch):
+        client, fake_llm, _ = patched_client
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+        client.post("/api/jobs", json={"raw_text": "Expiring posting"})
+        monkeypatch.setattr("app.parsing.jobs.job_parse_cache_ttl_days", lambda: -1)
+        client.post("/api/jobs", json={"raw_text": "Expiring posting"})
+        assert fake_llm.invoke.call_count == 2
+
+    def test_evicts_least_recently_used(self, patched_client, monkeypatch):
+        client, fake_llm, _ = patched_client
+        monkeypatch.setattr("app.parsing.jobs.job_parse_cache_max_entries", lambda: 2)
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+        for text in ("Posting one", "Posting two", "Posting one", "Posting three"):
+            client.post("/api/jobs", json={"raw_text": text})
+        assert fake_llm.invoke.call_count == 3
+        # "two" was least recently used when "three" arrived.
+        client.post("/api/jobs", json={"raw_text": "Posting one"})
+        assert fake_llm.invoke.call_count == 3
+        client.post("/api/jobs", json={"raw_text": "Posting two"})
+        assert fake_llm.invoke.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_cache_io_leaves_callers_session_alone(self, db_session, monkeypatch):
+        from app.parsing.jobs import parse_job
+
+        pending = User(email="pending@example.com", password_hash="x")
+        db_session.add(pending)
+        await parse_job(_make_fake_llm(), "Posting", db_session)  # miss, then store
+        await parse_job(_make_fake_llm(), "Posting", db_session)  # hit
+
+        def broken_store(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr("app.parsing.jobs._store_parse", broken_store)
+        await parse_job(_make_fake_llm(), "Another posting", db_session)
+        assert pending in db_session.new  # neither committed nor rolled back
+
+
+_POSTING = """Senior Backend Engineer at Acme Corp
+Location: Remote
+
+Requirements:
+- 5+ years of Python
+"""
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestHeuristicFallback:
+    def test_llm_outage_saves_heuristic_parse_and_schedules_upgrade(self, patched_client, db_session):
+        client, fake_llm, _ = patched_client
+        fake_llm.invoke.side_effect = [LLMError("provider down"), MagicMock(parsed=_CANNED_JOB)]
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+
+        r = client.post("/api/jobs", json={"raw_text": _POSTING})
+        assert r.status_code == 201, r.text
+        job = r.json()["job"]
+        assert job["parsed_by"] == "heuristic"
+        assert job["parsed"]["title"] == "Senior Backend Engineer"
+
+        _wait_for(lambda: app.state.parse_upgrader.stats()["upgraded"] == 1)
+        db_session.expire_all()
+        assert client.get(f"/api/jobs/{job['id']}").json()["parsed_by"] == "llm"
+
+    def test_oversized_text_still_rejected(self, patched_client, monkeypatch):
+        client, fake_llm, _ = patched_client
+        monkeypatch.setattr("app.parsing.jobs._MAX_RAW_TEXT_CHARS", 10)
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+
+        assert client.post("/api/jobs", json={"raw_text": _POSTING}).status_code == 413
+        fake_llm.invoke.assert_not_called()
+
+
+async def _resume(upgrader, db, llm) -> int:
+    return upgrader.resume(db, llm)
+
+
+class TestHeuristicFastPath:
+    @pytest.fixture(autouse=True)
+    def _fast_path_on(self, monkeypatch):
+        monkeypatch.setattr("app.api.jobs.job_heuristics_fast_path", lambda: True)
+
+    def _add(self, client) -> dict:
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+        r = client.post("/api/jobs", json={"raw_text": _POSTING})
+        assert r.status_code == 201, r.text
+        return r.json()["job"]
+
+    def test_returns_heuristic_parse_then_upgrades(self, patched_client, db_session):
+        client, _, _ = patched_client
+        job = self._add(client)
+        assert job["parsed_by"] == "heuristic"
+        assert job["parsed"]["title"] == "Senior Backend Engineer"
+        assert job["parsed"]["must_have"] == ["5+ years of Python"]
+
+        _wait_for(lambda: app.state.parse_upgrader.stats()["upgraded"] == 1)
+        db_session.expire_all()
+        upgraded = client.get(f"/api/jobs/{job['id']}").json()
+        assert upgraded["parsed_by"] == "llm"
+        assert upgraded["parsed"]["team_name"] == "Payments Platform"
+
+    def test_llm_failure_keeps_heuristic_parse(self, patched_client, db_session, monkeypatch):
+        client, fake_llm, _ = patched_client
+        monkeypatch.setattr("app.parsing.upgrade._RETRY_DELAYS_S", (0.0, 0.0))
+        fake_llm.invoke.side_effect = LLMError("provider down")
+        job = self._add(client)
+
+        _wait_for(lambda: app.state.parse_upgrader.stats()["failed"] == 1)
+        assert app.state.parse_upgrader.stats()["retried"] == 2
+        assert fake_llm.invoke.call_count == 3
+        db_session.expire_all()
+        assert client.get(f"/api/jobs/{job['id']}").json()["parsed_by"] == "heuristic"
+
+    def test_llm_failure_retried_with_backoff(self, patched_client, db_session, monkeypatch):
+        client, fake_llm, _ = patched_client
+        monkeypatch.setattr("app.parsing.upgrade._RETRY_DELAYS_S", (0.05,))
+        fake_llm.invoke.side_effect = [LLMError("provider down"), MagicMock(parsed=_CANNED_JOB)]
+        job = self._add(client)
+
+        _wait_for(lambda: app.state.parse_upgrader.stats()["upgraded"] == 1)
+        assert app.state.parse_upgrader.stats()["retried"] == 1
+        db_session.expire_all()
+        assert client.get(f"/api/jobs/{job['id']}").json()["parsed_by"] == "llm"
+
+    def test_resume_requeues_heuristic_jobs(self, patched_client, db_session, monkeypatch):
+        client, fake_llm, _ = patched_client
+        monkeypatch.setattr("app.parsing.upgrade._RETRY_DELAYS_S", ())
+        fake_llm.invoke.side_effect = LLMError("provider down")
+        job = self._add(client)
+        _wait_for(lambda: app.state.parse_upgrader.stats()["failed"] == 1)
+
+        fake_llm.invoke.side_effect = None
+        upgrader = app.state.parse_upgrader
+        assert client.portal.call(_resume, upgrader, db_session, fake_llm) == 1
+        _wait_for(lambda: upgrader.stats()["upgraded"] == 1)
+        db_session.expire_all()
+        assert client.get(f"/api/jobs/{job['id']}").json()["parsed_by"] == "llm"
+
+    def test_user_edit_is_not_overwritten(self, patched_client, db_session):
+        client, fake_llm, _ = patched_client
+
+        async def slow_parse(messages, response_model):
+            await asyncio.sleep(0.2)
+            return MagicMock(parsed=_CANNED_JOB)
+
+        fake_llm.invoke.side_effect = slow_parse
+        job = self._add(client)
+        client.put(f"/api/jobs/{job['id']}", json={**job["parsed"], "title": "Edited"})
+
+        _wait_for(lambda: app.state.parse_upgrader.stats()["skipped"] == 1)
+        db_session.expire_all()
+        body = client.get(f"/api/jobs/{job['id']}").json()
+        assert body["parsed_by"] == "user" and body["parsed"]["title"] == "Edited"
+
+    def test_cached_llm_parse_used_directly(self, patched_client, monkeypatch):
+        client, fake_llm, _ = patched_client
+        monkeypatch.setattr("app.api.jobs.job_heuristics_fast_path", lambda: False)
+        self._add(client)
+        monkeypatch.setattr("app.api.jobs.job_heuristics_fast_path", lambda: True)
+
+        job = client.post("/api/jobs", json={"raw_text": _POSTING}).json()["job"]
+        assert job["parsed_by"] == "llm"
+        assert fake_llm.invoke.call_count == 1
+        assert app.state.parse_upgrader.stats()["scheduled"] == 0
+
+
+def _bulk(client, items: list[dict]) -> list[dict]:
+    r = client.post("/api/jobs/bulk", json={"items": items})
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in r.text.splitlines() if line]
+
+
+@pytest.fixture()
+def bulk_client(patched_client):
+    client, fake_llm, _ = patched_client
+    with patch("app.parsing.bulk.fetch_job_text") as fake_fetch:
+        fake_fetch.side_effect = lambda url: None if "blocked" in url else f"Posting at {url}"
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+        yield client, fake_llm, fake_fetch
+
+
+class TestBulkAddJobs:
+    def test_mixed_items_stream_per_item_results(self, bulk_client, db_session):
+        client, fake_llm, _ = bulk_client
+        lines = _bulk(client, [
+            {"url": "https://boards.example.com/1"},
+            {"url": "https://blocked.example.com/2"},
+            {"raw_text": "Pasted posting text"},
+        ])
+
+        results = {line["index"]: line for line in lines[:-1]}
+        assert results[0]["status"] == "created"
+        assert results[0]["job"]["source_url"] == "https://boards.example.com/1"
+        assert results[1] == {"index": 1, "status": "needs_paste", "url": "https://blocked.example.com/2"}
+        assert results[2]["job"]["raw_text"] == "Pasted posting text"
+        assert lines[-1] == {"done": True, "created": 2, "needs_paste": 1, "error": 0}
+        assert fake_llm.invoke.call_count == 2
+
+        jobs = client.get("/api/jobs").json()
+        assert {j["id"] for j in jobs} == {results[0]["job"]["id"], results[2]["job"]["id"]}
+        assert db_session.query(Application).count() == 2
+
+    def test_llm_failure_falls_back_to_heuristic_parse(self, bulk_client, monkeypatch):
+        client, fake_llm, _ = bulk_client
+        monkeypatch.setattr("app.parsing.upgrade._RETRY_DELAYS_S", ())
+        fake_llm.invoke.side_effect = LLMError("provider down")
+        lines = _bulk(client, [{"raw_text": _POSTING}, {"raw_text": "Second posting"}])
+
+        assert lines[-1] == {"done": True, "created": 2, "needs_paste": 0, "error": 0}
+        jobs = {line["index"]: line["job"] for line in lines[:-1]}
+        assert {job["parsed_by"] for job in jobs.values()} == {"heuristic"}
+        assert jobs[0]["parsed"]["title"] == "Senior Backend Engineer"
+        _wait_for(lambda: app.state.parse_upgrader.stats()["failed"] == 2)
+        assert app.state.parse_upgrader.stats()["scheduled"] == 2
+
+    def test_fast_path_skips_the_llm(self, bulk_client, monkeypatch):
+        client, fake_llm, _ = bulk_client
+        monkeypatch.setattr("app.parsing.bulk.job_heuristics_fast_path", lambda: True)
+        lines = _bulk(client, [{"raw_text": _POSTING}])
+
+        assert lines[0]["job"]["parsed_by"] == "heuristic"
+        _wait_for(lambda: app.state.parse_upgrader.stats()["upgraded"] == 1)
+        assert fake_llm.invoke.call_count == 1  # the upgrade's
+
+    def test_other_parse_errors_reported_per_item(self, bulk_client, monkeypatch):
+        client, fake_llm, _ = bulk_client
+        monkeypatch.setattr("app.parsing.jobs._MAX_RAW_TEXT_CHARS", 20)
+        lines = _bulk(client, [{"raw_text": "Short posting"}, {"raw_text": _POSTING}])
+
+        assert lines[-1] == {"done": True, "created": 1, "needs_paste": 0, "error": 1}
+        error = next(line for line in lines if line.get("status") == "error")
+        assert error["index"] == 1 and "too large" in error["detail"]
+
+    def test_duplicate_texts_share_one_parse(self, bulk_client):
+        client, fake_llm, _ = bulk_client
+        lines = _bulk(client, [{"raw_text": "Same posting"}, {"raw_text": "  Same   posting "}])
+
+        assert lines[-1] == {"done": True, "created": 2, "needs_paste": 0, "error": 0}
+        assert fake_llm.invoke.call_count == 1
+
+    def test_failed_parse_cache_write_does_not_fail_the_batch(self, bulk_client, monkeypatch):
+        client, _, _ = bulk_client
+
+        def broken_store(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr("app.parsing.jobs._store_parse", broken_store)
+        lines = _bulk(client, [{"raw_text": "First posting"}, {"raw_text": "Second posting"}])
+
+        assert lines[-1] == {"done": True, "created": 2, "needs_paste": 0, "error": 0}
+        assert len(client.get("/api/jobs").json()) == 2
+
+    def test_fetches_limited_per_domain(self, bulk_client, monkeypatch):
+        client, _, fake_fetch = bulk_client
+        monkeypatch.setattr("app.parsing.bulk.jobs_bulk_per_domain_concurrency", lambda: 2)
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def slow_fetch(url: str) -> str:
+            host = url.split("/")[2]
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.05)
+            in_flight[host] -= 1
+            return f"Posting at {url}"
+
+        fake_fetch.side_effect = slow_fetch
+        items = [{"url": f"https://www.board.example.com/{i}"} for i in range(6)]
+        items += [{"url": f"https://other.example.com/{i}"} for i in range(2)]
+        lines = _bulk(client, items)
+
+        assert lines[-1]["created"] == 8
+        assert peak["www.board.example.com"] == 2
+        assert peak["other.example.com"] <= 2
+
+    def test_too_many_items_rejected(self, bulk_client, monkeypatch):
+        client, fake_llm, _ = bulk_client
+        monkeypatch.setattr("app.api.jobs.jobs_bulk_max_items", lambda: 2)
+        r = client.post("/api/jobs/bulk", json={"items": [{"raw_text": str(i)} for i in range(3)]})
+        assert r.status_code == 422
+        fake_llm.invoke.assert_not_called()
+
+    def test_empty_and_invalid_items_rejected(self, bulk_client):
+        client, _, _ = bulk_client
+        assert client.post("/api/jobs/bulk", json={"items": []}).status_code == 422
+        assert client.post("/api/jobs/bulk", json={"items": [{}]}).status_code == 422
+
+    def test_unauthenticated_rejected(self, client):
+        r = client.post("/api/jobs/bulk", json={"items": [{"raw_text": "x"}]})
+        assert r.status_code == 401
+
+
 class TestIsolation:
     def test_user_b_list_excludes_user_a_jobs(self, patched_client):
         client, _, _ = patched_client
@@ -296,31 +637,59 @@ class TestIsolation:
         assert r.status_code == 404
 
 
-class TestFetchJobText:
-    """Unit-level tests of fetch_job_text() itself, mocking trafilatura directly."""
-
-    def test_blocked_fetch_returns_none(self):
-        from app.parsing.jobs import fetch_job_text
-
-        with patch("app.parsing.jobs.trafilatura.fetch_url", return_value=None):
-            assert fetch_job_text("https://example.com/job") is None
-
-    def test_empty_extraction_returns_none(self):
-        from app.parsing.jobs import fetch_job_text
+def _mock_http(monkeypatch, handler) -> None:
+    """Route the shared fetch client through ``handler`` (httpx.MockTransport)."""
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), follow_redirects=True, max_redirects=2
+    )
+    monkeypatch.setattr("app.parsing.fetch._client", client)
 
-        with patch("app.parsing.jobs.trafilatura.fetch_url", return_value="<html></html>"), \
-             patch("app.parsing.jobs.trafilatura.extract", return_value=None):
-            assert fetch_job_text("https://example.com/job") is None
 
-    def test_happy_path_returns_text(self):
-        from app.parsing.jobs import fetch_job_text
-
-        with patch("app.parsing.jobs.trafilatura.fetch_url", return_value="<html>...</html>"), \
-             patch("app.parsing.jobs.trafilatura.extract", return_value="Job posting text"):
-            assert fetch_job_text("https://example.com/job") == "Job posting text"
-
-    def test_unexpected_exception_returns_none(self):
-        from app.parsing.jobs import fetch_job_text
-
-        with patch("app.parsing.jobs.trafilatura.fetch_url", side_effect=RuntimeError("boom")):
-            assert fetch_job_text("https://example.com/job") is None
+@pytest.mark.asyncio
+class TestFetchJobText:
+    """Unit-level tests of fetch_job_text() itself, mocking HTTP and trafilatura."""
+
+    async def test_blocked_fetch_returns_none(self, monkeypatch):
+        _mock_http(monkeypatch, lambda request: httpx.Response(403, text="Forbidden"))
+        with patch("app.parsing.jobs.trafilatura.extract") as extract:
+            assert await fetch_job_text("https://example.com/job") is None
+        extract.assert_not_called()
+
+    async def test_empty_extraction_returns_none(self, monkeypatch):
+        _mock_http(monkeypatch, lambda request: httpx.Response(200, html="<html></html>"))
+        with patch("app.parsing.jobs.trafilatura.extract", return_value=None):
+            assert await fetch_job_text("https://example.com/job") is None
+
+    async def test_happy_path_follows_redirects_and_extracts(self, monkeypatch):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/old":
+                return httpx.Response(301, headers={"Location": "https://example.com/job"})
+            return httpx.Response(200, html="<html>Posting</html>")
+
+        _mock_http(monkeypatch, handler)
+        with patch("app.parsing.jobs.trafilatura.extract", return_value="Job posting text") as extract:
+            assert await fetch_job_text("https://example.com/old") == "Job posting text"
+        assert extract.call_args.args[0] == b"<html>Posting</html>"
+
+    async def test_too_many_redirects_returns_none(self, monkeypatch):
+        _mock_http(monkeypatch, lambda request: httpx.Response(302, headers={"Location": "/loop"}))
+        assert await fetch_job_text("https://example.com/loop") is None
+
+    async def test_oversized_body_abandoned(self, monkeypatch):
+        monkeypatch.setattr("app.parsing.fetch.job_fetch_max_bytes", lambda: 1000)
+        _mock_http(monkeypatch, lambda request: httpx.Response(200, content=b"x" * 5000))
+        with patch("app.parsing.jobs.trafilatura.extract") as extract:
+            assert await fetch_job_text("https://example.com/huge") is None
+        extract.assert_not_called()
+
+    async def test_timeout_returns_none(self, monkeypatch):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        _mock_http(monkeypatch, handler)
+        assert await fetch_job_text("https://slow.example.com/job") is None
+
+    async def test_unexpected_exception_returns_none(self, monkeypatch):
+        _mock_http(monkeypatch, lambda request: httpx.Response(200, html="<html></html>"))
+        with patch("app.parsing.jobs.trafilatura.extract", side_effect=RuntimeError("boom")):
+            assert await fetch_job_text("https://example.com/job") is None
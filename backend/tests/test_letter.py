@@ -75,7 +75,7 @@ class TestBuildCoverLetterYaml:
         # Unlike the CV, prose shouldn't get keyword-bolding.
         text = build_cover_letter_yaml(_PROFILE, _tailored(), "engineeringresumes")
         doc = yaml.safe_load(text)
-        assert "settings" not in doc
+        assert "bold_keywords" not in doc["settings"]
 
     def test_invalid_phone_omitted(self):
         profile = {**_PROFILE, "contact": {**_PROFILE["contact"], "phone": "555-1234"}}
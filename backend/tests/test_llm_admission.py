@@ -0,0 +1,149 @@
+"""LLM admission control (app/llm/admission.py)."""
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.llm.admission import AdmissionController, AdmittedLLM
+from app.llm.context import llm_context
+from app.rendercv.speculative import SpeculativeTailor
+
+
+class _SlowLLM:
+    """Records the (user, label) of each call in the order calls start."""
+
+    def __init__(self, delay_s: float = 0.02, usage: dict | None = None):
+        self.delay_s = delay_s
+        self.usage = usage
+        self.started: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def invoke(self, messages, response_model=None):
+        self.started.append(messages[0].text)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay_s)
+        self.in_flight -= 1
+        return SimpleNamespace(parsed=None, usage=self.usage)
+
+
+def _msg(text: str):
+    return [SimpleNamespace(text=text)]
+
+
+async def _call(llm, label: str, user_id: str = "u", priority: str = "interactive"):
+    with llm_context(user_id, priority):
+        await llm.invoke(_msg(label))
+
+
+@pytest.mark.asyncio
+class TestAdmission:
+    async def test_bounds_concurrency(self):
+        inner = _SlowLLM()
+        llm = AdmittedLLM(inner, AdmissionController(max_concurrency=2))
+        await asyncio.gather(*(_call(llm, f"c{i}") for i in range(6)))
+        assert inner.max_in_flight == 2
+        assert llm.admission.stats()["admitted"] == 6
+        assert llm.admission.stats()["in_flight"] == 0
+
+    async def test_higher_priority_admitted_first(self):
+        inner = _SlowLLM()
+        llm = AdmittedLLM(inner, AdmissionController(max_concurrency=1))
+        blocker = asyncio.create_task(_call(llm, "blocker"))
+        await asyncio.sleep(0)
+        waiting = [
+            asyncio.create_task(_call(llm, "background", priority="background")),
+            asyncio.create_task(_call(llm, "parsing", priority="parsing")),
+            asyncio.create_task(_call(llm, "interactive", priority="interactive")),
+        ]
+        await asyncio.gather(blocker, *waiting)
+        assert inner.started == ["blocker", "interactive", "parsing", "background"]
+
+    async def test_users_take_turns_within_a_class(self):
+        inner = _SlowLLM()
+        llm = AdmittedLLM(inner, AdmissionController(max_concurrency=1))
+        blocker = asyncio.create_task(_call(llm, "blocker", user_id="bulk"))
+        await asyncio.sleep(0)
+        bulk = [asyncio.create_task(_call(llm, f"bulk{i}", user_id="bulk", priority="parsing")) for i in range(3)]
+        other = asyncio.create_task(_call(llm, "other", user_id="other", priority="parsing"))
+        await asyncio.gather(blocker, *bulk, other)
+        # "other" arrived last but only waits for one of the bulk user's calls.
+        assert inner.started[:3] == ["blocker", "bulk0", "other"]
+
+    async def test_token_budget_delays_calls(self):
+        inner = _SlowLLM(delay_s=0, usage={"input_tokens": 100, "output_tokens": 20})
+        llm = AdmittedLLM(inner, AdmissionController(max_concurrency=4, tokens_per_minute=120))
+        started = time.monotonic()
+        await _call(llm, "first")  # consumes the whole bucket (120 actual)
+        await _call(llm, "second")  # needs ~1 token: refilled at 2 tokens/s
+        assert time.monotonic() - started >= 0.3
+        assert llm.admission.stats()["queue_wait_ms"]["interactive"]["count"] == 2
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        llm = AdmittedLLM(_SlowLLM(delay_s=0.05), AdmissionController(max_concurrency=1))
+        blocker = asyncio.create_task(_call(llm, "blocker"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_call(llm, "cancelled"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await blocker
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        stats = llm.admission.stats()
+        assert stats["in_flight"] == 0
+        assert stats["queued"]["interactive"] == 0
+
+    async def test_unknown_priority_rejected(self):
+        with pytest.raises(ValueError):
+            with llm_context("u", "urgent"):
+                pass
+
+    async def test_promoted_task_overtakes_lower_classes(self):
+        inner = _SlowLLM()
+        llm = AdmittedLLM(inner, AdmissionController(max_concurrency=1))
+        blocker = asyncio.create_task(_call(llm, "blocker"))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(_call(llm, "queued", priority="background"))
+        parsing = asyncio.create_task(_call(llm, "parsing", priority="parsing"))
+        not_started = asyncio.create_task(_call(llm, "not_started", priority="background"))
+        await asyncio.sleep(0)
+        llm.admission.promote(queued, "interactive")
+        llm.admission.promote(not_started, "interactive")  # before its first call
+        await asyncio.gather(blocker, queued, parsing, not_started)
+        assert inner.started == ["blocker", "queued", "not_started", "parsing"]
+        assert llm.admission.stats()["queue_wait_ms"]["interactive"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_taking_pending_pretailoring_promotes_it():
+    inner = _SlowLLM()
+    inner.invoke = _tailoring_invoke(inner)
+    llm = AdmittedLLM(inner, AdmissionController(max_concurrency=1))
+    speculative = SpeculativeTailor(max_entries=4)
+    job = SimpleNamespace(id="j", user_id="u", parsed={}, updated_at=datetime(2026, 1, 1))
+    profile = SimpleNamespace(version=1, data={})
+
+    blocker = asyncio.create_task(_call(llm, "blocker"))
+    await asyncio.sleep(0)
+    speculative.schedule(llm, job, profile)
+    parsing = asyncio.create_task(_call(llm, "parsing", user_id="other", priority="parsing"))
+    await asyncio.sleep(0)
+
+    assert await speculative.take(job, profile) is not None
+    await asyncio.gather(blocker, parsing)
+    assert inner.started[:2] == ["blocker", "tailor"]
+
+
+def _tailoring_invoke(inner: _SlowLLM):
+    async def invoke(messages, response_model=None):
+        inner.started.append("tailor" if response_model is not None else messages[0].text)
+        await asyncio.sleep(inner.delay_s)
+        return SimpleNamespace(parsed=MagicMock(), usage=None)
+
+    return invoke
@@ -0,0 +1,79 @@
+"""Per-call LLM telemetry (app/llm/telemetry.py)."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from llm_kit.errors import LLMError, ValidationError
+
+from app.config import llm_model
+from app.llm.context import llm_context
+from app.llm.schemas import ContactInfo, ProfileModel
+from app.llm.telemetry import InstrumentedLLM, LLMTelemetry
+from app.parsing.profile import parse_resume
+
+
+def _instrumented(result=None, side_effect=None) -> tuple[InstrumentedLLM, LLMTelemetry]:
+    client = MagicMock()
+    client.invoke = AsyncMock(return_value=result, side_effect=side_effect)
+    telemetry = LLMTelemetry()
+    return InstrumentedLLM(client, telemetry), telemetry
+
+
+@pytest.mark.asyncio
+class TestInstrumentedLLM:
+    async def test_records_latency_and_tokens_per_site_and_model(self):
+        result = SimpleNamespace(
+            parsed=None,
+            model="claude-test",
+            usage={"input_tokens": 120, "cache_read_input_tokens": 30, "output_tokens": 40},
+        )
+        llm, telemetry = _instrumented(result)
+        with llm_context(site="parse_job"):
+            assert await llm.invoke([]) is result
+            await llm.invoke([])
+
+        series = telemetry.summary()["parse_job"]["claude-test"]
+        assert series["calls"] == 2
+        assert series["errors"] == 0
+        assert series["input_tokens_total"] == 300
+        assert series["output_tokens_total"] == 80
+        assert series["latency_ms"]["count"] == 2
+        assert series["input_tokens"]["p50"] == 150
+
+    async def test_result_without_usage_records_latency_only(self):
+        llm, telemetry = _instrumented(SimpleNamespace(parsed=None, model="m", usage=None))
+        await llm.invoke([])
+
+        series = telemetry.summary()["other"]["m"]
+        assert series["latency_ms"]["count"] == 1
+        assert series["input_tokens"]["count"] == 0
+
+    async def test_validation_failures_and_errors_counted_and_reraised(self):
+        llm, telemetry = _instrumented(side_effect=ValidationError("bad json"))
+        with llm_context(site="tailor_profile"), pytest.raises(ValidationError):
+            await llm.invoke([])
+        llm._client.invoke.side_effect = LLMError("timeout")
+        with llm_context(site="tailor_profile"), pytest.raises(LLMError):
+            await llm.invoke([])
+
+        series = telemetry.summary()["tailor_profile"][llm_model()]
+        assert series["calls"] == 2
+        assert series["validation_failures"] == 1
+        assert series["errors"] == 1
+        assert series["latency_ms"]["count"] == 2
+
+    async def test_other_attributes_delegate_to_client(self):
+        llm, _ = _instrumented()
+        llm._client.config = "cfg"
+        assert llm.config == "cfg"
+
+    async def test_resume_halves_recorded_as_separate_sites(self):
+        profile = ProfileModel(contact=ContactInfo(name="Jane Doe"))
+        llm, telemetry = _instrumented(SimpleNamespace(parsed=profile, model="m", usage=None))
+        await parse_resume(llm, "resume text")
+
+        sites = telemetry.summary()
+        assert sites["parse_resume_part1"]["m"]["calls"] == 1
+        assert sites["parse_resume_part2"]["m"]["calls"] == 1
@@ -1,14 +1,19 @@
 """M2 profile acceptance tests — resume upload, editor CRUD, isolation."""
 from __future__ import annotations
 
+import asyncio
 import io
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastapi import HTTPException
 
 from app.llm.deps import get_llm
 from app.llm.schemas import ContactInfo, ProfileModel, SkillItem
 from app.main import app
+from app.parsing.pool import ExtractionPool, ExtractionPoolBusy
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -133,6 +138,53 @@ class TestUploadResume:
         assert data["version"] == 2
 
 
+class TestResumeParseMemo:
+    def test_same_text_reuses_parse(self, patched_client):
+        client, fake_llm = patched_client
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+
+        _upload_tex(client)
+        assert fake_llm.invoke.call_count == 2  # Part1 + Part2
+        data = _upload_tex(client)
+
+        assert fake_llm.invoke.call_count == 2
+        assert data["version"] == 2
+        assert data["data"]["contact"]["name"] == "Jane Doe"
+        # Still goes through the normal snapshot path.
+        versions = client.get("/api/profile/versions").json()
+        assert len(versions) == 1
+
+    def test_different_text_parses_again(self, patched_client):
+        client, fake_llm = patched_client
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+
+        _upload_tex(client)
+        r = client.post(
+            "/api/profile/resume",
+            files={"file": ("resume.tex", io.BytesIO(b"Different resume"), "application/octet-stream")},
+        )
+        assert r.status_code == 201, r.text
+        assert fake_llm.invoke.call_count == 4
+
+    def test_not_shared_across_users(self, patched_client):
+        client, fake_llm = patched_client
+        for email in ("a@example.com", "b@example.com"):
+            _signup(client, email)
+            _login(client, email)
+            _upload_tex(client)
+            client.post("/api/auth/logout")
+        assert fake_llm.invoke.call_count == 4
+
+    def test_prompt_change_invalidates_key(self, monkeypatch):
+        from app.parsing import profile
+
+        before = profile.resume_parse_key("resume text", model="m")
+        monkeypatch.setattr(profile, "_PROMPT_VERSION", "changed")
+        assert profile.resume_parse_key("resume text", model="m") != before
+
+
 class TestUpdateProfile:
     def test_put_edits_persist_and_bump_version(self, patched_client):
         client, _ = patched_client
@@ -198,3 +250,79 @@ class TestTexExtraction:
         assert "Engineer" in result
         assert "Acme" in result
         assert "\\" not in result
+
+
+class TestExtractionPool:
+    @pytest.mark.asyncio
+    async def test_extracts_in_worker_process(self):
+        pool = ExtractionPool(workers=1, max_queue=0)
+        try:
+            assert await pool.extract(b"\\textbf{Jane} Doe", "tex") == "Jane Doe"
+            assert pool.stats()["completed"] == 1
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_extraction_errors_reraised(self):
+        pool = ExtractionPool(workers=1, max_queue=0)
+        try:
+            with pytest.raises(HTTPException) as exc_info:
+                await pool.extract(b"{\\rtf1}", "rtf")
+            assert exc_info.value.status_code == 415
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_beyond_admission_bound(self):
+        pool = ExtractionPool(workers=1, max_queue=0)
+        try:
+            first = asyncio.create_task(pool.extract(b"One", "tex"))
+            await asyncio.sleep(0)  # submitted; the worker is still spawning
+            with pytest.raises(ExtractionPoolBusy):
+                await pool.extract(b"Two", "tex")
+            assert await first == "One"
+            assert pool.stats()["rejected"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_upload_returns_503_when_pool_full(self, patched_client, monkeypatch):
+        client, fake_llm = patched_client
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+        monkeypatch.setattr(
+            app.state.extraction_pool, "extract", AsyncMock(side_effect=ExtractionPoolBusy("full"))
+        )
+
+        r = client.post(
+            "/api/profile/resume",
+            files={"file": ("resume.pdf", io.BytesIO(b"%PDF-1.4"), "application/pdf")},
+        )
+        assert r.status_code == 503
+        assert r.headers["retry-after"] == "5"
+        fake_llm.invoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_worker_crash_is_retryable(self, monkeypatch):
+        pool = ExtractionPool(workers=1, max_queue=0)
+        crashed: Future = Future()
+        crashed.set_exception(BrokenProcessPool("worker died"))
+        monkeypatch.setattr(pool, "_submit", lambda *_: (crashed, MagicMock()))
+        with pytest.raises(HTTPException) as exc_info:
+            await pool.extract(b"%PDF-1.4", "pdf")
+        assert exc_info.value.status_code == 503
+        assert "Retry-After" in exc_info.value.headers
+        assert pool.stats()["failed"] == 1
+
+    def test_tex_upload_extracted_inline(self, patched_client, monkeypatch):
+        client, fake_llm = patched_client
+        _signup(client, "u@example.com")
+        _login(client, "u@example.com")
+        pooled = AsyncMock(side_effect=ExtractionPoolBusy("full"))
+        monkeypatch.setattr(app.state.extraction_pool, "extract", pooled)
+
+        r = client.post(
+            "/api/profile/resume",
+            files={"file": ("resume.tex", io.BytesIO(b"\\textbf{Jane} Doe"), "application/octet-stream")},
+        )
+        assert r.status_code == 201, r.text
+        pooled.assert_not_called()
@@ -0,0 +1,120 @@
+"""Prompt caching — cache-friendly prompt layout (app/llm/prompts.py) and
+token-usage accounting (app/llm/usage.py)."""
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from app.llm import prompts
+from app.llm import usage as usage_module
+from app.llm.usage import PromptCacheStats, TokenUsage, record_usage, token_usage
+from app.rendercv.tailor import tailor_profile
+
+
+class _CacheableMessage(BaseModel):
+    """Stand-in for an llm_kit Message that supports cache breakpoints."""
+
+    role: str
+    text: str
+    cache_control: dict | None = None
+
+    @classmethod
+    def system(cls, text):
+        return cls(role="system", text=text)
+
+    @classmethod
+    def user(cls, text):
+        return cls(role="user", text=text)
+
+
+def _result(usage):
+    return SimpleNamespace(parsed=None, usage=usage)
+
+
+class TestTokenUsage:
+    def test_anthropic_usage(self):
+        usage = token_usage(_result({
+            "input_tokens": 120,
+            "cache_read_input_tokens": 3000,
+            "cache_creation_input_tokens": 0,
+            "output_tokens": 400,
+        }))
+        assert usage == TokenUsage(uncached_input=120, cache_read=3000, cache_write=0, output=400)
+        assert usage.total_input == 3120
+
+    def test_openai_usage(self):
+        usage = token_usage(_result(SimpleNamespace(
+            prompt_tokens=3100,
+            completion_tokens=50,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=3000),
+        )))
+        assert usage == TokenUsage(uncached_input=100, cache_read=3000, output=50)
+
+    def test_missing_usage_is_not_counted(self):
+        assert token_usage(SimpleNamespace(parsed=None)) is None
+        assert token_usage(MagicMock()) is None
+
+    def test_missing_usage_warns_once(self, monkeypatch, caplog):
+        monkeypatch.setattr(usage_module, "_warned_no_usage", False)
+        with caplog.at_level(logging.WARNING, logger="app.llm"):
+            assert record_usage("tailor_profile", SimpleNamespace(parsed=None)) is None
+            assert record_usage("tailor_profile", SimpleNamespace(parsed=None)) is None
+        assert caplog.text.count("carries no usage block") == 1
+
+
+class TestPromptCacheStats:
+    def test_accumulates_per_site(self):
+        stats = PromptCacheStats()
+        stats.record("tailor_profile", TokenUsage(uncached_input=3000, cache_write=3000))
+        stats.record("tailor_profile", TokenUsage(uncached_input=100, cache_read=3000))
+        summary = stats.summary()["tailor_profile"]
+        assert summary["calls"] == 2
+        assert summary["cache_read"] == 3000
+        assert summary["cached_ratio"] == 3000 / 9100
+
+
+class TestLayeredMessages:
+    def test_breakpoints_on_system_and_profile(self, monkeypatch):
+        monkeypatch.setattr(prompts, "Message", _CacheableMessage)
+        monkeypatch.setattr(prompts, "llm_message_format", lambda: "anthropic")
+        messages = prompts.layered_messages("rules", "profile", "job")
+        assert [m.text for m in messages] == ["rules", "profile", "job"]
+        assert [m.cache_control for m in messages] == [{"type": "ephemeral"}] * 2 + [None]
+
+    def test_no_breakpoints_for_other_formats(self, monkeypatch):
+        monkeypatch.setattr(prompts, "Message", _CacheableMessage)
+        monkeypatch.setattr(prompts, "llm_message_format", lambda: "openai")
+        assert all(m.cache_control is None for m in prompts.layered_messages("rules", "profile", "job"))
+
+    @pytest.mark.asyncio
+    async def test_tailoring_call_sends_breakpoints(self, monkeypatch):
+        monkeypatch.setattr(prompts, "Message", _CacheableMessage)
+        monkeypatch.setattr(prompts, "llm_message_format", lambda: "anthropic")
+        llm = MagicMock()
+        llm.invoke = AsyncMock(return_value=_result({"input_tokens": 10, "output_tokens": 5}))
+
+        await tailor_profile(llm, {"contact": {"name": "Jane"}}, {"title": "Engineer"})
+
+        sent = llm.invoke.call_args.args[0]
+        assert [m.cache_control for m in sent] == [{"type": "ephemeral"}] * 2 + [None]
+
+    def test_startup_check_warns_when_message_cannot_carry_breakpoints(self, monkeypatch, caplog):
+        monkeypatch.setattr(prompts, "llm_message_format", lambda: "anthropic")
+        with caplog.at_level(logging.WARNING, logger="app.llm"):
+            assert prompts.check_prompt_caching() is False
+        assert "no cache breakpoints will be sent" in caplog.text
+
+        monkeypatch.setattr(prompts, "Message", _CacheableMessage)
+        assert prompts.check_prompt_caching() is True
+
+    def test_message_without_cache_control_left_as_is(self, monkeypatch):
+        monkeypatch.setattr(prompts, "llm_message_format", lambda: "anthropic")
+        messages = prompts.layered_messages("rules", "profile", "job")
+        assert [m.text for m in messages] == ["rules", "profile", "job"]
+
+    def test_stable_json_ignores_key_order(self):
+        assert prompts.stable_json({"b": 1, "a": [2]}) == prompts.stable_json({"a": [2], "b": 1})
@@ -1,6 +1,10 @@
 """M5 rendercv module — YAML builder, tailoring, and real Typst compilation."""
 from __future__ import annotations
 
+import asyncio
+import os
+import time
+from datetime import date, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,8 +16,13 @@ from app.llm.schemas import (
     TailoredEntry,
     TailoredExperienceEntry,
 )
+from app.rendercv.batch import BatchItem, stream_compile_zip
 from app.rendercv.build import build_rendercv_yaml
-from app.rendercv.compile import CompileError, compile_pdf
+from app.rendercv.cache import CompileCache, artifact_kind, cache_key, pins_current_date
+from app.rendercv.compile import CompileError, compile_pdf, compile_png
+from app.rendercv import pool as pool_module
+from app.rendercv.pool import CompilePool, CompilePoolBusy, _Worker
+from app.rendercv.precompile import Precompiler
 from app.rendercv.tailor import tailor_profile
 
 _PROFILE = {
@@ -302,6 +311,12 @@ class TestBuildRenderCVYaml:
         doc = yaml.safe_load(text)
         assert doc["design"]["theme"] == "sb2nov"
 
+    def test_render_date_pinned(self):
+        text = build_rendercv_yaml(_PROFILE, _tailored(), _JOB, "engineeringresumes")
+        doc = yaml.safe_load(text)
+        assert date.fromisoformat(doc["settings"]["current_date"])
+        assert pins_current_date(text)
+
     def test_publication_and_extras_selected_by_index_verbatim(self):
         text = build_rendercv_yaml(_PROFILE, _tailored(), _JOB, "engineeringresumes")
         doc = yaml.safe_load(text)
@@ -329,6 +344,23 @@ class TestTailorProfile:
         messages = call_args.args[0]
         assert any("Emphasize Go" in m.text for m in messages if hasattr(m, "text"))
 
+    @pytest.mark.asyncio
+    async def test_prompt_prefix_stable_across_jobs(self):
+        fake_response = MagicMock()
+        fake_response.parsed = _tailored()
+        fake_llm = MagicMock()
+        fake_llm.invoke = AsyncMock(return_value=fake_response)
+
+        reordered = dict(reversed(list(_PROFILE.items())))
+        await tailor_profile(fake_llm, _PROFILE, _JOB)
+        await tailor_profile(fake_llm, reordered, {"keywords": ["Rust"]}, instructions="Be brief")
+
+        first, second = (call.args[0] for call in fake_llm.invoke.call_args_list)
+        # Rulebook, then profile: identical prefixes; only the job part differs.
+        assert [m.text for m in first[:2]] == [m.text for m in second[:2]]
+        assert "Master profile" in first[1].text
+        assert "Rust" in second[2].text and "Be brief" in second[2].text
+
 
 class TestCompilePdf:
     def test_valid_yaml_compiles_to_pdf(self):
@@ -347,3 +379,291 @@ class TestCompilePdf:
         with pytest.raises(CompileError) as exc_info:
             compile_pdf(bad_yaml)
         assert exc_info.value.stage == "schema"
+
+    def test_memory_mode_writes_no_files(self, monkeypatch):
+        text = build_rendercv_yaml(_PROFILE, _tailored(), _JOB, "engineeringresumes")
+        compile_pdf(text, mode="memory")  # warm the long-lived compiler first
+
+        def _no_tempdirs(*args, **kwargs):
+            raise AssertionError("memory mode created a temp dir")
+
+        monkeypatch.setattr("app.rendercv.compile.tempfile.TemporaryDirectory", _no_tempdirs)
+        assert compile_pdf(text, mode="memory")[:4] == b"%PDF"
+
+    def test_modes_report_same_error_stages(self):
+        for mode in ("memory", "tempdir"):
+            with pytest.raises(CompileError) as exc_info:
+                compile_pdf("cv:\n  name: [unterminated", mode=mode)
+            assert exc_info.value.stage == "yaml"
+
+    def test_png_returns_first_page_only(self):
+        text = build_rendercv_yaml(_PROFILE, _tailored(), _JOB, "engineeringresumes")
+        png = compile_png(text, ppi=20)
+        assert isinstance(png, bytes)
+        assert png[:8] == b"\x89PNG\r\n\x1a\n"
+
+    def test_tempdir_mode_still_compiles(self):
+        text = build_rendercv_yaml(_PROFILE, _tailored(), _JOB, "engineeringresumes")
+        assert compile_pdf(text, mode="tempdir")[:4] == b"%PDF"
+
+
+class TestCompileCache:
+    def test_key_depends_on_source_and_kind(self):
+        assert cache_key("cv: a") == cache_key("cv: a")
+        assert cache_key("cv: a") != cache_key("cv: b")
+        assert cache_key("cv: a") != cache_key("cv: a", kind="png")
+
+    def test_key_depends_on_render_date_unless_pinned(self, monkeypatch):
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.today() + timedelta(days=1)
+
+        unpinned = "cv:\n  name: A\n"
+        pinned = unpinned + "settings:\n  current_date: '2026-01-31'\n"
+        keys = cache_key(unpinned), cache_key(pinned)
+        monkeypatch.setattr("app.rendercv.cache.date", Tomorrow)
+        assert cache_key(unpinned) != keys[0]
+        assert cache_key(pinned) == keys[1]
+
+    def test_miss_then_memory_hit(self, tmp_path):
+        cache = CompileCache(tmp_path, memory_entries=4, disk_max_bytes=1024)
+        assert cache.get("k1") is None
+        cache.put("k1", b"%PDF-1")
+        assert cache.get("k1") == b"%PDF-1"
+        stats = cache.stats()
+        assert (stats["misses"], stats["memory_hits"], stats["disk_hits"]) == (1, 1, 0)
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        CompileCache(tmp_path, memory_entries=4, disk_max_bytes=1024).put("k1", b"%PDF-1")
+        fresh = CompileCache(tmp_path, memory_entries=4, disk_max_bytes=1024)
+        assert fresh.get("k1") == b"%PDF-1"
+        assert fresh.stats()["disk_hits"] == 1
+
+    def test_memory_tier_is_lru_bounded(self):
+        cache = CompileCache(None, memory_entries=2, disk_max_bytes=0)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", b"3")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+
+    def test_disk_tier_evicts_oldest_over_cap(self, tmp_path):
+        cache = CompileCache(tmp_path, memory_entries=1, disk_max_bytes=10)
+        cache.put("old", b"x" * 6)
+        os.utime(tmp_path / "ol" / "old.bin", (0, 0))  # least recently used on disk
+        cache.put("new", b"y" * 6)
+        stats = cache.stats()
+        assert stats["disk_bytes"] <= 10
+        assert stats["evictions"] == 1
+        assert cache.get("new") == b"y" * 6
+
+    def test_discard_removes_both_tiers(self, tmp_path):
+        cache = CompileCache(tmp_path, memory_entries=4, disk_max_bytes=1024)
+        cache.put("k1", b"%PDF-1")
+        cache.discard("k1")
+        assert cache.get("k1") is None
+        assert cache.stats()["disk_bytes"] == 0
+
+
+class TestCompilePool:
+    def _pool(self, **overrides) -> CompilePool:
+        options = {"workers": 1, "max_queue": 0, "timeout_s": 60.0, "memory_limit_mb": 0}
+        return CompilePool(**{**options, **overrides})
+
+    def test_compiles_in_worker_and_writes_through_cache(self):
+        cache = CompileCache(None, memory_entries=4, disk_max_bytes=0)
+        text = build_rendercv_yaml(_PROFILE, _tailored(), _JOB, "engineeringresumes")
+        with self._pool(cache=cache) as pool:
+            assert pool.compile(text)[:4] == b"%PDF"
+            assert pool.compile(text)[:4] == b"%PDF"  # served from cache, no second compile
+            assert pool.stats()["completed"] == 1
+        assert cache.stats()["memory_hits"] == 1
+
+    def test_compile_error_stage_crosses_process_boundary(self):
+        with self._pool() as pool:
+            with pytest.raises(CompileError) as exc_info:
+                pool.compile("cv:\n  name: [unterminated")
+        assert exc_info.value.stage == "yaml"
+
+    def test_timeout_kills_and_replaces_worker(self):
+        text = build_rendercv_yaml(_PROFILE, _tailored(), _JOB, "engineeringresumes")
+        with self._pool(timeout_s=0.001) as pool:
+            with pytest.raises(CompileError) as exc_info:
+                pool.compile(text)
+            stats = pool.stats()
+        assert "timed out" in exc_info.value.errors[0]
+        assert stats["timeouts"] == 1
+        assert stats["restarts"] == 1
+        assert stats["workers"] == 1
+
+    def test_rejects_beyond_admission_bound(self):
+        with self._pool() as pool:
+            first = pool.submit("cv:\n  name: One\n")
+            with pytest.raises(CompilePoolBusy):
+                pool.submit("cv:\n  name: Two\n")
+            assert first.result()[:4] == b"%PDF"
+            assert pool.stats()["rejected"] == 1
+
+    def test_callers_racing_first_start_wait_for_it(self):
+        with self._pool(max_queue=1) as pool:
+            first = pool.submit("cv:\n  name: One\n")
+            second = pool.submit("cv:\n  name: Two\n")
+            assert first.result()[:4] == b"%PDF"
+            assert second.result()[:4] == b"%PDF"
+
+    def test_failed_start_is_retried(self, monkeypatch):
+        wait_ready = _Worker.wait_ready
+        calls = []
+
+        def flaky_wait_ready(worker):
+            calls.append(worker)
+            if len(calls) == 1:
+                raise RuntimeError("compile worker did not become ready")
+            wait_ready(worker)
+
+        monkeypatch.setattr(_Worker, "wait_ready", flaky_wait_ready)
+        pool = self._pool()
+        try:
+            with pytest.raises(RuntimeError):
+                pool.compile("cv:\n  name: One\n")
+            assert pool.compile("cv:\n  name: One\n")[:4] == b"%PDF"
+            assert pool.stats()["workers"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_failed_respawn_is_retried(self, monkeypatch):
+        real_worker = pool_module._Worker
+        spawns = []
+
+        def flaky_worker(*args):
+            spawns.append(args)
+            if len(spawns) == 1:
+                raise OSError("cannot allocate memory")
+            return real_worker(*args)
+
+        monkeypatch.setattr(pool_module, "_RESPAWN_BACKOFF_S", 0.0)
+        with self._pool() as pool:
+            monkeypatch.setattr(pool_module, "_Worker", flaky_worker)
+            pool._replace(pool._acquire("crashed"))
+            assert pool.stats()["workers"] == 0
+
+            assert pool.compile("cv:\n  name: One\n")[:4] == b"%PDF"
+            stats = pool.stats()
+        assert len(spawns) == 2
+        assert stats["workers"] == 1
+        assert stats["restarts"] == 1
+
+    def test_identical_inflight_requests_share_one_compile(self):
+        with self._pool() as pool:
+            first = pool.submit("cv:\n  name: Same\n")
+            second = pool.submit("cv:\n  name: Same\n")
+            assert second is first
+            first.result()
+            assert pool.stats()["completed"] == 1
+
+    def test_interactive_caller_promotes_inflight_background_compile(self):
+        def stats_when(predicate) -> dict:
+            deadline = time.monotonic() + 10
+            while not predicate(stats := pool.stats()) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return stats
+
+        with self._pool(max_queue=1) as pool:
+            worker = pool._acquire("hold")  # keep the only worker busy
+            background = pool.submit("cv:\n  name: Promoted\n", background=True)
+            assert stats_when(lambda st: st["background_waiting"] == 1)["background_waiting"] == 1
+
+            assert pool.submit("cv:\n  name: Promoted\n") is background
+            stats = stats_when(lambda st: st["background_waiting"] == 0)
+            assert stats["background_waiting"] == 0
+            assert stats["queue_depth"] == 1
+
+            pool._release(worker)
+            assert background.result()[:4] == b"%PDF"
+
+    @pytest.mark.asyncio
+    async def test_interactive_compile_overtakes_queued_batch_item(self):
+        async def until(predicate) -> None:
+            deadline = time.monotonic() + 10
+            while not predicate(pool.stats()):
+                assert time.monotonic() < deadline, "timed out"
+                await asyncio.sleep(0.01)
+
+        with self._pool(max_queue=1) as pool:
+            worker = pool._acquire("hold")  # keep the only worker busy
+            batch = stream_compile_zip(pool, [BatchItem("d1", "batch", "cv:\n  name: Batch\n")])
+            first_entry = asyncio.ensure_future(anext(batch))
+            await until(lambda st: st["background_waiting"] == 1)
+            interactive = pool.submit("cv:\n  name: Interactive\n")
+            await until(lambda st: st["queue_depth"] == 2)
+
+            order: list[str] = []
+            interactive.add_done_callback(lambda _f: order.append("interactive"))
+            pool._release(worker)
+            await first_entry
+            order.append("batch")
+            await batch.aclose()
+        assert order == ["interactive", "batch"]
+
+    def test_png_first_page_cached_separately_from_pdf(self):
+        cache = CompileCache(None, memory_entries=8, disk_max_bytes=0)
+        text = build_rendercv_yaml(_PROFILE, _tailored(), _JOB, "engineeringresumes")
+        with self._pool(cache=cache) as pool:
+            png = pool.compile(text, "png", 20)
+            assert png[:8] == b"\x89PNG\r\n\x1a\n"
+            assert cache.get(cache_key(text, artifact_kind("png", 20))) == png
+            assert cache.get(cache_key(text)) is None
+
+
+class TestPrecompiler:
+    def _wait_for(self, precompiler: Precompiler, source: str, timeout_s: float = 60.0) -> dict:
+        deadline = time.monotonic() + timeout_s
+        while time.monotonic() < deadline:
+            status = precompiler.status(source)
+            if status["state"] in ("ready", "failed"):
+                return status
+            time.sleep(0.05)
+        raise AssertionError(f"precompile did not finish: {status}")
+
+    def test_new_version_compiled_into_cache(self):
+        cache = CompileCache(None, memory_entries=8, disk_max_bytes=0)
+        text = build_rendercv_yaml(_PROFILE, _tailored(), _JOB, "engineeringresumes")
+        pool = CompilePool(workers=1, max_queue=0, timeout_s=60.0, memory_limit_mb=0, cache=cache)
+        precompiler = Precompiler(pool, cache, max_queue=4)
+        precompiler.start()
+        try:
+            assert precompiler.enqueue(text)
+            assert self._wait_for(precompiler, text)["state"] == "ready"
+            assert cache.contains(cache_key(text))
+            assert not precompiler.enqueue(text)  # already cached
+        finally:
+            precompiler.shutdown()
+            pool.shutdown()
+
+    def test_failure_reported_with_stage(self):
+        cache = CompileCache(None, memory_entries=8, disk_max_bytes=0)
+        pool = CompilePool(workers=1, max_queue=0, timeout_s=60.0, memory_limit_mb=0, cache=cache)
+        precompiler = Precompiler(pool, cache, max_queue=4)
+        precompiler.start()
+        try:
+            source = "cv:\n  name: [unterminated"
+            precompiler.enqueue(source)
+            status = self._wait_for(precompiler, source)
+            assert status["state"] == "failed"
+            assert status["stage"] == "yaml"
+        finally:
+            precompiler.shutdown()
+            pool.shutdown()
+
+    def test_duplicate_sources_and_overflow_not_queued(self):
+        cache = CompileCache(None, memory_entries=8, disk_max_bytes=0)
+        pool = CompilePool(workers=1, max_queue=0, timeout_s=60.0, memory_limit_mb=0, cache=cache)
+        precompiler = Precompiler(pool, cache, max_queue=1)  # never started: nothing drains
+        assert precompiler.enqueue("cv:\n  name: One\n")
+        assert not precompiler.enqueue("cv:\n  name: One\n")
+        assert not precompiler.enqueue("cv:\n  name: Two\n")
+        assert precompiler.stats()["deduplicated"] == 1
+        assert precompiler.stats()["dropped"] == 1
+        assert precompiler.status("cv:\n  name: One\n")["state"] == "queued"
@@ -0,0 +1,47 @@
+"""Start-up warm-up (app/warmup.py) and GET /health/ready."""
+from __future__ import annotations
+
+import pytest
+
+from app.warmup import Warmup
+
+
+class TestWarmup:
+    @pytest.mark.asyncio
+    async def test_reports_each_component_state_and_duration(self):
+        def fail():
+            raise RuntimeError("no models")
+
+        warmup = Warmup({"ok": lambda: None, "missing": lambda: False, "broken": fail})
+        assert not warmup.ready
+
+        await warmup.run()
+
+        report = warmup.report()
+        assert report["ready"] is True
+        assert report["total_ms"] is not None
+        components = report["components"]
+        assert components["ok"]["state"] == "done"
+        assert components["missing"]["state"] == "skipped"
+        assert components["broken"]["state"] == "failed"
+        assert components["broken"]["error"] == "no models"
+        assert all(c["duration_ms"] is not None for c in components.values())
+
+    def test_disabled_warmup_is_immediately_ready(self):
+        warmup = Warmup({"ok": lambda: None}, enabled=False)
+        assert warmup.ready
+        assert warmup.report()["components"] == {}
+
+
+class TestHealthReady:
+    def test_ready_when_warmup_disabled(self, client):
+        r = client.get("/health/ready")
+        assert r.status_code == 200
+        assert r.json()["ready"] is True
+        assert r.json()["warmup_enabled"] is False
+
+    def test_not_ready_while_warming(self, client):
+        client.app.state.warmup = Warmup({"slow": lambda: None})
+        r = client.get("/health/ready")
+        assert r.status_code == 503
+        assert r.json()["components"]["slow"]["state"] == "pending"
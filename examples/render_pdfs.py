@@ -3,15 +3,23 @@
 Render all sample CV YAML files to PDF using RenderCV/Typst.
 Run from the backend directory:
     cd backend && uv run python ../examples/render_pdfs.py
+
+Compiles go through the backend's compile worker pool (one warm worker per
+core, capped at the number of files), so the samples render in parallel with
+the same timeout/memory isolation the API uses.
 """
+import os
 import sys
+from concurrent.futures import as_completed
 from pathlib import Path
 
-# Add backend app to path so we can import compile_pdf
+# Add backend app to path so we can import the compile pool
 backend_root = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_root))
 
-from app.rendercv.compile import compile_pdf, CompileError
+from app.config import rendercv_pool_memory_limit_mb, rendercv_pool_timeout_s
+from app.rendercv.compile import CompileError
+from app.rendercv.pool import CompilePool
 
 examples_dir = Path(__file__).parent
 
@@ -25,23 +33,30 @@ def main():
     success_count = 0
     failure_count = 0
 
-    for yaml_path in yaml_files:
-        pdf_path = yaml_path.with_suffix(".pdf")
-        print(f"Rendering {yaml_path.name}...", end=" ", flush=True)
-
-        try:
-            source_text = yaml_path.read_text()
-            pdf_bytes = compile_pdf(source_text)
-            pdf_path.write_bytes(pdf_bytes)
-            print(f"✓ ({len(pdf_bytes)} bytes)")
-            success_count += 1
-        except CompileError as e:
-            print(f"✗ CompileError ({e.stage})")
-            print(f"  {e}")
-            failure_count += 1
-        except Exception as e:
-            print(f"✗ Error: {e}")
-            failure_count += 1
+    pool = CompilePool(
+        workers=min(len(yaml_files), os.cpu_count() or 1),
+        max_queue=len(yaml_files),
+        timeout_s=rendercv_pool_timeout_s(),
+        memory_limit_mb=rendercv_pool_memory_limit_mb(),
+    )
+    print(f"Rendering {len(yaml_files)} file(s) on {pool.workers} worker(s)...", flush=True)
+    with pool:
+        futures = {pool.submit(path.read_text()): path for path in yaml_files}
+        for future in as_completed(futures):
+            yaml_path = futures[future]
+            pdf_path = yaml_path.with_suffix(".pdf")
+            try:
+                pdf_bytes = future.result()
+                pdf_path.write_bytes(pdf_bytes)
+                print(f"{yaml_path.name}: ✓ ({len(pdf_bytes)} bytes)")
+                success_count += 1
+            except CompileError as e:
+                print(f"{yaml_path.name}: ✗ CompileError ({e.stage})")
+                print(f"  {e}")
+                failure_count += 1
+            except Exception as e:
+                print(f"{yaml_path.name}: ✗ Error: {e}")
+                failure_count += 1
 
     print(f"\nRendered {success_count} PDF(s), {failure_count} error(s).")
     return 0 if failure_count == 0 else 1
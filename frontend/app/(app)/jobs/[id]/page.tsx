@@ -318,6 +318,11 @@ export default function JobDetailPage() {
           </h1>
           <p className="text-sm text-muted-foreground mt-0.5">
             Updated {new Date(job.updated_at).toLocaleDateString()}
+            {job.parsed_by === "heuristic" && (
+              <span title="Quick parse without the LLM; the full parse replaces it shortly — reload to see it">
+                {" · "}Provisional parse
+              </span>
+            )}
             {job.source_url && (
               <>
                 {" · "}
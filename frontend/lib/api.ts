@@ -287,6 +287,7 @@ export interface Job {
   source_url: string | null;
   raw_text: string;
   parsed: JobData;
+  parsed_by: "llm" | "heuristic" | "user";
   created_at: string;
   updated_at: string;
 }